@@ -0,0 +1,74 @@
+import asyncio
+import dataclasses
+
+from django.http import HttpRequest
+
+import winter.web
+from winter.web import ExceptionHandler
+from winter.web import ResponseHeader
+from winter.web.output_processor import IOutputProcessor
+from winter.web.output_processor import register_output_processor
+from .api_with_exceptions import WithUnknownArgumentException
+
+
+class AsyncCustomException(Exception):
+    pass
+
+
+class AsyncExceptionHandler(ExceptionHandler):
+    @winter.response_status(400)
+    async def handle(self, exception: AsyncCustomException) -> str:
+        await asyncio.sleep(0)
+        return 'handled asynchronously'
+
+
+class AsyncOutputProcessor(IOutputProcessor):
+    async def process_output(self, output, request: HttpRequest):
+        await asyncio.sleep(0)
+        return {'processed': output}
+
+
+@dataclasses.dataclass
+class AsyncResult:
+    name: str
+
+
+@winter.route('with-async-methods/')
+class APIWithAsyncMethods:
+
+    @winter.route_get('{?name}')
+    async def get(self, name: str = 'stranger') -> AsyncResult:
+        await asyncio.sleep(0)
+        return AsyncResult(name)
+
+    @winter.route_post('')
+    @winter.response_header('x-header', 'header')
+    def post(self, request: HttpRequest, header: ResponseHeader[str]) -> str:
+        header.set('sync method')
+        return request.method
+
+    @winter.route_get('exception/')
+    @winter.raises(AsyncCustomException, AsyncExceptionHandler)
+    async def raise_exception(self) -> str:
+        raise AsyncCustomException()
+
+    @winter.route_get('throttled/')
+    @winter.web.throttling('1/m')
+    async def throttled(self) -> str:
+        return 'not throttled'
+
+    @winter.route_get('exception-with-failing-handler/')
+    @winter.raises(WithUnknownArgumentException)
+    async def raise_exception_with_failing_handler(self) -> str:
+        raise WithUnknownArgumentException()
+
+    @winter.route_get('processed/')
+    async def processed(self) -> str:
+        return 'output'
+
+    @winter.route_get('unencodable/')
+    async def unencodable(self) -> object:
+        return object()
+
+
+register_output_processor(APIWithAsyncMethods.processed, AsyncOutputProcessor())
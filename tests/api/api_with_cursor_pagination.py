@@ -0,0 +1,79 @@
+import dataclasses
+
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.pool import StaticPool
+
+import winter
+from winter.data.pagination import CursorDirection
+from winter.data.pagination import CursorPage
+from winter.data.pagination import CursorPosition
+from winter.data.pagination import SortDirection
+from winter_sqlalchemy import paginate_by_cursor
+
+
+@dataclasses.dataclass(frozen=True)
+class Item:
+    id: int
+    name: str
+
+
+ITEMS = [Item(id=id_, name=name) for id_, name in enumerate(['c', 'a', 'b', 'a', 'c'], start=1)]
+
+metadata = MetaData()
+item_table = Table(
+    'cursor_paginated_items',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('name', String),
+)
+engine = create_engine('sqlite://', poolclass=StaticPool, connect_args={'check_same_thread': False})
+metadata.create_all(engine)
+engine.execute(item_table.insert(), [dataclasses.asdict(item) for item in ITEMS])
+
+
+@winter.route('cursor-paginated/')
+class APIWithCursorPagination:
+
+    @winter.route_get('')
+    @winter.web.pagination.limits(default=2, maximum=10)
+    @winter.web.pagination.order_by(['id', 'name'], default_sort=('id',))
+    def get_items(self, cursor_position: CursorPosition) -> CursorPage[Item]:
+        sort_keys = [
+            (order.field, order.direction == SortDirection.DESC)
+            for order in cursor_position.sort.orders
+        ]
+        items = ITEMS
+        for field, reverse in reversed(sort_keys):
+            items = sorted(items, key=lambda item: getattr(item, field), reverse=reverse)
+
+        cursor = cursor_position.cursor
+        if cursor is not None:
+            index = next(
+                index
+                for index, item in enumerate(items)
+                if tuple(getattr(item, field) for field, _ in sort_keys) == cursor.values
+            )
+            if cursor.direction == CursorDirection.PREVIOUS:
+                items = items[:index][::-1]
+            else:
+                items = items[index + 1:]
+        return CursorPage.from_items(items[:cursor_position.limit + 1], cursor_position)
+
+    @winter.route_get('unlimited/')
+    @winter.web.pagination.order_by(['id'], default_sort=('-id',))
+    def get_unlimited_items(self, cursor_position: CursorPosition) -> CursorPage[Item]:
+        return CursorPage.from_items(sorted(ITEMS, key=lambda item: item.id, reverse=True), cursor_position)
+
+    @winter.route_get('from-database/')
+    @winter.web.pagination.limits(default=2, maximum=10)
+    @winter.web.pagination.order_by(['id', 'name'], default_sort=('id',))
+    def get_items_from_database(self, cursor_position: CursorPosition) -> CursorPage[Item]:
+        statement = paginate_by_cursor(select([item_table.c.id, item_table.c.name]), cursor_position)
+        rows = engine.execute(statement).fetchall()
+        return CursorPage.from_items([Item(id=row.id, name=row.name) for row in rows], cursor_position)
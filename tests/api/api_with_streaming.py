@@ -0,0 +1,94 @@
+import asyncio
+import dataclasses
+from typing import AsyncIterator
+from typing import Iterator
+from typing import List
+
+import winter
+from winter.web import ExceptionHandler
+from winter.web import MediaType
+from winter.web import ServerSentEvent
+
+
+class StreamingException(Exception):
+    pass
+
+
+class StreamingExceptionHandler(ExceptionHandler):
+    @winter.response_status(400)
+    def handle(self, exception: StreamingException) -> str:
+        return 'handled'
+
+
+@dataclasses.dataclass
+class Item:
+    number: int
+
+
+@winter.route('with-streaming/')
+class APIWithStreaming:
+
+    @winter.route_get('items/{?count}')
+    def items(self, count: int) -> Iterator[Item]:
+        for number in range(count):
+            yield Item(number)
+
+    @winter.route_get('exception/')
+    @winter.raises(StreamingException, StreamingExceptionHandler)
+    def exception_before_first_item(self) -> Iterator[Item]:
+        raise StreamingException()
+        yield  # pragma: no cover
+
+    @winter.route_get('ndjson-items/{?count}', produces=(MediaType.APPLICATION_STREAM_JSON,))
+    def ndjson_items(self, count: int) -> Iterator[Item]:
+        for number in range(count):
+            yield Item(number)
+
+    @winter.route_get('ndjson-list/', produces=(MediaType.APPLICATION_STREAM_JSON,))
+    def ndjson_list(self) -> List[Item]:
+        return [Item(1), Item(2)]
+
+    @winter.route_get('events/', produces=(MediaType.TEXT_EVENT_STREAM,))
+    @winter.request_header('Last-Event-ID', to='last_event_id')
+    def events(self, last_event_id: int = 0) -> Iterator[ServerSentEvent]:
+        yield ServerSentEvent(retry=1000)
+        for number in range(last_event_id + 1, 3):
+            yield ServerSentEvent(data=Item(number), event='item', id=str(number))
+        yield ServerSentEvent(data='done\nbye', comment='last')
+
+
+@winter.route('with-async-streaming/')
+class APIWithAsyncStreaming:
+
+    @winter.route_get('items/{?count}')
+    async def items(self, count: int) -> AsyncIterator[Item]:
+        for number in range(count):
+            await asyncio.sleep(0)
+            yield Item(number)
+
+    @winter.route_get('sync-items/{?count}')
+    def sync_items(self, count: int) -> Iterator[Item]:
+        for number in range(count):
+            yield Item(number)
+
+    @winter.route_get('iterator-items/{?count}')
+    async def iterator_items(self, count: int) -> Iterator[Item]:
+        return (Item(number) for number in range(count))
+
+    @winter.route_get('ndjson-items/{?count}', produces=(MediaType.APPLICATION_STREAM_JSON,))
+    async def ndjson_items(self, count: int) -> AsyncIterator[Item]:
+        for number in range(count):
+            await asyncio.sleep(0)
+            yield Item(number)
+
+    @winter.route_get('events/', produces=(MediaType.TEXT_EVENT_STREAM,))
+    async def events(self) -> AsyncIterator[Item]:
+        for number in range(2):
+            await asyncio.sleep(0)
+            yield Item(number)
+
+    @winter.route_get('exception/')
+    @winter.raises(StreamingException, StreamingExceptionHandler)
+    async def exception_before_first_item(self) -> AsyncIterator[Item]:
+        raise StreamingException()
+        yield  # pragma: no cover
@@ -0,0 +1,48 @@
+from typing import Iterator
+
+from injector import inject
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy.orm import mapper
+
+import winter
+from winter.data import CRUDRepository
+from winter_ddd import AggregateRoot
+
+
+class Record(AggregateRoot):
+    def __init__(self, id_: int):
+        super().__init__()
+        self.id = id_
+
+
+metadata = MetaData()
+record_table = Table('records', metadata, Column('id', Integer, primary_key=True))
+mapper(Record, record_table)
+
+
+class RecordRepository(CRUDRepository[Record, int]):
+    pass
+
+
+@winter.route('with-unit-of-work/')
+class APIWithUnitOfWork:
+    @inject
+    def __init__(self, repository: RecordRepository):
+        self._repository = repository
+
+    @winter.route_post('records/{?record_id}')
+    def create_record(self, record_id: int):
+        self._repository.save(Record(record_id))
+
+    @winter.route_post('unencodable-records/{?record_id}')
+    def create_unencodable_record(self, record_id: int) -> object:
+        self._repository.save(Record(record_id))
+        return object()
+
+    @winter.route_get('records/{?batch_size}')
+    def stream_record_ids(self, batch_size: int) -> Iterator[int]:
+        for record in self._repository.stream_all(batch_size=batch_size):
+            yield record.id
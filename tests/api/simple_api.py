@@ -41,6 +41,11 @@ class SimpleAPI:
         items = [Dataclass(1)]
         return Page(10, items, page_position)
 
+    @winter.route_get('page-without-total-count-response/')
+    def page_without_total_count_response(self, page_position: PagePosition) -> Page[int]:
+        items = [1, 2, 3][page_position.offset or 0:]
+        return Page.from_items(items[:page_position.limit + 1], page_position)
+
     @winter.route_get('custom-page-response/')
     def custom_page_response(self, page_position: PagePosition) -> CustomPage:
         return CustomPage(total_count=10, items=[1, 2], position=page_position, extra=456)
@@ -3,11 +3,15 @@ import atexit
 from django.apps import AppConfig
 from testcontainers.redis import RedisContainer
 
+from tests.web.interceptors import AsyncInterceptor
 from tests.web.interceptors import HelloWorldInterceptor
+from tests.web.interceptors import ResultInterceptor
+from tests.web.interceptors import SyncInterceptor
 from winter.web import RedisThrottlingConfiguration
 from winter.web import exception_handlers_registry
 from winter.web import interceptor_registry
 from winter.web.exceptions.handlers import DefaultExceptionHandler
+from winter_sqlalchemy import UnitOfWorkInterceptor
 
 
 class TestAppConfig(AppConfig):
@@ -25,6 +29,10 @@ class TestAppConfig(AppConfig):
         import winter_openapi
 
         interceptor_registry.add_interceptor(HelloWorldInterceptor())
+        interceptor_registry.add_interceptor(ResultInterceptor(), url_patterns=('winter-simple/', 'with_exceptions/'))
+        interceptor_registry.add_interceptor(AsyncInterceptor(), url_patterns=('with-async-methods/',))
+        interceptor_registry.add_interceptor(SyncInterceptor(), url_patterns=('with-async-methods/',))
+        interceptor_registry.add_interceptor(UnitOfWorkInterceptor(), url_patterns=('with-unit-of-work/',))
 
         winter_openapi.setup()
 
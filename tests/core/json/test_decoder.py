@@ -3,6 +3,7 @@ import datetime
 import decimal
 import enum
 import uuid
+from typing import Annotated
 from typing import Any
 from typing import Dict
 from typing import List
@@ -11,13 +12,17 @@ from typing import Sequence
 from typing import Set
 from typing import Tuple
 from typing import Union
+from unittest.mock import patch
 
 import pytest
 from dateutil.tz import tzutc
 
 from winter.core.json import JSONDecodeException
 from winter.core.json import Undefined
+from winter.core.json import decoder
 from winter.core.json import json_decode
+from winter.core.json import json_decoder
+from winter.core.json.decoder import get_decoder
 
 empty = object()
 
@@ -423,6 +428,7 @@ def test_decode_dict(data, type_, expected_instance):
         (None, dict, 'Cannot decode "None" to object'),
         (None, Dict, 'Cannot decode "None" to object'),
         ('invalid object', dict, 'Cannot decode "invalid object" to object'),
+        ([1], Dict[int, int], 'Cannot decode "[1]" to object'),
         ({'data1': 1}, Dict[int, int], 'Cannot decode "data1" to integer'),
         ({1: 'data2'}, Dict[float, float], 'Cannot decode "data2" to float'),
     ),
@@ -497,3 +503,75 @@ class DataclassWithUndefinedByDefault:
 def test_decode_dataclass_with_no_value(data, type_, expected_result):
     instance = json_decode(data, type_)
     assert instance == expected_result
+
+
+@dataclasses.dataclass
+class DataclassWithList:
+    items: List[Contact]
+
+
+def test_decoder_is_compiled_once_per_type_hint():
+    data = {'items': [{'phones': ['123']}]}
+    json_decode(data, DataclassWithList)
+
+    with patch('winter.core.json.decoder._find_decoder', wraps=decoder._find_decoder) as find_decoder:
+        # Act
+        instance = json_decode(data, DataclassWithList)
+
+    assert instance == DataclassWithList(items=[Contact(phones={123})])
+    assert find_decoder.call_count == 0
+    assert get_decoder(DataclassWithList) is get_decoder(DataclassWithList)
+
+
+def test_json_decoder_registered_after_decoding_is_used():
+    class Code(str):
+        pass
+
+    assert json_decode('a', List[Code]) == ['a']
+
+    @json_decoder(Code)
+    def decode_code(value, type_):
+        return type_(value.upper())
+
+    # Act
+    result = json_decode('a', List[Code])
+
+    assert result == ['A']
+
+
+@dataclasses.dataclass
+class TreeNode:
+    name: str
+    children: List['TreeNode'] = dataclasses.field(default_factory=list)
+
+
+def test_decode_recursive_dataclass():
+    data = {'name': 'root', 'children': [{'name': 'child', 'children': [{'name': 'grandchild'}]}]}
+
+    # Act
+    instance = json_decode(data, TreeNode)
+
+    assert instance == TreeNode('root', [TreeNode('child', [TreeNode('grandchild')])])
+
+
+@dataclasses.dataclass
+class DataclassWithUnknownType:
+    value: 'UnknownType'  # noqa: F821
+
+
+def test_decode_dataclass_with_unresolved_forward_reference():
+    # Act
+    with pytest.raises(JSONDecodeException) as exception_info:
+        json_decode({'value': 1}, DataclassWithUnknownType)
+
+    assert exception_info.value.errors == {'value': 'Cannot decode "1" to string'}
+
+
+def test_decode_unhashable_type_hint():
+    type_hint = List[Annotated[int, {'unhashable': True}]]
+
+    # Act
+    with pytest.raises(JSONDecodeException) as exception_info:
+        json_decode([1], type_hint)
+
+    assert exception_info.value.errors == {'non_field_error': 'Invalid type.'}
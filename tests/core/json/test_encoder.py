@@ -4,6 +4,8 @@ import enum
 import json
 import uuid
 from dataclasses import dataclass
+from typing import Dict
+from typing import List
 
 import pytest
 import pytz
@@ -11,6 +13,9 @@ from django.utils.translation import gettext
 from django.utils.translation import gettext_lazy
 
 from winter.core.json import JSONEncoder
+from winter.core.json.encoder import CannotEncode
+from winter.core.json.encoder import dataclass_encoder
+from winter.core.json.encoder import register_encoder
 
 
 class Id(int):
@@ -108,3 +113,87 @@ def test_encoder_with_raises(value, exception_type, exception_messages):
         json.dumps(data, cls=JSONEncoder)
 
     assert exception.value.args[0] in exception_messages
+
+
+@dataclass
+class DataclassWithCollections:
+    items: List[NestedDataclass]
+    mapping: Dict[str, NestedDataclass]
+    status: Enum
+
+
+def test_encode_dataclass_with_nested_collections():
+    value = DataclassWithCollections(
+        items=[NestedDataclass(1), NestedDataclass(2)],
+        mapping={'a': NestedDataclass(3)},
+        status=Enum.TUPLE,
+    )
+
+    # Act
+    result = json.dumps(value, cls=JSONEncoder)
+
+    assert json.loads(result) == {
+        'items': [{'nested_number': 1}, {'nested_number': 2}],
+        'mapping': {'a': {'nested_number': 3}},
+        'status': ['000', 1],
+    }
+
+
+def test_encoder_registered_after_encoding_is_used():
+    class Point:
+        def __init__(self, x: int):
+            self.x = x
+
+    class PointSubclass(Point):
+        pass
+
+    @register_encoder
+    def point_encoder(point: Point):
+        return point.x
+
+    assert json.dumps(PointSubclass(1), cls=JSONEncoder) == '1'
+
+    @register_encoder
+    def point_subclass_encoder(point: PointSubclass):
+        return f'subclass {point.x}'
+
+    # Act
+    result = json.dumps(PointSubclass(1), cls=JSONEncoder)
+
+    assert result == '"subclass 1"'
+
+
+def test_encoder_raising_cannot_encode_falls_back_to_base_class_encoder():
+    class Temperature:
+        def __init__(self, degrees: int):
+            self.degrees = degrees
+
+    class Celsius(Temperature):
+        pass
+
+    @register_encoder
+    def temperature_encoder(temperature: Temperature):
+        return temperature.degrees
+
+    @register_encoder
+    def celsius_encoder(temperature: Celsius):
+        if temperature.degrees < -273:
+            raise CannotEncode
+        return f'{temperature.degrees} °C'
+
+    # Act
+    result = json.dumps([Celsius(20), Celsius(-300)], cls=JSONEncoder)
+
+    assert json.loads(result) == ['20 °C', -300]
+
+
+def test_dataclass_encoder():
+    # Act
+    result = dataclass_encoder(NestedDataclass(1))
+
+    assert result == {'nested_number': 1}
+
+
+def test_dataclass_encoder_with_not_dataclass():
+    with pytest.raises(CannotEncode):
+        dataclass_encoder(object())
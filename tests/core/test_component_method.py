@@ -40,3 +40,18 @@ def test_component_method():
 
     method = ComponentMethod(test)
     assert method is component_method(method)
+
+
+def test_is_async():
+    def sync_func():  # pragma: no cover
+        pass
+
+    async def async_func():  # pragma: no cover
+        pass
+
+    async def async_generator_func():  # pragma: no cover
+        yield
+
+    assert ComponentMethod(sync_func).is_async is False
+    assert ComponentMethod(async_func).is_async is True
+    assert ComponentMethod(async_generator_func).is_async is True
@@ -0,0 +1,86 @@
+import pytest
+
+from winter.data.pagination import Cursor
+from winter.data.pagination import CursorDirection
+from winter.data.pagination import CursorPage
+from winter.data.pagination import CursorPosition
+from winter.data.pagination import InvalidCursorException
+from winter.data.pagination import Sort
+
+
+def test_cursor_encode_decode():
+    cursor = Cursor(Sort.by('name').desc().and_(Sort.by('id')), ('Ann', 10), CursorDirection.PREVIOUS)
+
+    # Act
+    decoded_cursor = Cursor.decode(cursor.encode())
+
+    # Assert
+    assert decoded_cursor == cursor
+
+
+def test_cursor_position_without_limit_if_limit_is_zero():
+    # Act
+    position = CursorPosition(limit=0)
+
+    assert position.limit is None
+
+
+@pytest.mark.parametrize(
+    'encoded_cursor', [
+        '',
+        'abc',
+        '$$$',
+        'eyJzIjoiaWQifQ',
+        'eyJzIjoiaWQiLCJ2IjpbXSwiZCI6Im5leHQifQ',
+    ],
+)
+def test_decode_invalid_cursor(encoded_cursor):
+    with pytest.raises(InvalidCursorException, match='Invalid cursor'):
+        Cursor.decode(encoded_cursor)
+
+
+@pytest.mark.parametrize(
+    'items, cursor, expected_items, expected_next_values, expected_previous_values', [
+        ([{'id': 1}, {'id': 2}, {'id': 3}], None, [{'id': 1}, {'id': 2}], (2,), None),
+        ([{'id': 1}, {'id': 2}], None, [{'id': 1}, {'id': 2}], None, None),
+        ([{'id': 3}, {'id': 4}, {'id': 5}], Cursor(Sort.by('id'), (2,)), [{'id': 3}, {'id': 4}], (4,), (3,)),
+        ([{'id': 3}], Cursor(Sort.by('id'), (2,)), [{'id': 3}], None, (3,)),
+        (
+            [{'id': 4}, {'id': 3}, {'id': 2}],
+            Cursor(Sort.by('id'), (5,), CursorDirection.PREVIOUS),
+            [{'id': 3}, {'id': 4}],
+            (4,),
+            (3,),
+        ),
+        (
+            [{'id': 2}, {'id': 1}],
+            Cursor(Sort.by('id'), (3,), CursorDirection.PREVIOUS),
+            [{'id': 1}, {'id': 2}],
+            (2,),
+            None,
+        ),
+        ([], Cursor(Sort.by('id'), (3,)), [], None, None),
+    ],
+)
+def test_cursor_page_from_items(items, cursor, expected_items, expected_next_values, expected_previous_values):
+    position = CursorPosition(limit=2, cursor=cursor, sort=Sort.by('id'))
+
+    # Act
+    page = CursorPage.from_items(items, position)
+
+    # Assert
+    assert list(page) == expected_items
+    assert page.position == position
+    next_cursor = expected_next_values and Cursor(Sort.by('id'), expected_next_values, CursorDirection.NEXT)
+    previous_cursor = expected_previous_values and Cursor(
+        Sort.by('id'),
+        expected_previous_values,
+        CursorDirection.PREVIOUS,
+    )
+    assert page.next_cursor == next_cursor
+    assert page.previous_cursor == previous_cursor
+
+
+def test_cursor_page_from_items_requires_sort():
+    with pytest.raises(ValueError, match='Cursor pagination requires sort'):
+        CursorPage.from_items([], CursorPosition(limit=2))
@@ -1,3 +1,5 @@
+import pytest
+
 from winter.data.pagination import Page
 from winter.data.pagination import PagePosition
 
@@ -12,3 +14,20 @@ def test_iter_page():
 
     # Assert
     assert page_items == items
+
+
+@pytest.mark.parametrize(
+    'items, limit, expected_items, expected_has_next', [
+        ([1, 2, 3], 2, [1, 2], True),
+        ([1, 2], 2, [1, 2], False),
+        ([1, 2], None, [1, 2], False),
+    ],
+)
+def test_page_from_items(items, limit, expected_items, expected_has_next):
+    page_position = PagePosition(limit=limit)
+
+    # Act
+    page = Page.from_items(items, page_position, 100, is_total_count_estimated=True)
+
+    # Assert
+    assert page == Page(100, expected_items, page_position, has_next=expected_has_next, is_total_count_estimated=True)
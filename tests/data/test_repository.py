@@ -10,3 +10,20 @@ def test_crud_repository_generic_parameters():
 
     assert MyRepository.__entity_cls__ is MyEntity
     assert MyRepository.__primary_key_type__ is int
+
+
+def test_crud_repository_streams_all_entities_found_by_default():
+    class MyEntity:
+        pass
+
+    entities = [MyEntity(), MyEntity()]
+
+    class MyRepository(CRUDRepository[MyEntity, int]):
+        def find_all(self):
+            return entities
+
+    # Act
+    streamed_entities = list(MyRepository().stream_all(batch_size=1))
+
+    # Assert
+    assert streamed_entities == entities
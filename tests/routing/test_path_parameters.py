@@ -2,6 +2,7 @@ import uuid
 
 import pytest
 from django.http import HttpRequest
+from django.urls import ResolverMatch
 from mock import Mock
 
 from tests.api.api_with_path_parameters import APIWithPathParameters
@@ -9,6 +10,7 @@ from tests.api.api_with_path_parameters import OneTwoEnum
 from tests.api.api_with_path_parameters import OneTwoEnumWithInt
 from winter.core import Component
 from winter.web.argument_resolver import ArgumentNotSupported
+from winter.web.exceptions import RequestDataDecodeException
 from winter.web.path_parameters_argument_resolver import PathParametersArgumentResolver
 
 uuid_ = uuid.uuid4()
@@ -37,6 +39,34 @@ def test_resolve_path_parameter(path, arg_name, expected_value):
     assert result == expected_value
 
 
+def test_resolve_path_parameter_from_resolver_match():
+    component = Component.get_by_cls(APIWithPathParameters)
+    argument = component.get_method('test').get_argument('param2')
+    resolver = PathParametersArgumentResolver()
+    request = Mock(spec=HttpRequest)
+    request.path_info = '/not-existing-path/'
+    request.resolver_match = ResolverMatch(Mock(), args=(), kwargs={'param2': '456'})
+
+    # Act
+    result = resolver.resolve_argument(argument, request, {})
+
+    # Assert
+    assert result == 456
+
+
+def test_resolve_path_parameter_with_invalid_value():
+    component = Component.get_by_cls(APIWithPathParameters)
+    argument = component.get_method('test').get_argument('param3')
+    resolver = PathParametersArgumentResolver()
+    request = Mock(spec=HttpRequest)
+    request.resolver_match = ResolverMatch(Mock(), args=(), kwargs={'param3': 'three'})
+
+    with pytest.raises(RequestDataDecodeException) as exception:
+        resolver.resolve_argument(argument, request, {})
+
+    assert exception.value.errors == {'error': 'Value not in allowed values("one", "two"): "three"'}
+
+
 @pytest.mark.parametrize(
     'api_class, method_name, arg_name, expected_value', [
         (APIWithPathParameters, 'test', 'param1', True),
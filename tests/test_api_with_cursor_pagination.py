@@ -0,0 +1,84 @@
+from http import HTTPStatus
+
+import pytest
+
+from winter.data.pagination import Cursor
+from winter.data.pagination import Sort
+
+
+def test_cursor_paginated_api_goes_through_pages(api_client):
+    first_page = api_client.get('/cursor-paginated/?order_by=name,-id&foo=bar').json()
+    second_page = api_client.get(first_page['meta']['next']).json()
+    third_page = api_client.get(second_page['meta']['next']).json()
+    previous_page = api_client.get(third_page['meta']['previous']).json()
+
+    # Assert
+    assert first_page['objects'] == [{'id': 4, 'name': 'a'}, {'id': 2, 'name': 'a'}]
+    assert second_page['objects'] == [{'id': 3, 'name': 'b'}, {'id': 5, 'name': 'c'}]
+    assert third_page['objects'] == [{'id': 1, 'name': 'c'}]
+    assert previous_page == second_page
+    assert first_page['meta']['previous'] is None
+    assert third_page['meta']['next'] is None
+    next_cursor = first_page['meta']['next_cursor']
+    assert first_page['meta'] == {
+        'limit': 2,
+        'next_cursor': next_cursor,
+        'previous_cursor': None,
+        'next': f'/cursor-paginated/?order_by=name,-id&foo=bar&cursor={next_cursor}',
+        'previous': None,
+    }
+    assert Cursor.decode(next_cursor) == Cursor(Sort.by('name').and_(Sort.by('id').desc()), ('a', 2))
+
+
+@pytest.mark.parametrize(
+    ('query_string', 'errors_dict'), (
+        ('cursor=abc', {'error': 'Invalid cursor: "abc"'}),
+        (
+            f'cursor={Cursor(Sort.by("name"), ("a",)).encode()}',
+            {'error': f'Cursor does not match the order: "{Cursor(Sort.by("name"), ("a",)).encode()}"'},
+        ),
+        ('limit=-1', {'error': 'Cannot decode "-1" to PositiveInteger'}),
+    ),
+)
+def test_cursor_paginated_api_with_invalid_query(api_client, query_string, errors_dict):
+    response = api_client.get('/cursor-paginated/?' + query_string)
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['errors'] == errors_dict
+
+
+def test_cursor_paginated_api_fails_if_maximum_limit_is_exceeded(api_client):
+    response = api_client.get('/cursor-paginated/?limit=11')
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['detail'] == 'Maximum limit value is exceeded: 10'
+
+
+def test_cursor_paginated_api_without_limits(api_client):
+    response = api_client.get('/cursor-paginated/unlimited/')
+
+    assert response.status_code == HTTPStatus.OK
+    assert [item['id'] for item in response.json()['objects']] == [5, 4, 3, 2, 1]
+    assert response.json()['meta']['limit'] is None
+
+
+def test_cursor_paginated_api_from_database_goes_through_pages(api_client):
+    first_page = api_client.get('/cursor-paginated/from-database/?order_by=name,-id').json()
+
+    # Act
+    second_page = api_client.get(first_page['meta']['next']).json()
+
+    # Assert
+    assert first_page['objects'] == [{'id': 4, 'name': 'a'}, {'id': 2, 'name': 'a'}]
+    assert second_page['objects'] == [{'id': 3, 'name': 'b'}, {'id': 5, 'name': 'c'}]
+
+
+def test_cursor_paginated_api_from_database_with_wrongly_typed_cursor_value(api_client):
+    cursor = Cursor(Sort.by('id'), ('abc',)).encode()
+
+    # Act
+    response = api_client.get(f'/cursor-paginated/from-database/?cursor={cursor}')
+
+    # Assert
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json()['detail'] == f'Invalid cursor: "{cursor}"'
@@ -80,3 +80,44 @@ def test_resolve_arguments_fails():
     with pytest.raises(ArgumentNotSupported, match=f'Unable to resolve argument {arg_name}: int'):
         # Act
         arguments_resolver.resolve_arguments(method, request=Mock(), response_headers={})
+
+
+def test_bind_looks_up_argument_resolvers_once():
+    def func(a: int, b: str):  # pragma: no cover
+        pass
+
+    method = ComponentMethod(func)
+    arguments_resolver = ArgumentsResolver()
+    resolver = Mock()
+    resolver.is_supported.return_value = True
+    resolver.resolve_argument.return_value = 1
+    arguments_resolver.add_argument_resolver(resolver)
+    bound_arguments_resolver = arguments_resolver.bind(method)
+
+    # Act
+    resolved_arguments = bound_arguments_resolver.resolve_arguments(request=Mock(), response_headers={})
+    bound_arguments_resolver.resolve_arguments(request=Mock(), response_headers={}, context={'b': 'b'})
+
+    # Assert
+    assert resolved_arguments == {'a': 1, 'b': 1}
+    assert resolver.is_supported.call_count == 2
+    assert resolver.resolve_argument.call_count == 3
+
+
+def test_bind_fails_on_resolving_unsupported_argument():
+    def func(a: int, b: int):  # pragma: no cover
+        pass
+
+    method = ComponentMethod(func)
+    arguments_resolver = ArgumentsResolver()
+    bound_arguments_resolver = arguments_resolver.bind(method)
+    resolved_arguments = bound_arguments_resolver.resolve_arguments(
+        request=Mock(),
+        response_headers={},
+        context={'a': 1, 'b': 2},
+    )
+
+    assert resolved_arguments == {'a': 1, 'b': 2}
+    with pytest.raises(ArgumentNotSupported, match='Unable to resolve argument b: int'):
+        # Act
+        bound_arguments_resolver.resolve_arguments(request=Mock(), response_headers={}, context={'a': 1})
@@ -45,6 +45,7 @@ def test_page_response(api_client, limit, offset, expected_previous, expected_ne
             'next': expected_next,
             'previous': expected_previous,
             'total_count': 10,
+            'is_total_count_estimated': False,
         },
     }
 
@@ -65,6 +66,7 @@ def test_custom_page_response(api_client):
             'next': '/winter-simple/custom-page-response/?limit=2&offset=4',
             'previous': '/winter-simple/custom-page-response/?limit=2',
             'total_count': 10,
+            'is_total_count_estimated': False,
             'extra': 456,
         },
     }
@@ -81,6 +83,21 @@ def test_custom_page_response(api_client):
     assert response.json() == expected_body
 
 
+@pytest.mark.parametrize(('offset', 'expected_objects', 'expected_next'), (
+    (0, [1, 2], '/winter-simple/page-without-total-count-response/?limit=2&offset=2'),
+    (1, [2, 3], None),
+))
+def test_page_without_total_count_response(api_client, offset, expected_objects, expected_next):
+    # Act
+    response = api_client.get(f'/winter-simple/page-without-total-count-response/?limit=2&offset={offset}')
+
+    # Assert
+    assert response.status_code == HTTPStatus.OK, response.content
+    assert response.json()['objects'] == expected_objects
+    assert response.json()['meta']['total_count'] is None
+    assert response.json()['meta']['next'] == expected_next
+
+
 def test_return_response(api_client):
     response = api_client.get('/winter-simple/return-response/')
     assert response.status_code == HTTPStatus.OK
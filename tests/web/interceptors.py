@@ -1,4 +1,8 @@
+import asyncio
+from typing import Optional
+
 from django.http import HttpRequest
+from django.http.response import HttpResponseBase
 
 import winter
 from winter.core import ComponentMethod
@@ -19,3 +23,43 @@ class HelloWorldInterceptor(Interceptor):
         method_header.set(method.full_name)
         if 'hello_world' in request.GET:
             hello_world_header.set('Hello, World!')
+
+
+class ResultInterceptor(Interceptor):
+    @winter.response_header('x-result', 'result_header')
+    def post_handle(self, result: object, elapsed_time: float, result_header: ResponseHeader[str]):
+        assert elapsed_time >= 0
+        result_header.set(repr(result))
+
+    def after_completion(self, response: HttpResponseBase, exception: Optional[Exception], elapsed_time: float):
+        assert elapsed_time >= 0
+        response['x-exception'] = type(exception).__name__
+
+
+class AsyncInterceptor(Interceptor):
+    @winter.response_header('x-async-result', 'result_header')
+    async def post_handle(self, result: object, result_header: ResponseHeader[str]):
+        await asyncio.sleep(0)
+        result_header.set(repr(result))
+
+    async def after_completion(self, response: Optional[HttpResponseBase], exception: Optional[Exception]):
+        await asyncio.sleep(0)
+        if response is not None:
+            response['x-async-exception'] = type(exception).__name__
+
+
+class SyncInterceptor(Interceptor):
+    @winter.response_header('x-post-handle-on-event-loop', 'on_event_loop_header')
+    def post_handle(self, on_event_loop_header: ResponseHeader[str]):
+        on_event_loop_header.set(str(_is_on_event_loop()))
+
+    def after_completion(self, response: Optional[HttpResponseBase]):
+        if response is not None:
+            response['x-after-completion-on-event-loop'] = str(_is_on_event_loop())
+
+
+def _is_on_event_loop() -> bool:
+    try:
+        return asyncio.get_running_loop() is not None
+    except RuntimeError:
+        return False
@@ -0,0 +1,85 @@
+import winter
+from winter.core import ComponentMethod
+from winter.web import ExceptionHandler
+from winter.web.exceptions import MethodExceptionsManager
+from winter.web.exceptions import get_handle_method
+from winter.web.exceptions.handlers import ExceptionHandlersRegistry
+
+
+class ParentException(Exception):
+    pass
+
+
+class ChildException(ParentException):
+    pass
+
+
+class ParentHandler(ExceptionHandler):
+    def handle(self, exception: ParentException):  # pragma: no cover
+        pass
+
+
+class ChildHandler(ExceptionHandler):
+    def handle(self, exception: ChildException):  # pragma: no cover
+        pass
+
+
+def test_registry_returns_handler_of_closest_base_class():
+    registry = ExceptionHandlersRegistry()
+    registry.add_handler(ParentException, ParentHandler)
+    registry.add_handler(ChildException, ChildHandler)
+
+    # Act
+    handler = registry.get_handler(ChildException())
+
+    assert isinstance(handler, ChildHandler)
+    assert isinstance(registry.get_handler(ParentException), ParentHandler)
+
+
+def test_registry_handler_added_after_lookup_is_used():
+    registry = ExceptionHandlersRegistry()
+    registry.add_handler(ParentException, ParentHandler)
+    assert isinstance(registry.get_handler(ChildException), ParentHandler)
+
+    # Act
+    registry.add_handler(ChildException, ChildHandler)
+
+    assert isinstance(registry.get_handler(ChildException), ChildHandler)
+
+
+def test_registry_returns_auto_handled_only():
+    registry = ExceptionHandlersRegistry()
+    registry.add_handler(ParentException, ParentHandler, auto_handle=True)
+    registry.add_handler(ChildException, ChildHandler)
+
+    # Act
+    handler = registry.get_handler(ChildException, auto_handled_only=True)
+
+    assert isinstance(handler, ParentHandler)
+    assert registry.get_handler(ValueError, auto_handled_only=True) is registry.get_default_handler()
+
+
+def test_method_exceptions_manager_returns_handler_of_closest_declared_class():
+    @winter.raises(ParentException, ParentHandler)
+    @winter.raises(ChildException, ChildHandler)
+    def method():  # pragma: no cover
+        pass
+
+    manager = MethodExceptionsManager(method)
+
+    # Act
+    handler = manager.get_handler(ChildException())
+
+    assert isinstance(handler, ChildHandler)
+    assert manager.get_handler(ChildException) is handler
+    assert isinstance(manager.get_handler(ParentException), ParentHandler)
+
+
+def test_get_handle_method_creates_component_method_once():
+    handler = ParentHandler()
+
+    # Act
+    handle_method = get_handle_method(handler)
+
+    assert isinstance(handle_method, ComponentMethod)
+    assert get_handle_method(ParentHandler()) is handle_method
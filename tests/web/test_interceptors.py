@@ -1,5 +1,13 @@
+import dataclasses
+
 import pytest
 
+import winter
+from winter.core import annotate
+from winter.web import Interceptor
+from winter.web import InterceptorRegistry
+from winter.web.routing import get_route
+
 
 @pytest.mark.parametrize(
     'hello_world_query, hello_world_header',
@@ -13,3 +21,75 @@ def test_interceptor_headers(api_client, hello_world_query, hello_world_header):
     response = api_client.get(url)
     assert response.headers.get('x-method') == 'SimpleAPI.get'
     assert response.headers.get('x-hello-world') == hello_world_header
+
+
+def test_post_handle_and_after_completion(api_client):
+    # Act
+    response = api_client.get('/winter-simple/?name=John')
+
+    assert response.headers.get('x-result') == "'Hello, John!'"
+    assert response.headers.get('x-exception') == 'NoneType'
+
+
+def test_after_completion_with_exception(api_client):
+    # Act
+    response = api_client.get('/with_exceptions/declared_and_thrown/')
+
+    assert response.status_code == 400
+    assert response.headers.get('x-result') is None
+    assert response.headers.get('x-exception') == 'CustomException'
+
+
+def test_interceptor_is_not_applied_to_not_matching_url(api_client):
+    # Act
+    response = api_client.get('/with-streaming/items/?count=1')
+
+    assert response.headers.get('x-method') == 'APIWithStreaming.items'
+    assert response.headers.get('x-result') is None
+    assert response.headers.get('x-exception') is None
+
+
+@dataclasses.dataclass
+class Audited:
+    pass
+
+
+class AuditInterceptor(Interceptor):
+    def post_handle(self):  # pragma: no cover
+        pass
+
+
+class _AuditedAPI:
+    @winter.route_get('audited/')
+    @annotate(Audited())
+    def audited(self):  # pragma: no cover
+        pass
+
+    @winter.route_get('not-audited/')
+    def not_audited(self):  # pragma: no cover
+        pass
+
+
+def test_interceptor_is_applied_to_annotated_routes_only():
+    registry = InterceptorRegistry()
+    registry.add_interceptor(AuditInterceptor(), annotations=(Audited,))
+
+    # Act
+    audited_interceptors = registry.compile(get_route(_AuditedAPI.audited))
+    not_audited_interceptors = registry.compile(get_route(_AuditedAPI.not_audited))
+
+    assert len(audited_interceptors.post_handle) == 1
+    assert audited_interceptors.pre_handle == audited_interceptors.after_completion == ()
+    assert not_audited_interceptors.post_handle == ()
+
+
+def test_interceptor_registry_iterates_interceptors():
+    registry = InterceptorRegistry()
+    interceptors = [AuditInterceptor(), AuditInterceptor()]
+    registry.add_interceptor(interceptors[0])
+    registry.add_interceptor(interceptors[1], url_patterns=('audited/',))
+
+    # Act
+    result = list(registry)
+
+    assert result == interceptors
@@ -0,0 +1,145 @@
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import sys
+import uuid
+from http import HTTPStatus
+from typing import List
+from unittest.mock import patch
+
+import pytest
+import pytz
+from django.utils.translation import gettext_lazy
+
+from winter.web import OrjsonJSONBackend
+from winter.web import StandardJSONBackend
+from winter.web import create_fastest_json_backend
+from winter.web import set_json_backend
+from winter.web.json_backend import get_json_backend
+
+
+class Status(enum.Enum):
+    ACTIVE = 'active'
+
+
+@dataclasses.dataclass
+class Line:
+    number: int
+    price: decimal.Decimal
+    created_at: datetime.datetime
+
+
+@dataclasses.dataclass
+class Order:
+    id: uuid.UUID
+    status: Status
+    date: datetime.date
+    tags: frozenset
+    lines: List[Line]
+
+
+def create_order(number: int) -> Order:
+    created_at = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=pytz.UTC)
+    return Order(
+        id=uuid.UUID(int=number),
+        status=Status.ACTIVE,
+        date=datetime.date(2024, 1, 2),
+        tags=frozenset(['tag']),
+        lines=[Line(line_number, decimal.Decimal('1.50'), created_at) for line_number in range(3)],
+    )
+
+
+@pytest.fixture
+def orjson_backend():
+    backend = get_json_backend()
+    set_json_backend(OrjsonJSONBackend())
+    yield
+    set_json_backend(backend)
+
+
+@pytest.mark.parametrize('value', (
+    None,
+    {'a': [1, 2.5, 'b', True]},
+    {1: 'int key'},
+    datetime.datetime(2019, 1, 1, 3, tzinfo=pytz.UTC),
+    datetime.date(2019, 1, 1),
+    datetime.time(3, 50, 20),
+    Status.ACTIVE,
+    {1, 2},
+    gettext_lazy('translated_text'),
+    create_order(1),
+))
+def test_backends_produce_equal_output(value):
+    # Act
+    standard_output = StandardJSONBackend().dumps(value)
+    orjson_output = OrjsonJSONBackend().dumps(value)
+
+    assert json.loads(orjson_output) == json.loads(standard_output)
+
+
+def test_backends_produce_equal_output_for_large_payload():
+    orders = [create_order(number) for number in range(500)]
+
+    # Act
+    standard_output = StandardJSONBackend().dumps(orders)
+    orjson_output = OrjsonJSONBackend().dumps(orders)
+
+    assert json.loads(orjson_output) == json.loads(standard_output)
+
+
+def test_backends_load_equal_data():
+    data = b'{"a": [1, 2.5, "b", true, null], "c": {"d": "\\u00e9"}}'
+
+    # Act
+    standard_data = StandardJSONBackend().loads(data)
+    orjson_data = OrjsonJSONBackend().loads(data)
+
+    assert orjson_data == standard_data
+
+
+@pytest.mark.usefixtures('orjson_backend')
+def test_request_and_response_with_orjson_backend(api_client):
+    data = {
+        'id': 1,
+        'name': 'test name',
+        'is_god': True,
+        'status': 'active',
+        'items': [1, 2],
+        'items_alias': [1, 2],
+        'typed_dict': {
+            'field': 'field',
+            'required_field': 1,
+        },
+    }
+
+    # Act
+    response = api_client.post('/with-request-data/', json=data)
+
+    assert response.status_code == HTTPStatus.OK, response.json()
+    assert response.content.startswith(b'{"id":1,')
+    assert response.json()['name'] == 'test name'
+
+
+@pytest.mark.usefixtures('orjson_backend')
+def test_invalid_json_with_orjson_backend(api_client):
+    # Act
+    response = api_client.post('/with-request-data/', content=b'{', headers={'Content-Type': 'application/json'})
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_create_fastest_json_backend():
+    # Act
+    backend = create_fastest_json_backend()
+
+    assert isinstance(backend, OrjsonJSONBackend)
+
+
+def test_create_fastest_json_backend_without_orjson():
+    # Act
+    with patch.dict(sys.modules, {'orjson': None}):
+        backend = create_fastest_json_backend()
+
+    assert isinstance(backend, StandardJSONBackend)
@@ -0,0 +1,97 @@
+from typing import Any
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pytest
+
+from winter.core import ComponentMethod
+from winter.web.output_processor import IOutputProcessor
+from winter.web.output_processor import IOutputProcessorResolver
+from winter.web.output_processor import get_output_processor
+from winter.web.output_processor import register_output_processor
+from winter.web.output_processor import register_output_processor_resolver
+
+
+class OutputProcessor(IOutputProcessor):
+    def process_output(self, output, request):  # pragma: no cover
+        return output
+
+
+class IntResolver(IOutputProcessorResolver):
+    body_types = (int,)
+
+    def __init__(self):
+        self.output_processor = OutputProcessor()
+        self.get_processor = Mock(return_value=self.output_processor)
+
+    def get_processor(self, body: Any) -> IOutputProcessor:  # pragma: no cover
+        pass
+
+
+class PositiveResolver(IOutputProcessorResolver):
+
+    def __init__(self):
+        self.output_processor = OutputProcessor()
+
+    def is_supported(self, body: Any) -> bool:
+        return body > 0
+
+    def get_processor(self, body: Any) -> IOutputProcessor:
+        return self.output_processor
+
+
+def method() -> int:  # pragma: no cover
+    pass
+
+
+@pytest.fixture(autouse=True)
+def resolvers():
+    with patch('winter.web.output_processor._registered_resolvers', []):
+        with patch('winter.web.output_processor._output_processor_plans', {}):
+            yield
+
+
+def test_resolver_declaring_body_types_is_asked_once_per_body_type():
+    resolver = IntResolver()
+    register_output_processor_resolver(resolver)
+    component_method = ComponentMethod(method)
+
+    # Act
+    output_processors = [get_output_processor(component_method, body) for body in (1, 2, 'str')]
+
+    assert output_processors == [resolver.output_processor, resolver.output_processor, None]
+    resolver.get_processor.assert_called_once_with(1)
+
+
+def test_runtime_resolver_is_asked_for_every_body():
+    positive_resolver = PositiveResolver()
+    int_resolver = IntResolver()
+    register_output_processor_resolver(positive_resolver)
+    register_output_processor_resolver(int_resolver)
+    component_method = ComponentMethod(method)
+
+    # Act
+    output_processors = [get_output_processor(component_method, body) for body in (1, -1)]
+
+    assert output_processors == [positive_resolver.output_processor, int_resolver.output_processor]
+
+
+def test_method_output_processor_has_priority():
+    register_output_processor_resolver(IntResolver())
+    output_processor = OutputProcessor()
+    component_method = register_output_processor(method, output_processor)
+
+    # Act
+    result = get_output_processor(component_method, 1)
+
+    assert result is output_processor
+
+
+@pytest.mark.parametrize('body, expected_is_supported', ((1, True), ('str', False)))
+def test_resolver_declaring_body_types_supports_bodies_of_these_types(body, expected_is_supported):
+    resolver = IntResolver()
+
+    # Act
+    is_supported = resolver.is_supported(body)
+
+    assert is_supported is expected_is_supported
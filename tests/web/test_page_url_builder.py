@@ -0,0 +1,67 @@
+import pytest
+from django.test import RequestFactory
+
+from winter.data.pagination import Page
+from winter.data.pagination import PagePosition
+from winter.web.pagination.utils import PageUrlBuilder
+from winter.web.pagination.utils import get_next_page_url
+from winter.web.pagination.utils import get_previous_page_url
+
+
+@pytest.mark.parametrize(('path', 'limit', 'offset', 'expected_previous', 'expected_next'), (
+    ('/items/', 2, 2, '/items/?limit=2', '/items/?limit=2&offset=4'),
+    ('/items/?limit=2&offset=4', 2, 4, '/items/?limit=2&offset=2', '/items/?limit=2&offset=6'),
+    (
+        '/items/?a=1&limit=3&offset=4&b=x%20y',
+        3,
+        4,
+        '/items/?a=1&limit=3&offset=1&b=x%20y',
+        '/items/?a=1&limit=3&offset=7&b=x%20y',
+    ),
+    ('/items/?offset=2&a=1&a=2&limit=2', 2, 2, '/items/?a=1&a=2&limit=2', '/items/?offset=4&a=1&a=2&limit=2'),
+    ('/items/?limit=1&limit=2&offset=2', 2, 2, '/items/?limit=2', '/items/?limit=2&offset=4'),
+    ('/items/?x&&y=', 5, 5, '/items/?x&y=&limit=5', None),
+    ('/items/', None, 2, None, None),
+    ('/items/', 2, None, None, '/items/?limit=2&offset=2'),
+))
+def test_page_url_builder(path, limit, offset, expected_previous, expected_next):
+    request = RequestFactory().get(path)
+    page = Page(total_count=10, items=[], position=PagePosition(limit=limit, offset=offset))
+    page_url_builder = PageUrlBuilder(request)
+
+    # Act
+    previous_page_url = page_url_builder.get_previous_page_url(page)
+    next_page_url = page_url_builder.get_next_page_url(page)
+
+    assert previous_page_url == expected_previous
+    assert next_page_url == expected_next
+
+
+@pytest.mark.parametrize(('total_count', 'has_next', 'expected_next'), (
+    (None, True, '/items/?limit=2&offset=4'),
+    (None, False, None),
+    (None, None, None),
+    (5, True, '/items/?limit=2&offset=4'),
+    (100, False, None),
+))
+def test_page_url_builder_with_has_next(total_count, has_next, expected_next):
+    request = RequestFactory().get('/items/')
+    page = Page(total_count=total_count, items=[], position=PagePosition(limit=2, offset=2), has_next=has_next)
+
+    # Act
+    next_page_url = PageUrlBuilder(request).get_next_page_url(page)
+
+    # Assert
+    assert next_page_url == expected_next
+
+
+def test_get_page_urls():
+    request = RequestFactory().get('/items/?limit=2&offset=4')
+    page = Page(total_count=10, items=[], position=PagePosition(limit=2, offset=4))
+
+    # Act
+    previous_page_url = get_previous_page_url(page, request)
+    next_page_url = get_next_page_url(page, request)
+
+    assert previous_page_url == '/items/?limit=2&offset=2'
+    assert next_page_url == '/items/?limit=2&offset=6'
@@ -1,4 +1,8 @@
+import asyncio
+from typing import List
+
 from winter_ddd import DomainEventDispatcher
+from winter_ddd import domain_event_handler
 from tests.winter_ddd.test_domain_event_dispatcher_fixture.events import DomainEvent1
 from tests.winter_ddd.test_domain_event_dispatcher_fixture.events import DomainEvent2
 
@@ -20,3 +24,29 @@ def test_add_handlers_from_package():
     assert len(Handler2.received_events) == 1
     assert Handler1.received_events[0] is event1
     assert Handler2.received_events[0] is event2
+
+
+class AsyncHandler:
+    received_events = []
+
+    @domain_event_handler
+    async def handle_events(self, events: List[DomainEvent1]):
+        await asyncio.sleep(0)
+        self.received_events.append(events)
+
+
+def test_dispatch_async():
+    from tests.winter_ddd.test_domain_event_dispatcher_fixture.subpackage.handler2 import Handler2
+    dispatcher = DomainEventDispatcher()
+    dispatcher.add_handlers_from_class(AsyncHandler)
+    dispatcher.add_handlers_from_class(Handler2)
+    event1 = DomainEvent1()
+    event2 = DomainEvent2()
+    Handler2.received_events.clear()
+
+    # Act
+    asyncio.run(dispatcher.dispatch_async([event1, event2, event1]))
+
+    # Assert
+    assert AsyncHandler.received_events == [[event1, event1]]
+    assert Handler2.received_events == [event2]
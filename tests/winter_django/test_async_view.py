@@ -0,0 +1,101 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import httpx
+from asgiref.sync import async_to_sync
+from mock import patch
+
+from winter_django import set_sync_executor
+
+
+def test_async_method(api_client):
+    response = api_client.get('/with-async-methods/?name=John')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'name': 'John'}
+    assert response.headers['x-async-result'] == "AsyncResult(name='John')"
+    assert response.headers['x-async-exception'] == 'NoneType'
+
+
+def test_async_view_runs_sync_interceptor_hooks_off_event_loop(api_client):
+    response = api_client.get('/with-async-methods/?name=John')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['x-post-handle-on-event-loop'] == 'False'
+    assert response.headers['x-after-completion-on-event-loop'] == 'False'
+
+
+def test_sync_method_in_async_view(api_client):
+    response = api_client.post('/with-async-methods/')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == 'POST'
+    assert response.headers['x-header'] == 'sync method'
+
+
+def test_sync_method_in_async_view_with_sync_executor(api_client):
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with patch.object(executor, 'submit', wraps=executor.submit) as submit:
+            set_sync_executor(executor)
+            try:
+                response = api_client.post('/with-async-methods/')
+            finally:
+                set_sync_executor(None)
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == 'POST'
+    # The sync method and the sync hooks of HelloWorldInterceptor and SyncInterceptor
+    assert submit.call_count == 4
+
+
+def test_async_exception_handler(api_client):
+    response = api_client.get('/with-async-methods/exception/')
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == 'handled asynchronously'
+
+
+def test_async_method_with_asgi():
+    from django.core.asgi import get_asgi_application
+
+    async def get():
+        async with httpx.AsyncClient(app=get_asgi_application(), base_url='http://testserver') as client:
+            return await client.get('/with-async-methods/')
+
+    # Act
+    response = async_to_sync(get)()
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'name': 'stranger'}
+
+
+def test_throttling_in_async_view(api_client):
+    # Act
+    responses = [api_client.get('/with-async-methods/throttled/') for _ in range(2)]
+
+    assert [response.status_code for response in responses] == [HTTPStatus.OK, HTTPStatus.TOO_MANY_REQUESTS]
+    assert responses[1].headers['x-async-exception'] == 'ThrottleException'
+
+
+def test_async_view_falls_back_to_default_exception_handler(api_client):
+    # Act
+    response = api_client.get('/with-async-methods/exception-with-failing-handler/')
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert response.content == b'Server Error (500)'
+
+
+def test_async_output_processor(api_client):
+    # Act
+    response = api_client.get('/with-async-methods/processed/')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {'processed': 'output'}
+
+
+def test_async_view_completes_interceptors_if_response_fails(api_client):
+    # Act
+    response = api_client.get('/with-async-methods/unencodable/')
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert 'x-async-exception' not in response.headers
@@ -0,0 +1,270 @@
+import asyncio
+import json
+from http import HTTPStatus
+from unittest.mock import patch
+
+import httpx
+import pytest
+from asgiref.sync import async_to_sync
+
+from winter.web import MediaType
+from winter_django.streaming import JSONArrayChunker
+from winter_django import streaming
+from winter_django.streaming import NDJSONChunker
+from winter_django.streaming import ServerSentEventChunker
+from winter_django.streaming import encode_stream
+from winter_django.streaming import encode_stream_async
+from winter_django.streaming import get_stream_media_type
+
+
+@pytest.mark.parametrize('url_prefix', (
+    '/with-streaming/',
+    '/with-async-streaming/',
+    '/with-async-streaming/sync-',
+    '/with-async-streaming/iterator-',
+))
+@pytest.mark.parametrize('count', (0, 1, 3))
+def test_streaming_items(api_client, url_prefix, count):
+    response = api_client.get(f'{url_prefix}items/?count={count}')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'application/json'
+    assert response.json() == [{'number': number} for number in range(count)]
+
+
+@pytest.mark.parametrize('url_prefix', ('/with-streaming/', '/with-async-streaming/'))
+@pytest.mark.parametrize('count', (0, 1, 3))
+def test_streaming_ndjson_items(api_client, url_prefix, count):
+    response = api_client.get(f'{url_prefix}ndjson-items/?count={count}')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'application/stream+json'
+    assert response.content == b''.join(f'{{"number": {number}}}\n'.encode() for number in range(count))
+
+
+def test_streaming_ndjson_list(api_client):
+    response = api_client.get('/with-streaming/ndjson-list/')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'application/stream+json'
+    assert response.content == b'{"number": 1}\n{"number": 2}\n'
+
+
+@pytest.mark.parametrize('url', ('/with-streaming/exception/', '/with-async-streaming/exception/'))
+def test_streaming_exception_before_first_item(api_client, url):
+    response = api_client.get(url)
+
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == 'handled'
+
+
+@pytest.mark.parametrize('items', ([], [1], [{'a': [1, 2]}, 'b', None, 1.5]))
+def test_encode_json_array(items):
+    # Act
+    content = b''.join(encode_stream(iter(items), JSONArrayChunker()))
+
+    assert content == json.dumps(items).encode()
+
+
+def test_encode_ndjson():
+    items = [{'a': [1, 2]}, 'b', None]
+
+    # Act
+    chunks = list(encode_stream(iter(items), NDJSONChunker()))
+
+    assert chunks == [b'{"a": [1, 2]}\n', b'"b"\n', b'null\n']
+
+
+@pytest.mark.parametrize('produces, expected_media_type', (
+    (None, MediaType.APPLICATION_JSON),
+    ((MediaType.APPLICATION_XML,), MediaType.APPLICATION_JSON),
+    ((MediaType.APPLICATION_XML, MediaType.APPLICATION_STREAM_JSON), MediaType.APPLICATION_STREAM_JSON),
+    ((MediaType.APPLICATION_JSON, MediaType.APPLICATION_STREAM_JSON), MediaType.APPLICATION_JSON),
+))
+def test_get_stream_media_type(produces, expected_media_type):
+    # Act
+    media_type = get_stream_media_type(produces)
+
+    assert media_type == expected_media_type
+
+
+def test_json_array_chunker_splits_chunks():
+    chunker = JSONArrayChunker(chunk_size=4)
+
+    # Act
+    chunks = [chunker.add(item) for item in (1, 22, 333)]
+    chunks.append(chunker.close())
+
+    assert chunks == [None, b'[1, 22', b', 333', b']']
+
+
+@pytest.mark.parametrize('url_prefix', (
+    '/with-async-streaming/',
+    '/with-async-streaming/sync-',
+    '/with-async-streaming/iterator-',
+))
+@pytest.mark.parametrize('count', (0, 3))
+def test_async_streaming_items_with_asgi(url_prefix, count):
+    from django.core.asgi import get_asgi_application
+
+    async def get():
+        async with httpx.AsyncClient(app=get_asgi_application(), base_url='http://testserver') as client:
+            return await client.get(f'{url_prefix}items/?count={count}')
+
+    # Act
+    response = async_to_sync(get)()
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == [{'number': number} for number in range(count)]
+
+
+def test_server_sent_events(api_client):
+    response = api_client.get('/with-streaming/events/')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'text/event-stream'
+    assert response.headers['cache-control'] == 'no-cache'
+    assert response.content == (
+        b'retry: 1000\n\n'
+        b'id: 1\nevent: item\ndata: {"number": 1}\n\n'
+        b'id: 2\nevent: item\ndata: {"number": 2}\n\n'
+        b': last\ndata: done\ndata: bye\n\n'
+    )
+
+
+def test_server_sent_events_resumed_from_last_event_id(api_client):
+    response = api_client.get('/with-streaming/events/', headers={'Last-Event-ID': '1'})
+
+    assert response.status_code == HTTPStatus.OK
+    assert b'id: 1\n' not in response.content
+    assert b'id: 2\nevent: item\ndata: {"number": 2}\n\n' in response.content
+
+
+def test_async_server_sent_events(api_client):
+    response = api_client.get('/with-async-streaming/events/')
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers['content-type'] == 'text/event-stream'
+    assert response.content == b'data: {"number": 0}\n\ndata: {"number": 1}\n\n'
+
+
+def test_server_sent_events_heartbeat():
+    async def items():
+        await asyncio.sleep(0.05)
+        yield 'item'
+
+    async def collect():
+        return [chunk async for chunk in encode_stream_async(items(), ServerSentEventChunker())]
+
+    # Act
+    with patch.object(streaming, '_heartbeat_interval', 0.01):
+        chunks = async_to_sync(collect)()
+
+    assert chunks[0] == b': heartbeat\n\n'
+    assert chunks[-1] == b'data: item\n\n'
+
+
+def test_set_heartbeat_interval_disables_heartbeats():
+    async def items():
+        await asyncio.sleep(0.02)
+        yield 'item'
+
+    async def collect():
+        return [chunk async for chunk in encode_stream_async(items(), ServerSentEventChunker())]
+
+    streaming.set_heartbeat_interval(None)
+    try:
+        # Act
+        chunks = async_to_sync(collect)()
+    finally:
+        streaming.set_heartbeat_interval(15.0)
+
+    assert chunks == [b'data: item\n\n']
+
+
+def test_encode_stream_closes_items_when_client_disconnects():
+    closed = []
+
+    def items():
+        try:
+            while True:
+                yield 'item'
+        finally:
+            closed.append(True)
+
+    stream = encode_stream(items(), ServerSentEventChunker())
+    next(stream)
+
+    # Act
+    stream.close()
+
+    assert closed == [True]
+
+
+def test_encode_stream_async_closes_items_when_stream_is_closed():
+    closed = []
+
+    async def items():
+        try:
+            while True:
+                await asyncio.sleep(0)
+                yield 'item'
+        finally:
+            closed.append(True)
+
+    async def read_first_chunk_and_close():
+        stream = encode_stream_async(items(), ServerSentEventChunker())
+        await anext(stream)
+        await stream.aclose()
+
+    # Act
+    async_to_sync(read_first_chunk_and_close)()
+
+    assert closed == [True]
+
+
+def test_encode_stream_async_cancels_waiting_for_item_when_stream_is_closed():
+    closed = []
+
+    async def items():
+        try:
+            await asyncio.sleep(10)
+            yield 'item'  # pragma: no cover
+        finally:
+            closed.append(True)
+
+    async def read_heartbeat_and_close():
+        stream = encode_stream_async(items(), ServerSentEventChunker())
+        heartbeat = await anext(stream)
+        await stream.aclose()
+        return heartbeat
+
+    # Act
+    with patch.object(streaming, '_heartbeat_interval', 0.01):
+        heartbeat = async_to_sync(read_heartbeat_and_close)()
+
+    assert heartbeat == b': heartbeat\n\n'
+    assert closed == [True]
+
+
+def test_encode_stream_async_of_async_iterator_without_aclose():
+    class Countdown:
+        def __init__(self, count: int):
+            self._count = count
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            if not self._count:
+                raise StopAsyncIteration
+            self._count -= 1
+            return self._count
+
+    async def collect():
+        return [chunk async for chunk in encode_stream_async(Countdown(2), NDJSONChunker())]
+
+    # Act
+    chunks = async_to_sync(collect)()
+
+    assert chunks == [b'1\n', b'0\n']
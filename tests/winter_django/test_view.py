@@ -1,6 +1,15 @@
 from http import HTTPStatus
 from uuid import uuid4
 
+from django.test import RequestFactory
+from mock import patch
+
+from tests.api.simple_api import SimpleAPI
+from winter.core import Component
+from winter.web.routing import get_route
+
+from winter_django import view
+
 
 def test_create_django_urls_from_routes(api_client):
     url = f"/notes/?note_id={uuid4()}"
@@ -12,3 +21,16 @@ def test_create_django_urls_from_routes(api_client):
     assert get_http_response.status_code == HTTPStatus.OK
     assert post_http_response.status_code == HTTPStatus.OK
     assert patch_http_response.status_code == HTTPStatus.OK
+
+
+def test_dispatch_plan_is_compiled_once_per_route(wsgi):
+    route = get_route(Component.get_by_cls(SimpleAPI).get_method('hello'))
+    request = RequestFactory().get('/winter-simple/?name=John')
+
+    with patch.object(view, 'compile_dispatch_plan', wraps=view.compile_dispatch_plan) as compile_dispatch_plan:
+        dispatch = view._create_dispatch_function(route)
+        # Act
+        responses = [dispatch(None, request) for _ in range(3)]
+
+    assert compile_dispatch_plan.call_count == 1
+    assert [response.content for response in responses] == [b'"Hello, John!"'] * 3
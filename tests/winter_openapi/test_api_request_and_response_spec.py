@@ -7,7 +7,9 @@ from enum import Enum
 from enum import IntEnum
 from enum import auto
 from typing import Any
+from typing import AsyncIterator
 from typing import Generic
+from typing import Iterator
 from typing import List
 from typing import NewType
 from typing import Optional
@@ -265,6 +267,16 @@ class RequestBodyWithUndefined:
         {'schema': {'items': {'format': 'int32', 'type': 'integer'}, 'type': 'array'}},
         {'parameters': {}, 'responses': {}, 'schemas': {}},
     ),
+    (
+        Iterator[int],
+        {'schema': {'items': {'format': 'int32', 'type': 'integer'}, 'type': 'array'}},
+        {'parameters': {}, 'responses': {}, 'schemas': {}},
+    ),
+    (
+        AsyncIterator[int],
+        {'schema': {'items': {'format': 'int32', 'type': 'integer'}, 'type': 'array'}},
+        {'parameters': {}, 'responses': {}, 'schemas': {}},
+    ),
     (
         Dataclass,
         {
@@ -351,9 +363,10 @@ class RequestBodyWithUndefined:
                         'offset': {'format': 'int32', 'nullable': True, 'type': 'integer'},
                         'next': {'nullable': True, 'type': 'string'},
                         'previous': {'nullable': True, 'type': 'string'},
-                        'total_count': {'format': 'int32', 'type': 'integer'},
+                        'is_total_count_estimated': {'type': 'boolean'},
+                        'total_count': {'format': 'int32', 'nullable': True, 'type': 'integer'},
                     },
-                    'required': ['total_count', 'limit', 'offset', 'previous', 'next'],
+                    'required': ['total_count', 'is_total_count_estimated', 'limit', 'offset', 'previous', 'next'],
                     'title': 'PageMetaOfNestedDataclass',
                     'type': 'object',
                 },
@@ -401,8 +414,17 @@ class RequestBodyWithUndefined:
                         'offset': {'format': 'int32', 'nullable': True, 'type': 'integer'},
                         'next': {'nullable': True, 'type': 'string'},
                         'previous': {'nullable': True, 'type': 'string'},
-                        'total_count': {'format': 'int32', 'type': 'integer'}},
-                    'required': ['total_count', 'limit', 'offset', 'previous', 'next', 'extra'],
+                        'is_total_count_estimated': {'type': 'boolean'},
+                        'total_count': {'format': 'int32', 'nullable': True, 'type': 'integer'}},
+                    'required': [
+                        'total_count',
+                        'is_total_count_estimated',
+                        'limit',
+                        'offset',
+                        'previous',
+                        'next',
+                        'extra',
+                    ],
                     'title': 'PageMetaOfInteger',
                     'type': 'object',
                 },
@@ -1011,9 +1033,10 @@ def test_reuse_page_schema():
                         'next': {'nullable': True, 'type': 'string'},
                         'offset': {'format': 'int32', 'nullable': True, 'type': 'integer'},
                         'previous': {'nullable': True, 'type': 'string'},
-                        'total_count': {'format': 'int32', 'type': 'integer'},
+                        'is_total_count_estimated': {'type': 'boolean'},
+                        'total_count': {'format': 'int32', 'nullable': True, 'type': 'integer'},
                     },
-                    'required': ['total_count', 'limit', 'offset', 'previous', 'next'],
+                    'required': ['total_count', 'is_total_count_estimated', 'limit', 'offset', 'previous', 'next'],
                     'title': 'PageMetaOfString',
                     'type': 'object'},
                 'PageOfString': {
@@ -1,6 +1,15 @@
 from dataclasses import dataclass
+from typing import AsyncIterator
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Union
+
+import pytest
 
 import winter
+from winter.data.pagination import Page
 from winter.web import MediaType
 from winter.web.routing import get_route
 from winter_openapi import generate_openapi
@@ -37,6 +46,102 @@ def test_generate_spec_for_media_type_produces():
     }
 
 
+def test_generate_spec_for_stream_json_produces_item_schema():
+    class _TestAPI:
+        @winter.route_get('numbers/', produces=(MediaType.APPLICATION_JSON, MediaType.APPLICATION_STREAM_JSON))
+        def get_numbers(self) -> Iterator[int]:  # pragma: no cover
+            yield 1
+
+    route = get_route(_TestAPI.get_numbers)
+
+    # Act
+    result = generate_openapi(title='title', version='1.0.0', routes=[route])
+
+    # Assert
+    responses = result['paths']['/numbers/']['get']['responses']
+    assert responses == {
+        '200': {
+            'content': {
+                'application/json': {'schema': {'items': {'format': 'int32', 'type': 'integer'}, 'type': 'array'}},
+                'application/stream+json': {'schema': {'format': 'int32', 'type': 'integer'}},
+            },
+            'description': '',
+        },
+    }
+
+
+def test_generate_spec_for_async_stream_json_produces_item_schema():
+    class _TestAPI:
+        @winter.route_get('numbers/', produces=(MediaType.APPLICATION_STREAM_JSON, MediaType.TEXT_EVENT_STREAM))
+        async def get_numbers(self) -> AsyncIterator[int]:  # pragma: no cover
+            yield 1
+
+    route = get_route(_TestAPI.get_numbers)
+
+    # Act
+    result = generate_openapi(title='title', version='1.0.0', routes=[route])
+
+    # Assert
+    responses = result['paths']['/numbers/']['get']['responses']
+    assert responses == {
+        '200': {
+            'content': {
+                'application/stream+json': {'schema': {'format': 'int32', 'type': 'integer'}},
+                'text/event-stream': {'schema': {'format': 'int32', 'type': 'integer'}},
+            },
+            'description': '',
+        },
+    }
+
+
+def test_generate_spec_for_stream_json_of_not_iterable_produces_whole_schema():
+    class _TestAPI:
+        @winter.route_get('number/', produces=(MediaType.APPLICATION_STREAM_JSON,))
+        def get_number(self) -> int:  # pragma: no cover
+            return 1
+
+    route = get_route(_TestAPI.get_number)
+
+    # Act
+    result = generate_openapi(title='title', version='1.0.0', routes=[route])
+
+    # Assert
+    responses = result['paths']['/number/']['get']['responses']
+    assert responses == {
+        '200': {
+            'content': {
+                'application/stream+json': {'schema': {'format': 'int32', 'type': 'integer'}},
+            },
+            'description': '',
+        },
+    }
+
+
+@pytest.mark.parametrize(('return_type', 'is_streamed_by_item'), (
+    (Optional[List[int]], True),
+    (Dict[str, int], False),
+    (Page[int], False),
+    (Optional[Union[List[int], str]], False),
+))
+def test_generate_spec_for_stream_json_describes_items_of_streamed_types_only(return_type, is_streamed_by_item):
+    class _TestAPI:
+        @winter.route_get('numbers/', produces=(MediaType.APPLICATION_JSON, MediaType.APPLICATION_STREAM_JSON))
+        def get_numbers(self) -> return_type:  # pragma: no cover
+            pass
+
+    route = get_route(_TestAPI.get_numbers)
+
+    # Act
+    result = generate_openapi(title='title', version='1.0.0', routes=[route])
+
+    # Assert
+    content = result['paths']['/numbers/']['get']['responses']['200']['content']
+    if is_streamed_by_item:
+        assert content['application/stream+json']['schema'] == {'format': 'int32', 'type': 'integer'}
+    else:
+        assert content['application/stream+json']['schema'] == content['application/json']['schema']
+
+
 def test_generate_spec_for_media_type_consumes():
     @dataclass
     class Data:
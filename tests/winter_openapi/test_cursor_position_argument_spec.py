@@ -0,0 +1,127 @@
+from dataclasses import dataclass
+
+import winter
+from winter.data.pagination import CursorPage
+from winter.data.pagination import CursorPosition
+from winter.web.routing import get_route
+from winter_openapi import generate_openapi
+
+
+@dataclass
+class Item:
+    id: int
+
+
+def test_generate_cursor_position_argument_spec():
+    class _TestAPI:
+        @winter.route_get("cursor_pageable_resource")
+        @winter.web.pagination.order_by(['id'], default_sort=('-id',))
+        def method(self, arg1: CursorPosition):  # pragma: no cover
+            pass
+
+    route = get_route(_TestAPI.method)
+
+    # Act
+    result = generate_openapi(title="title", version="1.0.0", routes=[route])
+
+    # Assert
+    parameters = result["paths"]["/cursor_pageable_resource"]["get"]["parameters"]
+    assert parameters == [
+        {
+            "allowEmptyValue": False,
+            "allowReserved": False,
+            "deprecated": False,
+            "description": "Number of results to return per page",
+            "in": "query",
+            "name": "limit",
+            "required": False,
+            "schema": {"type": "integer"},
+        },
+        {
+            "allowEmptyValue": False,
+            "allowReserved": False,
+            "deprecated": False,
+            "description": "Opaque cursor of the page taken from the next_cursor or previous_cursor of another page",
+            "in": "query",
+            "name": "cursor",
+            "required": False,
+            "schema": {"type": "string"},
+        },
+        {
+            "allowEmptyValue": False,
+            "allowReserved": False,
+            "deprecated": False,
+            "description": "Comma separated order by fields.",
+            "explode": False,
+            "in": "query",
+            "name": "order_by",
+            "required": False,
+            "schema": {
+                "default": ["-id"],
+                "items": {"enum": ["id", "-id"], "type": "string"},
+                "type": "array",
+            },
+            "style": "form",
+        },
+    ]
+
+
+def test_generate_cursor_page_response_spec():
+    class _TestAPI:
+        @winter.route_get("cursor_pageable_resource")
+        def method(self, arg1: CursorPosition) -> CursorPage[Item]:  # pragma: no cover
+            pass
+
+    route = get_route(_TestAPI.method)
+
+    # Act
+    result = generate_openapi(title="title", version="1.0.0", routes=[route])
+
+    # Assert
+    response = result["paths"]["/cursor_pageable_resource"]["get"]["responses"]["200"]
+    assert response["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/CursorPageOfItem"}
+    schemas = result["components"]["schemas"]
+    assert schemas["CursorPageOfItem"] == {
+        "properties": {
+            "meta": {"$ref": "#/components/schemas/CursorPageMetaOfItem"},
+            "objects": {"items": {"$ref": "#/components/schemas/Item"}, "type": "array"},
+        },
+        "required": ["meta", "objects"],
+        "title": "CursorPageOfItem",
+        "type": "object",
+    }
+    assert schemas["CursorPageMetaOfItem"] == {
+        "properties": {
+            "limit": {"format": "int32", "nullable": True, "type": "integer"},
+            "next_cursor": {"nullable": True, "type": "string"},
+            "previous_cursor": {"nullable": True, "type": "string"},
+            "next": {"nullable": True, "type": "string"},
+            "previous": {"nullable": True, "type": "string"},
+        },
+        "required": ["limit", "next_cursor", "previous_cursor", "next", "previous"],
+        "title": "CursorPageMetaOfItem",
+        "type": "object",
+    }
+
+
+def test_reuse_cursor_page_schema():
+    class _TestAPI:
+        @winter.route_get("method_1/")
+        def method_1(self, arg1: CursorPosition) -> CursorPage[Item]:  # pragma: no cover
+            pass
+
+        @winter.route_get("method_2/")
+        def method_2(self, arg1: CursorPosition) -> CursorPage[Item]:  # pragma: no cover
+            pass
+
+    routes = [get_route(_TestAPI.method_1), get_route(_TestAPI.method_2)]
+
+    # Act
+    result = generate_openapi(title="title", version="1.0.0", routes=routes)
+
+    # Assert
+    schemas = [
+        result["paths"][path]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        for path in ("/method_1/", "/method_2/")
+    ]
+    assert schemas == [{"$ref": "#/components/schemas/CursorPageOfItem"}] * 2
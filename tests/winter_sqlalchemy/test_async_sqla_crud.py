@@ -0,0 +1,228 @@
+import asyncio
+from abc import abstractmethod
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from injector import inject
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import relationship
+from sqlalchemy.pool import NullPool
+
+from winter.core import get_injector
+from winter.data import CRUDRepository
+from winter.data.exceptions import NotFoundException
+from winter_ddd import AggregateRoot
+from winter_ddd import DomainEvent
+from winter_ddd import DomainEventDispatcher
+from winter_ddd import domain_event_handler
+from winter_sqlalchemy import async_sqla_crud
+
+
+@dataclass
+class OrderPlacedDomainEvent(DomainEvent):
+    order: 'Order'
+
+
+class Order(AggregateRoot):
+    def __init__(self, id_: int, status: str):
+        super().__init__()
+        self.id = id_
+        self.status = status
+
+    @classmethod
+    def place(cls, id_: int) -> 'Order':
+        order = cls(id_, 'placed')
+        order.domain_events.register(OrderPlacedDomainEvent(order))
+        return order
+
+
+class BasketItem:
+    def __init__(self, id_: int):
+        self.id = id_
+
+
+class Basket(AggregateRoot):
+    def __init__(self, id_: int, items: List[BasketItem]):
+        super().__init__()
+        self.id = id_
+        self.items = items
+
+
+metadata = MetaData()
+order_table = Table(
+    'orders',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('status', String),
+)
+basket_table = Table(
+    'baskets',
+    metadata,
+    Column('id', Integer, primary_key=True),
+)
+basket_item_table = Table(
+    'basket_items',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('basket_id', Integer, ForeignKey('baskets.id')),
+)
+mapper(Order, order_table)
+mapper(BasketItem, basket_item_table)
+mapper(
+    Basket,
+    basket_table,
+    properties={'items': relationship(BasketItem, cascade='all, delete-orphan', lazy='selectin')},
+)
+
+
+class OrderRepository(CRUDRepository[Order, int]):
+    @abstractmethod
+    async def get_statuses(self) -> List[str]:
+        pass
+
+
+class OrderRepositoryImpl(OrderRepository):
+    @inject
+    def __init__(self, engine: AsyncEngine):
+        self._engine = engine
+
+    async def get_statuses(self) -> List[str]:
+        async with self._engine.connect() as connection:
+            result = await connection.execute(select(order_table.c.status).order_by(order_table.c.id))
+            return list(result.scalars())
+
+
+class BasketRepository(CRUDRepository[Basket, int]):
+    pass
+
+
+class OrderPlacedHandler:
+    committed_statuses: List[str] = []
+
+    @domain_event_handler
+    async def on_order_placed(self, event: OrderPlacedDomainEvent):
+        # Handlers see the committed changes
+        async with get_injector().get(AsyncEngine).connect() as connection:
+            result = await connection.execute(select(order_table.c.status).where(order_table.c.id == event.order.id))
+            self.committed_statuses.append(result.scalar())
+
+
+def test_async_sqla_crud_saves_and_finds_entities(repository):
+    async def act():
+        await repository.save_many([Order(1, 'new'), Order(2, 'new'), Order(3, 'new')])
+        order = await repository.get_by_id(2)
+        order.status = 'paid'
+        await repository.save(order)
+        return (
+            await repository.count(),
+            await repository.find_by_id(2),
+            await repository.find_all_by_id([3, 4, 1]),
+            await repository.find_all(),
+            await repository.exists_by_id(4),
+        )
+
+    # Act
+    count, order, found_orders, all_orders, is_existing = asyncio.run(act())
+
+    # Assert
+    assert count == 3
+    assert order.status == 'paid'
+    assert [found_order.id for found_order in found_orders] == [3, 1]
+    assert [found_order.id for found_order in all_orders] == [1, 2, 3]
+    assert is_existing is False
+
+
+def test_async_sqla_crud_deletes_entities(repository):
+    async def act():
+        await repository.save_many([Order(1, 'new'), Order(2, 'new'), Order(3, 'new'), Order(4, 'new')])
+        orders = await repository.find_all_by_id([1, 2])
+        await repository.delete(orders[0])
+        await repository.delete_many(orders[1:])
+        await repository.delete_by_id(3)
+        remaining_orders = [order.id async for order in repository.stream_all(batch_size=1)]
+        await repository.delete_all()
+        return remaining_orders, await repository.count()
+
+    # Act
+    remaining_orders, count = asyncio.run(act())
+
+    # Assert
+    assert remaining_orders == [4]
+    assert count == 0
+
+
+def test_async_sqla_crud_deletes_entities_with_cascades(basket_repository):
+    async def act():
+        await basket_repository.save_many([Basket(1, [BasketItem(1), BasketItem(2)]), Basket(2, [BasketItem(3)])])
+        baskets = await basket_repository.find_all_by_id([1, 2])
+        await basket_repository.delete_many(baskets)
+        async with get_injector().get(AsyncEngine).connect() as connection:
+            result = await connection.execute(select(basket_item_table.c.id))
+            return await basket_repository.count(), list(result.scalars())
+
+    # Act
+    count, item_ids = asyncio.run(act())
+
+    # Assert
+    assert count == 0
+    assert item_ids == []
+
+
+def test_async_sqla_crud_with_repository_implementation(repository):
+    async def act():
+        await repository.save_many([Order(1, 'new'), Order(2, 'paid')])
+        return await repository.get_statuses()
+
+    # Act
+    statuses = asyncio.run(act())
+
+    # Assert
+    assert statuses == ['new', 'paid']
+
+
+def test_async_sqla_crud_get_by_id_raises_not_found(repository):
+    with pytest.raises(NotFoundException):
+        asyncio.run(repository.get_by_id(1))
+
+
+def test_async_sqla_crud_dispatches_domain_events_after_commit(repository):
+    OrderPlacedHandler.committed_statuses.clear()
+
+    # Act
+    asyncio.run(repository.save(Order.place(1)))
+
+    # Assert
+    assert OrderPlacedHandler.committed_statuses == ['placed']
+
+
+@pytest.fixture()
+def repository(tmp_path):
+    injector = get_injector()
+    # Every test runs its own event loop, so connections aren't pooled
+    engine = create_async_engine(f'sqlite+aiosqlite:///{tmp_path / "orders.db"}', poolclass=NullPool)
+    asyncio.run(_create_tables(engine))
+    domain_event_dispatcher = DomainEventDispatcher()
+    domain_event_dispatcher.add_handlers_from_class(OrderPlacedHandler)
+    injector.binder.bind(AsyncEngine, engine)
+    injector.binder.bind(DomainEventDispatcher, domain_event_dispatcher)
+    return injector.get(async_sqla_crud(OrderRepository, chunk_size=2))
+
+
+@pytest.fixture()
+def basket_repository(repository):
+    return get_injector().get(async_sqla_crud(BasketRepository, chunk_size=2))
+
+
+async def _create_tables(engine: AsyncEngine):
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
@@ -0,0 +1,347 @@
+import datetime
+from abc import abstractmethod
+from typing import List
+from typing import Optional
+
+import dataclasses
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm import mapper
+
+from winter.core import get_injector
+from winter.data import CRUDRepository
+from winter.data.pagination import Page
+from winter.data.pagination import PagePosition
+from winter.data.pagination import Sort
+from winter_ddd import AggregateRoot
+from winter_ddd import DomainEventDispatcher
+from winter_sqlalchemy import sqla_crud
+from winter_sqlalchemy.derived_query import derive_query
+
+
+class Ticket(AggregateRoot):
+    pass
+
+
+metadata = MetaData()
+ticket_table = Table(
+    'tickets',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('status', String),
+    Column('owner_id', Integer, nullable=True),
+    Column('created_at', DateTime),
+)
+label_table = Table(
+    'labels',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('name', String),
+)
+mapper(Ticket, ticket_table)
+
+
+@dataclasses.dataclass(eq=False)
+class Label(AggregateRoot):
+    id: int
+    name: str
+
+
+mapper(Label, label_table)
+
+
+@dataclasses.dataclass
+class TicketSummary:
+    id: int
+    status: str
+
+
+@dataclasses.dataclass
+class TicketState:
+    id: int
+    status: str
+    is_closed: bool = dataclasses.field(init=False)
+
+    def __post_init__(self):
+        self.is_closed = self.status == 'closed'
+
+
+class TicketRepository(CRUDRepository[Ticket, int]):
+    @abstractmethod
+    def find_by_status_and_created_at_gt(self, status: str, created_at: datetime.datetime) -> List[Ticket]:
+        pass
+
+    @abstractmethod
+    def find_by_owner_id(self, owner_id: int) -> Optional[Ticket]:
+        pass
+
+    @abstractmethod
+    def find_all_by_status_in(self, statuses: List[str], page_position: PagePosition) -> Page[Ticket]:
+        pass
+
+    @abstractmethod
+    def find_by_owner_id_is_null_or_status(self, status: str, sort: Optional[Sort] = None) -> List[Ticket]:
+        pass
+
+    @abstractmethod
+    def find_all_by_owner_id(self, owner_id: int, page_position: PagePosition) -> Page[TicketSummary]:
+        pass
+
+    @abstractmethod
+    def find_by_created_at_gte(self, created_at: datetime.datetime) -> List[TicketSummary]:
+        pass
+
+    @abstractmethod
+    def find_by_status(self, status: str) -> Optional[TicketSummary]:
+        pass
+
+    @abstractmethod
+    def find_by_id_in(self, ids: List[int]) -> List[TicketState]:
+        pass
+
+    @abstractmethod
+    def count_by_owner_id(self, owner_id: int) -> int:
+        pass
+
+    @abstractmethod
+    def exists_by_status(self, status: str) -> bool:
+        pass
+
+    def exists_by_owner_id(self, owner_id: int) -> bool:
+        return self.count_by_owner_id(owner_id) > 0
+
+
+class LabelRepository(CRUDRepository[Label, int]):
+    @abstractmethod
+    def find_by_name(self, name: str) -> List[Label]:
+        pass
+
+
+class TicketRepositoryImpl(TicketRepository):
+    def find_by_owner_id(self, owner_id: int) -> Optional[Ticket]:
+        return None
+
+
+@pytest.fixture()
+def repository():
+    engine = get_injector().get(Engine)
+    metadata.drop_all(bind=engine)
+    metadata.create_all(bind=engine)
+    engine.execute(ticket_table.insert(), [
+        {'id': 1, 'status': 'open', 'owner_id': 1, 'created_at': datetime.datetime(2024, 1, 1)},
+        {'id': 2, 'status': 'open', 'owner_id': None, 'created_at': datetime.datetime(2024, 2, 1)},
+        {'id': 3, 'status': 'closed', 'owner_id': 1, 'created_at': datetime.datetime(2024, 3, 1)},
+        {'id': 4, 'status': 'new', 'owner_id': 2, 'created_at': datetime.datetime(2024, 4, 1)},
+    ])
+    get_injector().binder.bind(DomainEventDispatcher, DomainEventDispatcher())
+    return get_injector().get(sqla_crud(TicketRepository))
+
+
+def test_find_by_derived_query(repository):
+    # Act
+    tickets = repository.find_by_status_and_created_at_gt('open', datetime.datetime(2024, 1, 15))
+
+    # Assert
+    assert [ticket.id for ticket in tickets] == [2]
+
+
+def test_derived_query_keeps_implemented_methods(repository):
+    # Act
+    ticket = repository.find_by_owner_id(1)
+
+    # Assert
+    assert ticket is None
+
+
+def test_find_page_by_derived_query(repository):
+    page_position = PagePosition(limit=2, offset=1, sort=Sort.by('created_at').desc())
+
+    # Act
+    page = repository.find_all_by_status_in(['open', 'new'], page_position=page_position)
+
+    # Assert
+    assert page.total_count == 3
+    assert [ticket.id for ticket in page.items] == [2, 1]
+    assert page.position == page_position
+
+
+def test_find_pages_by_derived_query_with_and_without_sort(repository):
+    sorted_page_position = PagePosition(limit=2, sort=Sort.by('id').desc())
+
+    # Act
+    pages = [
+        repository.find_all_by_status_in(['open', 'new'], page_position=page_position)
+        for page_position in (sorted_page_position, sorted_page_position, PagePosition(limit=5))
+    ]
+
+    # Assert
+    assert [ticket.id for ticket in pages[0].items] == [4, 2]
+    assert [ticket.id for ticket in pages[1].items] == [4, 2]
+    assert sorted(ticket.id for ticket in pages[2].items) == [1, 2, 4]
+
+
+@pytest.mark.parametrize(('sort', 'expected_ids'), (
+    (None, [2, 3]),
+    (Sort.by('id').desc(), [3, 2]),
+))
+def test_find_by_derived_query_with_or_and_sort(repository, sort, expected_ids):
+    # Act
+    tickets = repository.find_by_owner_id_is_null_or_status('closed', sort=sort)
+
+    # Assert
+    assert sorted(ticket.id for ticket in tickets) == [2, 3]
+    if sort is not None:
+        assert [ticket.id for ticket in tickets] == expected_ids
+
+
+def test_derived_query_caches_statements_of_limited_number_of_sorts(monkeypatch):
+    monkeypatch.setattr('winter_sqlalchemy.derived_query._MAXIMUM_SORTED_STATEMENTS', 1)
+    query = derive_query(TicketRepository.find_by_owner_id_is_null_or_status, class_mapper(Ticket))
+    sorts = [Sort.by('id'), Sort.by('created_at').desc()]
+
+    # Act
+    statements = [query.get_statement(PagePosition(sort=sort_)) for sort_ in sorts + sorts]
+
+    # Assert
+    assert [str(statement).split('ORDER BY ')[1] for statement in statements] == [
+        'tickets.id ASC',
+        'tickets.created_at DESC',
+    ] * 2
+    assert list(query._sorted_statements) == [Sort.by('id')]
+
+
+def test_find_one_by_derived_query_selects_one_row(repository):
+    engine = get_injector().get(Engine)
+    statements = []
+
+    def on_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', on_before_cursor_execute)
+    try:
+        # Act
+        summary = repository.find_by_status('open')
+    finally:
+        event.remove(engine, 'before_cursor_execute', on_before_cursor_execute)
+
+    # Assert
+    assert summary in (TicketSummary(id=1, status='open'), TicketSummary(id=2, status='open'))
+    assert len(statements) == 1
+    assert 'LIMIT' in statements[0]
+
+
+def test_count_and_exists_by_derived_query(repository):
+    # Act
+    count = repository.count_by_owner_id(1)
+    is_existing = repository.exists_by_status('new')
+    is_missing_existing = repository.exists_by_status('missing')
+    is_owner_existing = repository.exists_by_owner_id(2)
+
+    # Assert
+    assert count == 2
+    assert is_existing is True
+    assert is_missing_existing is False
+    assert is_owner_existing is True
+
+
+def test_find_projections_by_derived_query(repository):
+    page_position = PagePosition(limit=1, sort=Sort.by('id').desc())
+
+    # Act
+    page = repository.find_all_by_owner_id(1, page_position=page_position)
+    summaries = repository.find_by_created_at_gte(datetime.datetime(2024, 3, 1))
+    summary = repository.find_by_status('new')
+    missing_summary = repository.find_by_status('missing')
+
+    # Assert
+    assert page.total_count == 2
+    assert page.items == [TicketSummary(id=3, status='closed')]
+    assert sorted(summaries, key=lambda item: item.id) == [
+        TicketSummary(id=3, status='closed'),
+        TicketSummary(id=4, status='new'),
+    ]
+    assert summary == TicketSummary(id=4, status='new')
+    assert missing_summary is None
+
+
+def test_find_projections_with_fields_not_in_init_by_derived_query(repository):
+    # Act
+    states = repository.find_by_id_in([2, 3])
+
+    # Assert
+    assert sorted((state.id, state.is_closed) for state in states) == [(2, False), (3, True)]
+
+
+def test_find_dataclass_entities_by_derived_query(repository):
+    get_injector().get(Engine).execute(label_table.insert(), [{'id': 1, 'name': 'bug'}, {'id': 2, 'name': 'idea'}])
+    label_repository = get_injector().get(sqla_crud(LabelRepository))
+
+    # Act
+    labels = label_repository.find_by_name('bug')
+
+    # Assert
+    assert labels == [label_repository.get_by_id(1)]
+    assert labels[0].name == 'bug'
+
+
+@dataclasses.dataclass
+class TicketTitle:
+    id: int
+    title: str
+
+
+class UnknownProjectedColumnRepository(CRUDRepository[Ticket, int]):
+    @abstractmethod
+    def find_by_status(self, status: str) -> List[TicketTitle]:
+        pass
+
+
+class UnknownColumnRepository(CRUDRepository[Ticket, int]):
+    @abstractmethod
+    def find_by_name(self, name: str) -> List[Ticket]:
+        pass
+
+
+class TrailingOrRepository(CRUDRepository[Ticket, int]):
+    @abstractmethod
+    def find_by_status_or(self, status: str) -> List[Ticket]:
+        pass
+
+
+class UnexpectedTokenRepository(CRUDRepository[Ticket, int]):
+    @abstractmethod
+    def count_by_status_gt_id(self, status: str) -> int:
+        pass
+
+
+class BetweenRepository(CRUDRepository[Ticket, int]):
+    @abstractmethod
+    def exists_by_status_between(self, status: str) -> bool:
+        pass
+
+
+@pytest.mark.parametrize(('repository_cls', 'message'), (
+    (UnknownColumnRepository, 'Can\'t derive a query from method "find_by_name", unknown column: "name"'),
+    (TrailingOrRepository, 'Can\'t derive a query from method "find_by_status_or", it ends with a conjunction'),
+    (UnexpectedTokenRepository, 'Can\'t derive a query from method "count_by_status_gt_id", unexpected: "gt_id"'),
+    (
+        UnknownProjectedColumnRepository,
+        'Can\'t project TicketTitle in method "find_by_status", unknown column: "title"',
+    ),
+    (BetweenRepository, 'Method "exists_by_status_between" must take 2 arguments besides PagePosition and Sort'),
+))
+def test_invalid_derived_query(repository_cls, message):
+    # Act
+    with pytest.raises(TypeError) as exception_info:
+        sqla_crud(repository_cls)
+
+    # Assert
+    assert str(exception_info.value) == message
@@ -0,0 +1,329 @@
+import contextlib
+import datetime
+import decimal
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import freezegun
+import pytest
+from mock import patch
+from redis import Redis
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Numeric
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import mapper
+
+from winter.core import get_injector
+from winter.data import CRUDRepository
+from winter.web.throttling import redis_throttling_configuration
+from winter_ddd import AggregateRoot
+from winter_ddd import DomainEventDispatcher
+from winter_sqlalchemy import EntityCacheStats
+from winter_sqlalchemy import LRUEntityCache
+from winter_sqlalchemy import RedisEntityCache
+from winter_sqlalchemy import sqla_crud
+from winter_sqlalchemy import unit_of_work_scope
+
+
+class Product(AggregateRoot):
+    pass
+
+
+class OtherProduct:
+    pass
+
+
+metadata = MetaData()
+product_table = Table(
+    'products',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('name', String),
+    Column('price', Numeric),
+    Column('updated_at', DateTime),
+)
+other_product_table = Table(
+    'other_products',
+    metadata,
+    Column('id', Integer, primary_key=True),
+)
+mapper(Product, product_table)
+mapper(OtherProduct, other_product_table)
+
+
+class ProductRepository(CRUDRepository[Product, int]):
+    pass
+
+
+def test_lru_entity_cache():
+    cache = LRUEntityCache(maximum_size=2)
+    cache.set(Product, (1,), {'id': 1})
+    cache.set(Product, (2,), {'id': 2})
+
+    # Act
+    cache.get(Product, (1,))
+    cache.set(OtherProduct, (1,), {'id': 1})
+
+    # Assert
+    assert cache.get(Product, (2,)) is None
+    assert cache.get(Product, (1,)) == {'id': 1}
+    assert cache.get(OtherProduct, (1,)) == {'id': 1}
+    assert cache.stats == EntityCacheStats(hits=3, misses=1)
+
+
+def test_lru_entity_cache_expires_entities():
+    now = datetime.datetime.now()
+    cache = LRUEntityCache(maximum_size=10, ttl=60)
+
+    with freezegun.freeze_time(now) as frozen_time:
+        cache.set(Product, (1,), {'id': 1})
+        frozen_time.tick(30)
+        cache.set(Product, (2,), {'id': 2})
+
+        # Act
+        frozen_time.tick(40)
+
+        # Assert
+        assert cache.get(Product, (1,)) is None
+        assert cache.get(Product, (2,)) == {'id': 2}
+
+
+def test_lru_entity_cache_clears_entities_of_class():
+    cache = LRUEntityCache(maximum_size=10)
+    cache.set(Product, (1,), {'id': 1})
+    cache.set(Product, (2,), {'id': 2})
+    cache.set(OtherProduct, (1,), {'id': 1})
+
+    # Act
+    cache.clear(Product)
+
+    # Assert
+    assert cache.get(Product, (1,)) is None
+    assert cache.get(Product, (2,)) is None
+    assert cache.get(OtherProduct, (1,)) == {'id': 1}
+
+
+def test_lru_entity_cache_is_shared_by_threads():
+    cache = LRUEntityCache(maximum_size=10)
+
+    def use_cache(thread_index: int):
+        for id_ in range(100):
+            cache.set(Product, (id_,), {'id': id_, 'name': str(thread_index)})
+            cache.get(Product, (id_ - 5,))
+            cache.delete(Product, (id_ - 8,))
+
+    # Act
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(use_cache, range(8)))
+
+    # Assert
+    assert [cache.get(Product, (id_,)) is not None for id_ in range(90, 100)] == [False] * 2 + [True] * 8
+
+
+def test_redis_entity_cache():
+    configuration = redis_throttling_configuration.get_redis_throttling_configuration()
+    redis = Redis(host=configuration.host, port=configuration.port, db=configuration.db)
+    cache = RedisEntityCache(redis, ttl=60, key_prefix='test_entity_cache:')
+    state = {
+        'id': 1,
+        'name': 'first',
+        'price': decimal.Decimal('9.99'),
+        'updated_at': datetime.datetime(2020, 1, 2, 3, 4, 5),
+    }
+    cache.set(Product, (1,), state)
+    cache.set(Product, (2,), {'id': 2, 'name': 'second', 'price': None, 'updated_at': None})
+    cache.set(OtherProduct, (1,), {'id': 1})
+
+    # Act
+    cache.delete(Product, (2,))
+    found_state = cache.get(Product, (1,))
+    cache.clear(Product)
+
+    # Assert
+    assert found_state == state
+    assert isinstance(found_state['price'], decimal.Decimal)
+    assert cache.get(Product, (1,)) is None
+    assert cache.get(OtherProduct, (1,)) == {'id': 1}
+    assert cache.stats == EntityCacheStats(hits=2, misses=1)
+    assert 0 < redis.ttl(f'test_entity_cache:{__name__}.OtherProduct:[1]') <= 60
+    cache.clear(OtherProduct)
+
+
+def test_redis_entity_cache_clears_nothing_if_no_entities_are_cached():
+    configuration = redis_throttling_configuration.get_redis_throttling_configuration()
+    redis = Redis(host=configuration.host, port=configuration.port, db=configuration.db)
+    cache = RedisEntityCache(redis, key_prefix='test_entity_cache:')
+
+    # Act
+    cache.clear(Product)
+
+    # Assert
+    assert cache.get(Product, (1,)) is None
+
+
+def test_repository_finds_cached_entities(entity_cache, repository_cls, statements):
+    get_injector().get(repository_cls).find_by_id(1)
+    repository = get_injector().get(repository_cls)
+    statements.clear()
+
+    # Act
+    product = repository.find_by_id(1)
+    is_existing = repository.exists_by_id(2)
+
+    # Assert
+    assert product.name == 'first'
+    assert is_existing is True
+    assert statements == ['SELECT']
+    assert entity_cache.stats == EntityCacheStats(hits=1, misses=2)
+
+
+def test_repository_checks_existence_of_cached_entities(entity_cache, repository_cls, statements):
+    get_injector().get(repository_cls).find_by_id(1)
+    repository = get_injector().get(repository_cls)
+    statements.clear()
+
+    # Act
+    is_existing = repository.exists_by_id(1)
+
+    # Assert
+    assert is_existing is True
+    assert statements == []
+
+
+def test_repository_doesnt_cache_not_found_entities(entity_cache, repository_cls):
+    repository = get_injector().get(repository_cls)
+
+    # Act
+    product = repository.find_by_id(3)
+
+    # Assert
+    assert product is None
+    assert entity_cache.get(Product, (3,)) is None
+
+
+def test_repository_invalidates_saved_and_deleted_entities(entity_cache, repository_cls):
+    repository = get_injector().get(repository_cls)
+    product = repository.find_by_id(1)
+    repository.find_by_id(2)
+    product.name = 'changed'
+
+    # Act
+    repository.save(product)
+    repository.delete_by_id(2)
+
+    # Assert
+    assert entity_cache.get(Product, (1,)) is None
+    assert entity_cache.get(Product, (2,)) is None
+    assert get_injector().get(repository_cls).find_by_id(1).name == 'changed'
+
+
+def test_repository_clears_cache_on_delete_all(entity_cache, repository_cls):
+    repository = get_injector().get(repository_cls)
+    repository.find_all_by_id([1, 2])
+
+    # Act
+    repository.delete_all()
+
+    # Assert
+    assert entity_cache.get(Product, (1,)) is None
+    assert entity_cache.get(Product, (2,)) is None
+    assert repository.find_by_id(1) is None
+
+
+def test_repository_invalidates_deleted_entities_after_commit(entity_cache, repository_cls):
+    repository = get_injector().get(repository_cls)
+    product = repository.find_by_id(1)
+    engine = get_injector().get(Engine)
+    events = []
+
+    def on_commit(connection):
+        events.append('commit')
+
+    event.listen(engine, 'commit', on_commit)
+    try:
+        with patch.object(entity_cache, 'delete', side_effect=lambda entity_cls, id_: events.append('evict')):
+            # Act
+            repository.delete(product)
+    finally:
+        event.remove(engine, 'commit', on_commit)
+
+    # Assert
+    assert events == ['commit', 'evict']
+
+
+def test_repository_invalidates_entities_changed_in_unit_of_work_after_commit(entity_cache, repository_cls):
+    repository = get_injector().get(repository_cls)
+    repository.find_by_id(1)
+    repository.find_by_id(2)
+
+    with unit_of_work_scope():
+        product = repository.find_by_id(1)
+        product.name = 'changed'
+
+        # Act
+        repository.save(product)
+        repository.delete_by_id(2)
+
+        # Assert
+        assert entity_cache.get(Product, (1,))['name'] == 'first'
+        assert entity_cache.get(Product, (2,)) is not None
+
+    assert entity_cache.get(Product, (1,)) is None
+    assert entity_cache.get(Product, (2,)) is None
+    assert get_injector().get(repository_cls).find_by_id(1).name == 'changed'
+
+
+@pytest.mark.parametrize('is_rolled_back', (False, True))
+def test_repository_clears_cache_on_delete_all_in_unit_of_work_after_commit(
+    entity_cache,
+    repository_cls,
+    is_rolled_back,
+):
+    repository = get_injector().get(repository_cls)
+    repository.find_by_id(1)
+
+    with pytest.raises(ValueError) if is_rolled_back else contextlib.nullcontext():
+        with unit_of_work_scope():
+            # Act
+            repository.delete_all()
+
+            # Assert
+            assert entity_cache.get(Product, (1,)) is not None
+            if is_rolled_back:
+                raise ValueError()
+
+    assert (entity_cache.get(Product, (1,)) is not None) == is_rolled_back
+
+
+@pytest.fixture()
+def entity_cache():
+    return LRUEntityCache(maximum_size=10)
+
+
+@pytest.fixture()
+def repository_cls(entity_cache):
+    engine = get_injector().get(Engine)
+    metadata.drop_all(bind=engine)
+    metadata.create_all(bind=engine)
+    engine.execute(product_table.insert(), {'id': 1, 'name': 'first'}, {'id': 2, 'name': 'second'})
+    get_injector().binder.bind(DomainEventDispatcher, DomainEventDispatcher())
+    return sqla_crud(ProductRepository, entity_cache=entity_cache)
+
+
+@pytest.fixture()
+def statements():
+    engine = get_injector().get(Engine)
+    statements: List[str] = []
+
+    def on_before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0])
+
+    event.listen(engine, 'before_cursor_execute', on_before_cursor_execute)
+    yield statements
+    event.remove(engine, 'before_cursor_execute', on_before_cursor_execute)
@@ -0,0 +1,128 @@
+from typing import Optional
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import bindparam
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql import Select
+from testcontainers.postgres import PostgresContainer
+
+from winter.data.pagination import PagePosition
+from winter.data.pagination import Sort
+from winter_sqlalchemy import PostgreSQLTotalCountEstimator
+from winter_sqlalchemy import TotalCountEstimator
+from winter_sqlalchemy import TotalCountMode
+from winter_sqlalchemy import fetch_page
+from winter_sqlalchemy import set_total_count_estimator
+
+
+class FixedTotalCountEstimator(TotalCountEstimator):
+    def estimate(self, connection: Connection, select: Select) -> Optional[int]:
+        return 100
+
+
+@pytest.mark.parametrize(
+    'total_count_mode, limit, offset, expected_ids, expected_total_count, expected_has_next', [
+        (TotalCountMode.EXACT, 2, 2, [3, 4], 5, None),
+        (TotalCountMode.NONE, 2, 2, [3, 4], None, True),
+        (TotalCountMode.NONE, 2, 3, [4, 5], None, False),
+        (TotalCountMode.NONE, None, None, [1, 2, 3, 4, 5], None, False),
+        (TotalCountMode.ESTIMATED, 4, None, [1, 2, 3, 4], 100, True),
+    ],
+)
+def test_fetch_page(
+    id_database,
+    total_count_mode,
+    limit,
+    offset,
+    expected_ids,
+    expected_total_count,
+    expected_has_next,
+):
+    engine, table = id_database
+    page_position = PagePosition(limit, offset, Sort.by('id'))
+    set_total_count_estimator(FixedTotalCountEstimator())
+
+    # Act
+    try:
+        page = fetch_page(engine, select([table.c.id]), page_position, total_count_mode)
+    finally:
+        set_total_count_estimator(PostgreSQLTotalCountEstimator())
+
+    # Assert
+    assert [row.id for row in page] == expected_ids
+    assert page.position == page_position
+    assert page.total_count == expected_total_count
+    assert page.has_next == expected_has_next
+    assert page.is_total_count_estimated == (total_count_mode == TotalCountMode.ESTIMATED)
+
+
+def test_fetch_page_with_filtered_select(id_database):
+    engine, table = id_database
+    statement = select([table.c.id]).where(table.c.id > 1).order_by(table.c.id)
+
+    with engine.connect() as connection:
+        # Act
+        page = fetch_page(connection, statement, PagePosition(limit=1))
+
+    # Assert
+    assert [row.id for row in page] == [2]
+    assert page.total_count == 4
+
+
+def test_postgresql_estimator_does_not_estimate_other_databases(id_database):
+    engine, table = id_database
+
+    # Act
+    page = fetch_page(engine, select([table.c.id]), PagePosition(limit=1), TotalCountMode.ESTIMATED)
+
+    # Assert
+    assert page.total_count is None
+    assert page.is_total_count_estimated is False
+    assert page.has_next is True
+
+
+@pytest.fixture(scope='module')
+def id_database():
+    engine = create_engine('sqlite://')
+    metadata = MetaData(engine)
+    table = Table('table', metadata, Column('id', Integer, primary_key=True))
+    metadata.create_all()
+    rows = [{'id': value} for value in range(1, 6)]
+    engine.execute(table.insert(), *rows)
+    return engine, table
+
+
+@pytest.mark.parametrize('statement_factory', (
+    lambda table: select([table.c.id]).where(table.c.id > 1),
+    lambda table: select([table.c.id]).where(table.c.id.in_(bindparam('ids', [1, 2, 3], expanding=True))),
+))
+def test_postgresql_estimator(postgresql_id_database, statement_factory):
+    engine, table = postgresql_id_database
+
+    # Act
+    page = fetch_page(engine, statement_factory(table), PagePosition(limit=1), TotalCountMode.ESTIMATED)
+
+    # Assert
+    assert isinstance(page.total_count, int)
+    assert page.total_count > 0
+    assert page.is_total_count_estimated is True
+    assert page.has_next is True
+
+
+@pytest.fixture(scope='module')
+def postgresql_id_database():
+    with PostgresContainer('postgres:16-alpine') as container:
+        engine = create_engine(container.get_connection_url())
+        metadata = MetaData(engine)
+        table = Table('table', metadata, Column('id', Integer, primary_key=True))
+        metadata.create_all()
+        engine.execute(table.insert(), *({'id': value} for value in range(1, 6)))
+        engine.execute(f'ANALYZE "{table.name}"')
+        yield engine, table
+        engine.dispose()
@@ -0,0 +1,222 @@
+import functools
+import gc
+import weakref
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import mapper
+
+from winter.core import get_injector
+from winter.data import CRUDRepository
+from winter_ddd import AggregateRoot
+from winter_ddd import DomainEventDispatcher
+from winter_sqlalchemy import IdentityMapInterceptor
+from winter_sqlalchemy import IdentityMapStats
+from winter_sqlalchemy import LRUIdentityMap
+from winter_sqlalchemy import RequestScopedIdentityMap
+from winter_sqlalchemy import RoutingSession
+from winter_sqlalchemy import WeakValueIdentityMap
+from winter_sqlalchemy import sqla_crud
+
+
+class Entity:
+    pass
+
+
+class Item(AggregateRoot):
+    def __init__(self, id_: int):
+        super().__init__()
+        self.id = id_
+
+
+metadata = MetaData()
+item_table = Table('items', metadata, Column('id', Integer, primary_key=True))
+mapper(Item, item_table)
+
+
+class ItemRepository(CRUDRepository[Item, int]):
+    pass
+
+
+def test_weak_value_identity_map():
+    identity_map = WeakValueIdentityMap()
+    entity_1 = Entity()
+    entity_2 = Entity()
+    identity_map.add(1, entity_1)
+    identity_map.add(2, entity_2)
+
+    # Act
+    del entity_2
+    gc.collect()
+
+    # Assert
+    assert identity_map.get(1) is entity_1
+    assert identity_map.get(2) is None
+    assert identity_map.stats == IdentityMapStats(hits=1, misses=1, evictions=1)
+
+
+def test_weak_value_identity_map_doesnt_count_removed_entities_as_evicted():
+    identity_map = WeakValueIdentityMap()
+    entity = Entity()
+    replaced_entity = Entity()
+    identity_map.add(1, entity)
+    identity_map.add(2, replaced_entity)
+
+    # Act
+    identity_map.remove(1)
+    identity_map.add(2, entity)
+    del replaced_entity
+    gc.collect()
+
+    # Assert
+    assert identity_map.get(2) is entity
+    assert identity_map.stats.evictions == 0
+
+
+def test_lru_identity_map():
+    identity_map = LRUIdentityMap(maximum_size=2)
+    entities = [Entity() for _ in range(3)]
+    identity_map.add(0, entities[0])
+    identity_map.add(1, entities[1])
+
+    # Act
+    identity_map.get(0)
+    identity_map.add(2, entities[2])
+
+    # Assert
+    assert identity_map.get(1) is None
+    assert identity_map.get(0) is entities[0]
+    assert identity_map.get(2) is entities[2]
+    assert identity_map.stats == IdentityMapStats(hits=3, misses=1, evictions=1)
+
+
+def test_lru_identity_map_removes_entities():
+    identity_map = LRUIdentityMap(maximum_size=2)
+    entity = Entity()
+    identity_map.add(1, Entity())
+    identity_map.add(2, entity)
+
+    # Act
+    identity_map.remove(1)
+    found_entity = identity_map.get(2)
+    identity_map.clear()
+
+    # Assert
+    assert found_entity is entity
+    assert identity_map.get(1) is None
+    assert identity_map.get(2) is None
+    assert identity_map.stats == IdentityMapStats(hits=1, misses=2, evictions=0)
+
+
+def test_request_scoped_identity_map_is_cleared_after_request():
+    identity_map = RequestScopedIdentityMap()
+    entity = Entity()
+    identity_map.add(1, entity)
+    identity_map.add(2, Entity())
+    interceptor = IdentityMapInterceptor()
+
+    # Act
+    found_entity = identity_map.get(1)
+    interceptor.after_completion()
+
+    # Assert
+    assert found_entity is entity
+    assert identity_map.get(1) is None
+    assert identity_map.stats == IdentityMapStats(hits=1, misses=1, evictions=2)
+
+
+def test_request_scoped_identity_map_removes_entities():
+    identity_map = RequestScopedIdentityMap()
+    identity_map.remove(1)
+    identity_map.add(1, Entity())
+
+    # Act
+    identity_map.remove(1)
+    IdentityMapInterceptor().after_completion()
+
+    # Assert
+    assert identity_map.get(1) is None
+    assert identity_map.stats == IdentityMapStats(hits=0, misses=1, evictions=0)
+
+
+@pytest.mark.parametrize(('identity_map_factory', 'is_same_item_found', 'expected_stats'), (
+    (WeakValueIdentityMap, True, IdentityMapStats(hits=1, misses=3, evictions=1)),
+    (functools.partial(LRUIdentityMap, maximum_size=1), False, IdentityMapStats(hits=0, misses=4, evictions=3)),
+    (RequestScopedIdentityMap, True, IdentityMapStats(hits=2, misses=2, evictions=0)),
+))
+def test_repository_identity_map(identity_map_factory, is_same_item_found, expected_stats):
+    engine = get_injector().get(Engine)
+    metadata.drop_all(bind=engine)
+    metadata.create_all(bind=engine)
+    engine.execute(item_table.insert(), {'id': 1}, {'id': 2})
+    repository_cls = sqla_crud(ItemRepository, identity_map_factory=identity_map_factory)
+    repository = get_injector().get(repository_cls)
+
+    # Act
+    item_1 = repository.find_by_id(1)
+    item_2 = repository.find_by_id(2)
+    del item_2
+    gc.collect()
+    found_item_1 = repository.find_by_id(1)
+    found_item_2 = repository.find_by_id(2)
+
+    # Assert
+    assert (found_item_1 is item_1) == is_same_item_found
+    assert found_item_2.id == 2
+    assert repository.identity_map_stats == expected_stats
+    IdentityMapInterceptor().after_completion()
+
+
+@pytest.fixture(autouse=True)
+def domain_event_dispatcher():
+    get_injector().binder.bind(DomainEventDispatcher, DomainEventDispatcher())
+
+
+def test_repository_keeps_saved_changes_of_released_entities():
+    engine = get_injector().get(Engine)
+    metadata.drop_all(bind=engine)
+    metadata.create_all(bind=engine)
+    repository = get_injector().get(sqla_crud(ItemRepository))
+
+    # Act
+    repository.save(Item(1))
+    gc.collect()
+
+    # Assert
+    assert repository.count() == 1
+
+
+def test_repository_doesnt_keep_transactions_of_saved_entities():
+    engine = get_injector().get(Engine)
+    metadata.drop_all(bind=engine)
+    metadata.create_all(bind=engine)
+    repository = get_injector().get(sqla_crud(ItemRepository))
+    sessions_in_transaction = weakref.WeakSet()
+
+    def on_after_begin(session, transaction, connection):
+        sessions_in_transaction.add(session)
+
+    def on_after_transaction_end(session, transaction):
+        if transaction.parent is None:
+            sessions_in_transaction.discard(session)
+
+    event.listen(RoutingSession, 'after_begin', on_after_begin)
+    event.listen(RoutingSession, 'after_transaction_end', on_after_transaction_end)
+
+    # Act
+    try:
+        for id_ in range(100):
+            repository.save(Item(id_))
+        gc.collect()
+    finally:
+        event.remove(RoutingSession, 'after_begin', on_after_begin)
+        event.remove(RoutingSession, 'after_transaction_end', on_after_transaction_end)
+
+    # Assert
+    assert len(sessions_in_transaction) == 0
+    assert repository.count() == 100
@@ -0,0 +1,120 @@
+import datetime
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import select
+
+from winter.data.pagination import Cursor
+from winter.data.pagination import CursorPage
+from winter.data.pagination import CursorPosition
+from winter.data.pagination import Sort
+from winter_sqlalchemy import paginate_by_cursor
+
+
+@pytest.mark.parametrize(
+    'sort_, expected_ids', [
+        (Sort.by('id'), [1, 2, 3, 4, 5, 6, 7]),
+        (Sort.by('id').desc(), [7, 6, 5, 4, 3, 2, 1]),
+        (Sort.by('group').and_(Sort.by('id').desc()), [3, 2, 1, 6, 5, 4, 7]),
+        (Sort.by('created_at').desc().and_(Sort.by('id')), [7, 4, 5, 6, 1, 2, 3]),
+    ],
+)
+def test_paginate_by_cursor_forward_and_backward(database, sort_, expected_ids):
+    engine, table = database
+    statement = select([table.c.id, table.c.group, table.c.created_at])
+    position = CursorPosition(limit=3, sort=sort_)
+    pages = []
+
+    # Act
+    while True:
+        page = _fetch_page(engine, statement, position)
+        pages.append([row.id for row in page])
+        if page.next_cursor is None:
+            break
+        position = CursorPosition(limit=3, cursor=Cursor.decode(page.next_cursor.encode()), sort=sort_)
+
+    previous_pages = []
+    while page.previous_cursor is not None:
+        position = CursorPosition(limit=3, cursor=Cursor.decode(page.previous_cursor.encode()), sort=sort_)
+        page = _fetch_page(engine, statement, position)
+        previous_pages.append([row.id for row in page])
+
+    # Assert
+    assert pages == [expected_ids[0:3], expected_ids[3:6], expected_ids[6:]]
+    assert previous_pages == [expected_ids[3:6], expected_ids[0:3]]
+
+
+def test_paginate_by_cursor_without_limit(database):
+    engine, table = database
+    position = CursorPosition(cursor=Cursor(Sort.by('id'), (5,)), sort=Sort.by('id'))
+
+    # Act
+    page = _fetch_page(engine, select([table.c.id]), position)
+
+    # Assert
+    assert [row.id for row in page] == [6, 7]
+    assert page.next_cursor is None
+
+
+def test_paginate_by_cursor_by_column_of_unknown_type(database):
+    engine, table = database
+    statement = select([table.c.id, func.abs(table.c.group).label('weight')])
+    sort_ = Sort.by('weight').and_(Sort.by('id'))
+    position = CursorPosition(limit=2, cursor=Cursor(sort_, (1, 3)), sort=sort_)
+
+    # Act
+    page = _fetch_page(engine, statement, position)
+
+    # Assert
+    assert [row.id for row in page] == [4, 5]
+
+
+def test_paginate_by_cursor_requires_sort(database):
+    engine, table = database
+
+    with pytest.raises(ValueError, match='Cursor pagination requires sort'):
+        paginate_by_cursor(select([table.c.id]), CursorPosition(limit=3))
+
+
+def test_paginate_by_cursor_requires_selected_sort_fields(database):
+    engine, table = database
+    position = CursorPosition(limit=3, cursor=Cursor(Sort.by('group'), (1,)), sort=Sort.by('group'))
+
+    with pytest.raises(ValueError, match='Sort field is not selected: "group"'):
+        paginate_by_cursor(select([table.c.id]), position)
+
+
+def _fetch_page(engine, statement, position: CursorPosition) -> CursorPage:
+    rows = engine.execute(paginate_by_cursor(statement, position)).fetchall()
+    return CursorPage.from_items(rows, position)
+
+
+@pytest.fixture(scope='module')
+def database():
+    engine = create_engine('sqlite://')
+    metadata = MetaData(engine)
+    table = Table(
+        'table',
+        metadata,
+        Column('id', Integer, primary_key=True),
+        Column('group', Integer),
+        Column('created_at', DateTime),
+    )
+    metadata.create_all()
+    rows = [
+        {'id': 1, 'group': 1, 'created_at': datetime.datetime(2024, 1, 1)},
+        {'id': 2, 'group': 1, 'created_at': datetime.datetime(2024, 1, 1)},
+        {'id': 3, 'group': 1, 'created_at': datetime.datetime(2024, 1, 1)},
+        {'id': 4, 'group': 2, 'created_at': datetime.datetime(2024, 1, 2, 12, 30)},
+        {'id': 5, 'group': 2, 'created_at': datetime.datetime(2024, 1, 2, 12, 30)},
+        {'id': 6, 'group': 2, 'created_at': datetime.datetime(2024, 1, 2, 12, 30)},
+        {'id': 7, 'group': 3, 'created_at': datetime.datetime(2024, 1, 3)},
+    ]
+    engine.execute(table.insert(), *rows)
+    return engine, table
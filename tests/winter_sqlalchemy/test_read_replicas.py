@@ -0,0 +1,135 @@
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import mapper
+from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import StaticPool
+
+from winter.core import get_injector
+from winter.data import CRUDRepository
+from winter_ddd import AggregateRoot
+from winter_ddd import DomainEventDispatcher
+from winter_sqlalchemy import LeastConnectionsReplicaPolicy
+from winter_sqlalchemy import ReadReplicas
+from winter_sqlalchemy import RoundRobinReplicaPolicy
+from winter_sqlalchemy import sqla_crud
+from winter_sqlalchemy import unit_of_work_scope
+
+
+class Article(AggregateRoot):
+    def __init__(self, id_: int, title: str):
+        super().__init__()
+        self.id = id_
+        self.title = title
+
+
+metadata = MetaData()
+article_table = Table(
+    'articles',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('title', String),
+)
+mapper(Article, article_table)
+
+
+class ArticleRepository(CRUDRepository[Article, int]):
+    pass
+
+
+def test_round_robin_replica_policy():
+    engines = [create_engine('sqlite://'), create_engine('sqlite://')]
+    policy = RoundRobinReplicaPolicy()
+
+    # Act
+    chosen_engines = [policy.choose(engines) for _ in range(3)]
+
+    # Assert
+    assert chosen_engines == [engines[0], engines[1], engines[0]]
+
+
+def test_least_connections_replica_policy(tmp_path):
+    engines = [create_engine(f'sqlite:///{tmp_path / name}', poolclass=QueuePool) for name in ('1.db', '2.db')]
+    policy = LeastConnectionsReplicaPolicy()
+
+    # Act
+    with engines[0].connect():
+        chosen_engine = policy.choose(engines)
+
+    # Assert
+    assert chosen_engine is engines[1]
+
+
+@pytest.mark.parametrize('poolclass', (NullPool, StaticPool))
+def test_least_connections_replica_policy_chooses_round_robin_without_queue_pools(tmp_path, poolclass):
+    engines = [create_engine(f'sqlite:///{tmp_path / name}', poolclass=poolclass) for name in ('1.db', '2.db')]
+    policy = LeastConnectionsReplicaPolicy()
+
+    # Act
+    chosen_engines = [policy.choose(engines) for _ in range(3)]
+
+    # Assert
+    assert chosen_engines == [engines[0], engines[1], engines[0]]
+
+
+def test_repository_reads_from_replica(replica, primary):
+    repository = get_injector().get(sqla_crud(ArticleRepository))
+
+    # Act
+    article = repository.find_by_id(1)
+    count = repository.count()
+    article.title = 'changed'
+    repository.save(article)
+
+    # Assert
+    assert count == 2
+    assert primary.execute(article_table.select()).fetchall() == [(1, 'changed')]
+
+
+def test_unit_of_work_sticks_to_primary_after_write(replica, primary):
+    repository = get_injector().get(sqla_crud(ArticleRepository))
+
+    # Act
+    with unit_of_work_scope() as unit_of_work:
+        title_from_replica = repository.find_by_id(2).title
+        count_from_replica = repository.count()
+        repository.save(Article(3, 'new'))
+        title_from_primary = repository.find_by_id(1).title
+        is_written = unit_of_work.session.has_written
+
+    # Assert
+    assert title_from_replica == 'replica second'
+    assert count_from_replica == 2
+    assert title_from_primary == 'primary first'
+    assert is_written is True
+    assert replica.execute(article_table.select().where(article_table.c.id == 3)).fetchall() == []
+
+
+@pytest.fixture()
+def primary():
+    engine = get_injector().get(Engine)
+    metadata.drop_all(bind=engine)
+    metadata.create_all(bind=engine)
+    engine.execute(article_table.insert(), {'id': 1, 'title': 'primary first'})
+    get_injector().binder.bind(DomainEventDispatcher, DomainEventDispatcher())
+    return engine
+
+
+@pytest.fixture()
+def replica():
+    engine = create_engine('sqlite://', poolclass=StaticPool)
+    metadata.create_all(bind=engine)
+    engine.execute(
+        article_table.insert(),
+        {'id': 1, 'title': 'replica first'},
+        {'id': 2, 'title': 'replica second'},
+    )
+    get_injector().binder.bind(ReadReplicas, ReadReplicas([engine]))
+    yield engine
+    get_injector().binder.bind(ReadReplicas, ReadReplicas())
@@ -162,6 +162,19 @@ def test_delete_all(fixture):
     assert count == 0
 
 
+def test_delete_all_releases_loaded_entities(fixture):
+    fixture.execute('INSERT INTO my_entities (id) VALUES (1), (2);')
+    entities = fixture.repository.find_all_by_id([1, 2])
+
+    # Act
+    fixture.repository.delete_all()
+
+    count = fixture.execute('SELECT COUNT(*) FROM my_entities;').scalar()
+    assert count == 0
+    assert len(entities) == 2
+    assert fixture.repository.find_by_id(1) is None
+
+
 def test_delete_by_id(fixture):
     fixture.execute('INSERT INTO my_entities (id) VALUES (1), (2);')
 
@@ -172,6 +185,18 @@ def test_delete_by_id(fixture):
     assert list(result) == [(2,)]
 
 
+def test_delete_by_id_of_loaded_entity(fixture):
+    fixture.execute('INSERT INTO my_entities (id) VALUES (1), (2);')
+    entity = fixture.repository.get_by_id(1)
+
+    # Act
+    fixture.repository.delete_by_id(1)
+
+    result = fixture.execute('SELECT id FROM my_entities;')
+    assert list(result) == [(2,)]
+    assert fixture.repository.find_by_id(entity.id) is None
+
+
 def test_exists_by_id(fixture):
     fixture.execute('INSERT INTO my_entities (id) VALUES (1), (2);')
 
@@ -181,6 +206,17 @@ def test_exists_by_id(fixture):
     assert exists is True
 
 
+def test_exists_by_id_of_loaded_entity(fixture):
+    fixture.execute('INSERT INTO my_entities (id) VALUES (1), (2);')
+    entity = fixture.repository.get_by_id(2)
+    fixture.execute('DELETE FROM my_entities WHERE id = 2;')
+
+    # Act
+    exists = fixture.repository.exists_by_id(entity.id)
+
+    assert exists is True
+
+
 def test_not_exists_by_id(fixture):
     fixture.execute('INSERT INTO my_entities (id) VALUES (1), (2);')
 
@@ -0,0 +1,381 @@
+import gc
+import weakref
+from dataclasses import dataclass
+from typing import List
+from typing import Tuple
+
+import pytest
+from injector import ClassProvider
+from injector import inject
+from sqlalchemy import Column
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import mapper
+from sqlalchemy.orm import relationship
+
+from winter.core import get_injector
+from winter.data import CRUDRepository
+from winter_ddd import AggregateRoot
+from winter_ddd import DomainEvent
+from winter_ddd import DomainEventDispatcher
+from winter_sqlalchemy import sqla_crud
+
+
+@dataclass
+class PromotedDomainEvent(DomainEvent):
+    membership: 'Membership'
+
+
+class Membership(AggregateRoot):
+    def __init__(self, group_id: int, user_id: int, role: str):
+        super().__init__()
+        self.group_id = group_id
+        self.user_id = user_id
+        self.role = role
+
+    def promote(self):
+        self.role = 'admin'
+        self.domain_events.register(PromotedDomainEvent(self))
+
+
+class TeamMember:
+    def __init__(self, id_: int):
+        self.id = id_
+
+
+class Team(AggregateRoot):
+    def __init__(self, id_: int, members: List[TeamMember]):
+        super().__init__()
+        self.id = id_
+        self.members = members
+
+
+class Tag:
+    def __init__(self, id_: int):
+        self.id = id_
+
+
+class Task:
+    def __init__(self, id_: int):
+        self.id = id_
+
+
+class Project(AggregateRoot):
+    def __init__(self, id_: int, tags: List[Tag], tasks: List[Task]):
+        super().__init__()
+        self.id = id_
+        self.tags = tags
+        self.tasks = tasks
+
+
+class RecordingDomainEventDispatcher(DomainEventDispatcher):
+    def __init__(self):
+        super().__init__()
+        self.dispatched_events = []
+
+    def dispatch(self, events):
+        self.dispatched_events.append(list(events))
+        super().dispatch(events)
+
+
+metadata = MetaData()
+membership_table = Table(
+    'memberships',
+    metadata,
+    Column('group_id', Integer, primary_key=True),
+    Column('user_id', Integer, primary_key=True),
+    Column('role', String),
+)
+team_table = Table(
+    'teams',
+    metadata,
+    Column('id', Integer, primary_key=True),
+)
+team_member_table = Table(
+    'team_members',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('team_id', Integer, ForeignKey('teams.id')),
+)
+project_table = Table(
+    'projects',
+    metadata,
+    Column('id', Integer, primary_key=True),
+)
+tag_table = Table(
+    'tags',
+    metadata,
+    Column('id', Integer, primary_key=True),
+)
+project_tag_table = Table(
+    'project_tags',
+    metadata,
+    Column('project_id', Integer, ForeignKey('projects.id'), primary_key=True),
+    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
+)
+task_table = Table(
+    'tasks',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('project_id', Integer, ForeignKey('projects.id'), nullable=True),
+)
+mapper(Membership, membership_table)
+mapper(TeamMember, team_member_table)
+mapper(Team, team_table, properties={'members': relationship(TeamMember, cascade='all, delete-orphan')})
+mapper(Tag, tag_table)
+mapper(Task, task_table)
+mapper(Project, project_table, properties={
+    'tags': relationship(Tag, secondary=project_tag_table),
+    'tasks': relationship(Task),
+})
+
+
+class MembershipRepository(CRUDRepository[Membership, Tuple[int, int]]):
+    pass
+
+
+class TeamRepository(CRUDRepository[Team, int]):
+    pass
+
+
+class ProjectRepository(CRUDRepository[Project, int]):
+    pass
+
+
+class Fixture:
+    @inject
+    def __init__(self, engine: Engine):
+        injector = get_injector()
+        self.domain_event_dispatcher = RecordingDomainEventDispatcher()
+        injector.binder.bind(DomainEventDispatcher, self.domain_event_dispatcher)
+        injector.binder.bind(MembershipRepository, to=ClassProvider(sqla_crud(MembershipRepository, chunk_size=2)))
+        injector.binder.bind(TeamRepository, to=ClassProvider(sqla_crud(TeamRepository, chunk_size=2)))
+        injector.binder.bind(ProjectRepository, to=ClassProvider(sqla_crud(ProjectRepository, chunk_size=2)))
+        self._engine = engine
+        self.repository = injector.get(MembershipRepository)
+        self.team_repository = injector.get(TeamRepository)
+        self.project_repository = injector.get(ProjectRepository)
+        self.statements: List[Tuple[str, bool]] = []
+        metadata.drop_all(bind=self._engine)
+        metadata.create_all(bind=self._engine)
+        self._engine.execute(
+            membership_table.insert(),
+            *(
+                {'group_id': group_id, 'user_id': user_id, 'role': 'member'}
+                for group_id in (1, 2)
+                for user_id in (1, 2, 3)
+            ),
+        )
+        event.listen(self._engine, 'before_cursor_execute', self._on_before_cursor_execute)
+
+    def execute(self, statement):
+        return self._engine.execute(statement)
+
+    def close(self):
+        event.remove(self._engine, 'before_cursor_execute', self._on_before_cursor_execute)
+
+    def _on_before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, executemany))
+
+
+@pytest.fixture()
+def fixture():
+    fixture = get_injector().get(Fixture)
+    yield fixture
+    fixture.close()
+
+
+def test_find_all_by_id_loads_entities_in_chunks(fixture):
+    ids = [(2, 3), (1, 1), (5, 5), (1, 2), (1, 1), (2, 1)]
+
+    # Act
+    entities = fixture.repository.find_all_by_id(ids)
+
+    # Assert
+    assert [(entity.group_id, entity.user_id) for entity in entities] == [(2, 3), (1, 1), (1, 2), (1, 1), (2, 1)]
+    assert entities[1] is entities[3]
+    assert len(fixture.statements) == 3
+
+
+def test_find_all_by_id_fills_identity_map(fixture):
+    entity = fixture.repository.find_by_id((1, 2))
+    fixture.statements.clear()
+
+    # Act
+    entities = fixture.repository.find_all_by_id([(1, 1), (1, 2)])
+    found_entity = fixture.repository.find_by_id((1, 1))
+
+    # Assert
+    assert entities == [found_entity, entity]
+    assert len(fixture.statements) == 1
+
+
+def test_entities_found_together_are_saved_and_deleted_separately(fixture):
+    entity_1, entity_2 = fixture.repository.find_all_by_id([(1, 1), (1, 2)])
+    entity_1.role = 'admin'
+
+    # Act
+    fixture.repository.delete(entity_2)
+    fixture.repository.save(entity_1)
+
+    # Assert
+    rows = fixture.execute(membership_table.select().where(membership_table.c.group_id == 1)).fetchall()
+    assert [tuple(row) for row in rows] == [(1, 1, 'admin'), (1, 3, 'member')]
+
+
+def test_entities_are_deleted_and_checked_by_composite_id(fixture):
+    # Act
+    fixture.repository.delete_by_id((1, 1))
+
+    # Assert
+    assert not fixture.repository.exists_by_id((1, 1))
+    assert fixture.repository.exists_by_id((1, 2))
+
+
+def test_find_all_pages_through_entities(fixture):
+    entity = fixture.repository.find_by_id((2, 1))
+    fixture.statements.clear()
+
+    # Act
+    entities = fixture.repository.find_all()
+
+    # Assert
+    assert [(entity.group_id, entity.user_id) for entity in entities] == [
+        (1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (2, 3),
+    ]
+    assert entities[3] is entity
+    assert len(fixture.statements) == 4
+    assert all('LIMIT' in statement for statement, _ in fixture.statements)
+
+
+def test_save_many_inserts_and_updates_entities_in_batches(fixture):
+    memberships = fixture.repository.find_all_by_id([(1, 1), (1, 2)])
+    for membership in memberships:
+        membership.promote()
+    new_memberships = [Membership(3, user_id, 'member') for user_id in (1, 2, 3)]
+    fixture.statements.clear()
+
+    # Act
+    fixture.repository.save_many([*memberships, *new_memberships])
+
+    # Assert
+    assert [
+        (statement.split()[0], executemany)
+        for statement, executemany in fixture.statements
+    ] == [('UPDATE', True), ('INSERT', True)]
+    assert fixture.repository.find_by_id((3, 2)) is new_memberships[1]
+    assert fixture.repository.count() == 9
+    assert [len(events) for events in fixture.domain_event_dispatcher.dispatched_events] == [2]
+
+
+def test_delete_many_deletes_entities_in_chunks(fixture):
+    memberships = fixture.repository.find_all_by_id([(1, 1), (1, 3), (2, 2)])
+    fixture.statements.clear()
+
+    # Act
+    fixture.repository.delete_many(memberships)
+
+    # Assert
+    assert [statement.split()[0] for statement, _ in fixture.statements] == ['DELETE', 'DELETE']
+    rows = fixture.execute(membership_table.select().order_by(membership_table.c.group_id, membership_table.c.user_id))
+    assert [(row.group_id, row.user_id) for row in rows] == [(1, 2), (2, 1), (2, 3)]
+    assert fixture.repository.find_all_by_id([(1, 1), (1, 3), (2, 2)]) == []
+
+
+def test_delete_many_deletes_entities_with_cascades_by_session(fixture):
+    fixture.team_repository.save_many([Team(1, [TeamMember(1), TeamMember(2)]), Team(2, [TeamMember(3)])])
+    teams = fixture.team_repository.find_all_by_id([1, 2])
+
+    # Act
+    fixture.team_repository.delete_many(teams)
+
+    # Assert
+    assert fixture.team_repository.count() == 0
+    assert fixture.execute(team_member_table.select()).fetchall() == []
+
+
+def test_delete_many_deletes_entities_with_relationships_by_session(fixture):
+    fixture.project_repository.save_many([
+        Project(1, [Tag(1), Tag(2)], [Task(1), Task(2)]),
+        Project(2, [Tag(3)], [Task(3)]),
+    ])
+    projects = fixture.project_repository.find_all_by_id([1, 2])
+
+    # Act
+    fixture.project_repository.delete_many(projects)
+
+    # Assert
+    assert fixture.project_repository.count() == 0
+    assert fixture.execute(project_tag_table.select()).fetchall() == []
+    assert [row.id for row in fixture.execute(tag_table.select().order_by(tag_table.c.id))] == [1, 2, 3]
+    assert fixture.execute(task_table.select().order_by(task_table.c.id)).fetchall() == [
+        (1, None), (2, None), (3, None),
+    ]
+
+
+def test_delete_many_deletes_entities_with_delete_listeners_by_session(fixture):
+    memberships = fixture.repository.find_all_by_id([(1, 1), (2, 2)])
+    deleted_ids = []
+
+    def on_after_delete(mapper, connection, target):
+        deleted_ids.append((target.group_id, target.user_id))
+
+    event.listen(Membership, 'after_delete', on_after_delete)
+    try:
+        # Act
+        fixture.repository.delete_many(memberships)
+    finally:
+        event.remove(Membership, 'after_delete', on_after_delete)
+
+    # Assert
+    assert sorted(deleted_ids) == [(1, 1), (2, 2)]
+    assert fixture.repository.count() == 4
+
+
+def test_stream_all_fetches_entities_in_batches(fixture):
+    entity = fixture.repository.find_by_id((2, 1))
+    fixture.statements.clear()
+
+    # Act
+    entities = list(fixture.repository.stream_all(batch_size=4))
+
+    # Assert
+    assert [(entity.group_id, entity.user_id) for entity in entities] == [
+        (1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (2, 3),
+    ]
+    assert entities[3] is entity
+    assert len(fixture.statements) == 1
+
+
+def test_stream_all_releases_entities_after_each_batch(fixture):
+    references = []
+
+    # Act
+    for membership in fixture.repository.stream_all(batch_size=2):
+        references.append(weakref.ref(membership))
+    del membership
+    gc.collect()
+
+    # Assert
+    assert len(references) == 6
+    assert all(reference() is None for reference in references)
+
+
+def test_stream_all_entities_are_saved_as_loaded(fixture):
+    stream = fixture.repository.stream_all(batch_size=2)
+    membership = next(stream)
+    stream.close()
+    membership.role = 'admin'
+    fixture.statements.clear()
+
+    # Act
+    fixture.repository.save(membership)
+
+    # Assert
+    assert [statement.split()[0] for statement, _ in fixture.statements] == ['UPDATE']
+    assert fixture.repository.find_by_id((1, 1)) is membership
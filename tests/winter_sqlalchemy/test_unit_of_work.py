@@ -0,0 +1,264 @@
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from django.test import RequestFactory
+from injector import ClassProvider
+from injector import inject
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import mapper
+
+from tests.api.api_with_unit_of_work import Record
+from tests.api.api_with_unit_of_work import RecordRepository
+from tests.api.api_with_unit_of_work import record_table
+from tests.api.api_with_unit_of_work import metadata as record_metadata
+from winter.core import get_injector
+from winter.data import CRUDRepository
+from winter_ddd import AggregateRoot
+from winter_ddd import DomainEvent
+from winter_ddd import DomainEventDispatcher
+from winter_ddd import domain_event_handler
+from winter_sqlalchemy import UnitOfWorkInterceptor
+from winter_sqlalchemy import end_unit_of_work
+from winter_sqlalchemy import get_current_unit_of_work
+from winter_sqlalchemy import sqla_crud
+from winter_sqlalchemy import unit_of_work_scope
+
+
+@dataclass
+class ArchivedDomainEvent(DomainEvent):
+    document: 'Document'
+
+
+class Document(AggregateRoot):
+    def __init__(self, id_: int, title: str):
+        super().__init__()
+        self.id = id_
+        self.title = title
+
+    def archive(self):
+        self.title = 'archived'
+        self.domain_events.register(ArchivedDomainEvent(self))
+
+
+metadata = MetaData()
+document_table = Table(
+    'documents',
+    metadata,
+    Column('id', Integer, primary_key=True),
+    Column('title', String),
+)
+mapper(Document, document_table)
+
+
+class DocumentRepository(CRUDRepository[Document, int]):
+    pass
+
+
+class DomainEventHandlers:
+    @inject
+    def __init__(self, repository: DocumentRepository):
+        self._repository = repository
+
+    @domain_event_handler
+    def on_archived(self, event: ArchivedDomainEvent):
+        self._repository.save(Document(event.document.id * 100, 'copy'))
+
+
+class Fixture:
+    @inject
+    def __init__(self, engine: Engine):
+        injector = get_injector()
+        domain_event_dispatcher = DomainEventDispatcher()
+        domain_event_dispatcher.add_handlers_from_class(DomainEventHandlers)
+        injector.binder.bind(DomainEventDispatcher, domain_event_dispatcher)
+        injector.binder.bind(DocumentRepository, to=ClassProvider(sqla_crud(DocumentRepository)))
+        self.engine = engine
+        self.repository = injector.get(DocumentRepository)
+        self.statements: List[str] = []
+        metadata.drop_all(bind=self.engine)
+        metadata.create_all(bind=self.engine)
+        self.engine.execute(document_table.insert(), {'id': 1, 'title': 'first'}, {'id': 2, 'title': 'second'})
+        event.listen(self.engine, 'before_cursor_execute', self._on_before_cursor_execute)
+
+    def close(self):
+        event.remove(self.engine, 'before_cursor_execute', self._on_before_cursor_execute)
+
+    def get_titles(self):
+        return dict(self.engine.execute('SELECT id, title FROM documents ORDER BY id').fetchall())
+
+    def _on_before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+
+@pytest.fixture()
+def fixture():
+    fixture = get_injector().get(Fixture)
+    yield fixture
+    fixture.close()
+
+
+def test_unit_of_work_commits_changes_together(fixture):
+    with unit_of_work_scope() as unit_of_work:
+        # Act
+        documents = fixture.repository.find_all_by_id([1, 2])
+        for document in documents:
+            document.archive()
+        fixture.repository.save_many(documents)
+        count = fixture.repository.count()
+
+        # Assert
+        assert fixture.repository.find_by_id(1) is documents[0]
+        assert get_current_unit_of_work() is unit_of_work
+
+    assert get_current_unit_of_work() is None
+    assert count == 4
+    assert fixture.get_titles() == {1: 'archived', 2: 'archived', 100: 'copy', 200: 'copy'}
+    assert sum(statement.startswith('UPDATE') for statement in fixture.statements) == 1
+
+
+def test_unit_of_work_is_rolled_back_on_exception(fixture):
+    with pytest.raises(ValueError):
+        with unit_of_work_scope():
+            fixture.repository.delete_many(fixture.repository.find_all())
+            fixture.repository.save(Document(3, 'third'))
+            raise ValueError()
+
+    assert fixture.get_titles() == {1: 'first', 2: 'second'}
+
+
+def test_nested_scope_joins_unit_of_work(fixture):
+    with unit_of_work_scope() as unit_of_work:
+        # Act
+        with unit_of_work_scope() as nested_unit_of_work:
+            fixture.repository.save(Document(3, 'third'))
+
+        # Assert
+        assert nested_unit_of_work is unit_of_work
+        assert fixture.repository.exists_by_id(3)
+
+    assert fixture.get_titles() == {1: 'first', 2: 'second', 3: 'third'}
+
+
+def test_unit_of_work_deletes_entities_by_id(fixture):
+    with unit_of_work_scope():
+        document = fixture.repository.find_by_id(1)
+
+        # Act
+        fixture.repository.delete_by_id(1)
+        fixture.repository.delete_by_id(2)
+
+        # Assert
+        assert not fixture.repository.exists_by_id(1)
+        assert not fixture.repository.exists_by_id(2)
+
+    assert fixture.repository.find_by_id(1) is not document
+    assert fixture.get_titles() == {}
+
+
+def test_unit_of_work_deletes_all_entities(fixture, record_repository):
+    with unit_of_work_scope():
+        documents = fixture.repository.find_all_by_id([1, 2])
+        record = Record(1)
+        record_repository.save(record)
+
+        # Act
+        fixture.repository.delete_all()
+
+        # Assert
+        assert fixture.repository.find_by_id(documents[0].id) is None
+        assert record_repository.find_by_id(1) is record
+        fixture.repository.save(Document(3, 'third'))
+
+    assert fixture.get_titles() == {3: 'third'}
+
+
+@pytest.mark.parametrize(('exception', 'expected_titles'), (
+    (None, {1: 'first', 2: 'second', 3: 'third'}),
+    (ValueError(), {1: 'first', 2: 'second'}),
+))
+def test_unit_of_work_interceptor(fixture, exception, expected_titles):
+    interceptor = UnitOfWorkInterceptor()
+    request = RequestFactory().get('/')
+
+    # Act
+    interceptor.pre_handle(request)
+    fixture.repository.save(Document(3, 'third'))
+    if exception is None:
+        interceptor.post_handle(request)
+    interceptor.after_completion(request, exception)
+
+    # Assert
+    assert get_current_unit_of_work() is None
+    assert fixture.get_titles() == expected_titles
+
+
+def test_unit_of_work_interceptor_skips_requests_failed_before_pre_handle():
+    interceptor = UnitOfWorkInterceptor()
+
+    # Act
+    interceptor.after_completion(RequestFactory().get('/'), ValueError())
+
+    # Assert
+    assert get_current_unit_of_work() is None
+
+
+def test_end_unit_of_work_without_unit_of_work():
+    # Act
+    with pytest.raises(RuntimeError) as exception_info:
+        end_unit_of_work()
+
+    # Assert
+    assert str(exception_info.value) == 'There is no unit of work in progress'
+
+
+@pytest.fixture()
+def record_repository():
+    injector = get_injector()
+    engine = injector.get(Engine)
+    record_metadata.drop_all(bind=engine)
+    record_metadata.create_all(bind=engine)
+    injector.binder.bind(DomainEventDispatcher, DomainEventDispatcher())
+    injector.binder.bind(RecordRepository, to=ClassProvider(sqla_crud(RecordRepository)))
+    return injector.get(RecordRepository)
+
+
+def test_unit_of_work_interceptor_commits_request_changes(api_client, record_repository):
+    # Act
+    response = api_client.post('/with-unit-of-work/records/?record_id=1')
+
+    # Assert
+    assert response.status_code == 200
+    assert get_current_unit_of_work() is None
+    assert record_repository.count() == 1
+
+
+def test_unit_of_work_interceptor_ends_unit_of_work_if_response_fails(api_client, record_repository):
+    # Act
+    failed_response = api_client.post('/with-unit-of-work/unencodable-records/?record_id=1')
+    response = api_client.post('/with-unit-of-work/records/?record_id=2')
+
+    # Assert
+    assert failed_response.status_code == 500
+    assert response.status_code == 200
+    assert get_current_unit_of_work() is None
+    assert [record.id for record in record_repository.find_all()] == [2]
+
+
+def test_unit_of_work_interceptor_streams_entities_after_commit(api_client, record_repository):
+    engine = get_injector().get(Engine)
+    engine.execute(record_table.insert(), [{'id': record_id} for record_id in range(1, 6)])
+
+    # Act
+    response = api_client.get('/with-unit-of-work/records/?batch_size=2')
+
+    # Assert
+    assert response.status_code == 200
+    assert response.json() == [1, 2, 3, 4, 5]
+    assert get_current_unit_of_work() is None
@@ -67,6 +67,10 @@ class ComponentMethod:
     def full_name(self) -> str:
         return f'{self.component.component_cls.__name__}.{self.name}'
 
+    @cached_property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.func) or inspect.isasyncgenfunction(self.func)
+
     @property
     def arguments(self) -> Tuple[ComponentMethodArgument, ...]:
         return tuple(self._arguments.values())
@@ -4,18 +4,20 @@ import decimal
 import enum
 import inspect
 import re
+import threading
 import uuid
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Iterable
-from typing import List
 from typing import Mapping
 from typing import Optional
+from typing import Set
 from typing import Type
 from typing import TypeVar
 from typing import Union
 from typing import get_args
+from typing import get_type_hints
 
 from dateutil import parser
 
@@ -31,6 +33,10 @@ except ImportError:  # pragma: no cover
     from collections import Sequence  # Old import for versions older than Python3.10
 
 _decoders = {}
+_decoder_compilers: Set[Callable[[Type], Callable]] = set()
+_compiled_decoders: Dict[Type, Callable] = {}
+_decoders_in_compilation: Dict[Type, Callable] = {}
+_compile_lock = threading.RLock()
 
 Item = TypeVar('Item')
 uuid_regexp = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z')
@@ -67,72 +73,139 @@ def json_decoder(type_: Type, validator: Callable = None):
     def wrapper(func):
         decoders = _decoders.setdefault(type_, [])
         decoders.append((func, validator))
+        # Already compiled decoders could have picked another decoder for the type
+        _compiled_decoders.clear()
         return func
 
     return wrapper
 
 
 def json_decode(value, hint_class: Type[Item]) -> Item:
+    return get_decoder(hint_class)(value)
+
+
+def get_decoder(hint_class: Type[Item]) -> Callable[[Any], Item]:
+    """Return the decode function compiled for the type hint, it's compiled on the first use only."""
+    try:
+        return _compiled_decoders[hint_class]
+    except KeyError:
+        pass
+    except TypeError:  # Unhashable type hints are not cached
+        return _compile_decoder(hint_class)
+
+    with _compile_lock:
+        if hint_class in _decoders_in_compilation:
+            return _decoders_in_compilation[hint_class]
+
+        decoder_ = None
+
+        # Recursive types (e.g. a dataclass with a list of itself) refer to the decoder before it's compiled
+        def decode_recursive(value):
+            return decoder_(value)
+
+        _decoders_in_compilation[hint_class] = decode_recursive
+        try:
+            decoder_ = _compile_decoder(hint_class)
+        finally:
+            del _decoders_in_compilation[hint_class]
+        _compiled_decoders[hint_class] = decoder_
+        return decoder_
+
+
+def _compile_decoder(hint_class: Type[Item]) -> Callable[[Any], Item]:
+    decoder_ = _find_decoder(hint_class)
+
+    if decoder_ is None:
+        def decode_invalid_type(value):
+            raise JSONDecodeException.invalid_type(value)
+        return decode_invalid_type
+
+    if decoder_ in _decoder_compilers:
+        return decoder_(hint_class)
+
+    def decode(value):
+        return decoder_(value, hint_class)
+    return decode
+
+
+def _find_decoder(hint_class: Type) -> Optional[Callable]:
     origin_type = get_origin_type(hint_class)
 
     types_ = origin_type.mro() if inspect.isclass(origin_type) else type(origin_type).mro()
 
     for type_ in types_:
-        result = _json_decode(value, hint_class, type_)
-        if result is not dataclasses.MISSING:
-            return result
-    raise JSONDecodeException.invalid_type(value)
+        for decoder_, checker in _decoders.get(type_, []):
+            if checker is None or checker(hint_class):
+                return decoder_
+    return None
+
 
+def _json_decoder_compiler(type_: Type, validator: Callable = None):
+    """Register a function building a decode function specialized for a type hint instead of a decoder."""
+    def wrapper(compiler):
+        _decoder_compilers.add(compiler)
+        return json_decoder(type_, validator)(compiler)
 
-def _json_decode(value, hint_class: Type[Item], type_: Type) -> Optional[Item]:
-    decoders = _decoders.get(type_, [])
+    return wrapper
 
-    for decoder_, checker in decoders:
-        if checker is None or checker(hint_class):
-            return decoder_(value, hint_class)
-    return dataclasses.MISSING
 
+@_json_decoder_compiler(object, validator=is_optional)
+def _compile_optional_decoder(type_: Type[Item]) -> Callable[[Any], Item]:
+    decode_value = get_decoder(type_.__args__[0])
 
-@json_decoder(object, validator=is_optional)
-def decode_optional(value, type_: Type[Item]) -> Item:
-    if value is None:
-        return None
-    type_ = type_.__args__[0]
-    return json_decode(value, type_)
+    def decode(value):
+        if value is None:
+            return None
+        return decode_value(value)
+    return decode
 
 
 def can_be_undefined(type_):
     return is_union(type_) and Undefined in get_union_args(type_)
 
 
-@json_decoder(object, validator=can_be_undefined)
-def decode_undefined(value, type_: Type[Item]) -> Item:
+@_json_decoder_compiler(object, validator=can_be_undefined)
+def _compile_undefined_decoder(type_: Type[Item]) -> Callable[[Any], Item]:
     union_args = get_union_args(type_)
     assert len(union_args) == 2, 'Union with Undefined must have 2 args'
     value_type = union_args[0] if union_args[0] is not Undefined else union_args[1]
-    return json_decode(value, value_type)
-
+    return get_decoder(value_type)
 
-@json_decoder(object, validator=dataclasses.is_dataclass)
-def decode_dataclass(value: Dict[str, Any], type_: Type[Item]) -> Item:
-    if not isinstance(value, Mapping):
-        raise JSONDecodeException.invalid_type(value, 'object')
 
-    errors = {}
-    decoded_data = {}
-    missing_fields = []
-
-    for field in dataclasses.fields(type_):
-        field_data = value.get(field.name, dataclasses.MISSING)
-        field_data = decode_dataclass_field(field_data, field, missing_fields, errors)
-        if field_data is not dataclasses.MISSING:
-            decoded_data[field.name] = field_data
+@_json_decoder_compiler(object, validator=dataclasses.is_dataclass)
+def _compile_dataclass_decoder(type_: Type[Item]) -> Callable[[Any], Item]:
+    field_types = _get_field_types(type_)
+    fields_plan = [
+        (field.name, get_decoder(field_types.get(field.name, field.type)), _get_missing_field_value_getter(field))
+        for field in dataclasses.fields(type_)
+    ]
 
-    if missing_fields:
-        missing_fields = '", "'.join(missing_fields)
-        errors[JSONDecodeException.NON_FIELD_ERROR] = f'Missing fields: "{missing_fields}"'
-    raise_if_errors(errors)
-    return type_(**decoded_data)
+    def decode(value):
+        if not isinstance(value, Mapping):
+            raise JSONDecodeException.invalid_type(value, 'object')
+
+        errors = {}
+        decoded_data = {}
+        missing_fields = []
+
+        for field_name, decode_field, get_missing_field_value in fields_plan:
+            field_data = value.get(field_name, dataclasses.MISSING)
+            try:
+                if field_data is dataclasses.MISSING:
+                    decoded_data[field_name] = get_missing_field_value()
+                else:
+                    decoded_data[field_name] = decode_field(field_data)
+            except JSONDecodeException as e:
+                errors[field_name] = e.errors
+            except _MissingException:
+                missing_fields.append(field_name)
+
+        if missing_fields:
+            missing_fields = '", "'.join(missing_fields)
+            errors[JSONDecodeException.NON_FIELD_ERROR] = f'Missing fields: "{missing_fields}"'
+        raise_if_errors(errors)
+        return type_(**decoded_data)
+    return decode
 
 
 def raise_if_errors(errors: Dict[str, str]):
@@ -140,36 +213,29 @@ def raise_if_errors(errors: Dict[str, str]):
         raise JSONDecodeException(errors)
 
 
-def decode_dataclass_field(
-    value,
-    field: dataclasses.Field,
-    missing_fields: List[str],
-    errors: Dict[str, str],
-):
+def _get_field_types(type_: Type) -> Dict[str, Any]:
+    # Forward references, e.g. of recursive dataclasses, are resolved if they can be
     try:
-        value = _decode_dataclass_field(value, field)
-    except JSONDecodeException as e:
-        errors[field.name] = e.errors
-    except _MissingException:
-        missing_fields.append(field.name)
-    else:
-        return value
-    return dataclasses.MISSING
+        return get_type_hints(type_)
+    except NameError:
+        return {}
 
 
-def _decode_dataclass_field(value, field: dataclasses.Field):
-    if value is not dataclasses.MISSING:
-        return json_decode(value, field.type)
+def _get_missing_field_value_getter(field: dataclasses.Field) -> Callable[[], Any]:
     if field.default is not dataclasses.MISSING:
-        return field.default
+        return lambda: field.default
     if field.default_factory is not dataclasses.MISSING:
-        return field.default_factory()
+        return field.default_factory
     elif is_optional(field.type):
-        return None
+        return lambda: None
     elif can_be_undefined(field.type):
-        return Undefined()
+        return Undefined
     else:
-        raise _MissingException
+        return _raise_missing
+
+
+def _raise_missing():
+    raise _MissingException
 
 
 # noinspection PyUnusedLocal
@@ -257,70 +323,71 @@ def decode_datetime(value, type_) -> datetime.datetime:
         raise JSONDecodeException.cannot_decode(value=value, type_name='datetime')
 
 
-@json_decoder(list)
-@json_decoder(Sequence)
-def decode_list(value, type_) -> list:
-    child_types = getattr(type_, '__args__', [])
-    child_type = child_types[0] if child_types else Any
-
-    if not isinstance(value, Iterable):
-        raise JSONDecodeException.cannot_decode(value=value, type_name='list')
+@_json_decoder_compiler(list)
+@_json_decoder_compiler(Sequence)
+def _compile_list_decoder(type_) -> Callable[[Any], list]:
+    decode_item = get_decoder(_get_child_type(type_))
 
-    updated_value = [
-        json_decode(item, child_type)
-        for item in value
-    ]
-    return updated_value
+    def decode(value):
+        if not isinstance(value, Iterable):
+            raise JSONDecodeException.cannot_decode(value=value, type_name='list')
+        return [decode_item(item) for item in value]
+    return decode
 
 
-@json_decoder(set)
-def decode_set(value, type_) -> set:
-    child_types = getattr(type_, '__args__', [])
-    child_type = child_types[0] if child_types else Any
+@_json_decoder_compiler(set)
+def _compile_set_decoder(type_) -> Callable[[Any], set]:
+    decode_item = get_decoder(_get_child_type(type_))
 
-    if not isinstance(value, Iterable):
-        raise JSONDecodeException.cannot_decode(value=value, type_name='set')
+    def decode(value):
+        if not isinstance(value, Iterable):
+            raise JSONDecodeException.cannot_decode(value=value, type_name='set')
 
-    try:
-        updated_value = {
-            json_decode(item, child_type)
-            for item in value
-        }
-    except TypeError:  # if unhashable type
-        raise JSONDecodeException.cannot_decode(value=value, type_name='set')
+        try:
+            return {decode_item(item) for item in value}
+        except TypeError:  # if unhashable type
+            raise JSONDecodeException.cannot_decode(value=value, type_name='set')
+    return decode
 
-    return updated_value
 
+@_json_decoder_compiler(tuple)
+def _compile_tuple_decoder(type_) -> Callable[[Any], tuple]:
+    decode_item = get_decoder(_get_child_type(type_))
 
-@json_decoder(tuple)
-def decode_tuple(value, type_) -> tuple:
-    child_types = getattr(type_, '__args__', [])
-    child_type = child_types[0] if child_types else Any
+    def decode(value):
+        if not isinstance(value, Iterable):
+            raise JSONDecodeException.cannot_decode(value=value, type_name='list')
+        return tuple(decode_item(item) for item in value)
+    return decode
 
-    if not isinstance(value, Iterable):
-        raise JSONDecodeException.cannot_decode(value=value, type_name='list')
 
-    updated_value = tuple(
-        json_decode(item, child_type)
-        for item in value
-    )
-    return updated_value
+def _get_child_type(type_):
+    child_types = getattr(type_, '__args__', [])
+    return child_types[0] if child_types else Any
 
 
-@json_decoder(dict)
-def decode_dict(value, type_) -> dict:
-    if not isinstance(value, dict):
-        raise JSONDecodeException.cannot_decode(value=value, type_name='object')
+@_json_decoder_compiler(dict)
+def _compile_dict_decoder(type_) -> Callable[[Any], dict]:
     key_and_value_type = get_args(type_)
 
     if not key_and_value_type:
-        return value
+        def decode_any_dict(value):
+            if not isinstance(value, dict):
+                raise JSONDecodeException.cannot_decode(value=value, type_name='object')
+            return value
+        return decode_any_dict
 
     key_type, value_type = key_and_value_type
-
-    keys = [json_decode(key, key_type) for key in value.keys()]
-    values = [json_decode(value_, value_type) for value_ in value.values()]
-    return dict(zip(keys, values))
+    decode_key = get_decoder(key_type)
+    decode_value = get_decoder(value_type)
+
+    def decode(value):
+        if not isinstance(value, dict):
+            raise JSONDecodeException.cannot_decode(value=value, type_name='object')
+        keys = [decode_key(key) for key in value.keys()]
+        values = [decode_value(value_) for value_ in value.values()]
+        return dict(zip(keys, values))
+    return decode
 
 
 @json_decoder(uuid.UUID)
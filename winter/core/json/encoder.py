@@ -14,6 +14,8 @@ import dataclasses
 from django.utils.functional import Promise
 
 _encoder_map: Dict[Type, Tuple[Callable, bool]] = {}
+# Encoders applicable to a type in the order of its MRO, they are collected on the first use of the type
+_encoder_plans: Dict[Type, Tuple[Tuple[Callable, bool], ...]] = {}
 
 NoneType = type(None)
 
@@ -25,10 +27,7 @@ class CannotEncode(Exception):
 class JSONEncoder(json.JSONEncoder):
 
     def default(self, obj):
-        encoders = (_encoder_map.get(base_cls) for base_cls in type(obj).mro())
-        encoders = (encoder for encoder in encoders if encoder is not None)
-
-        for func, need_recursion in encoders:
+        for func, need_recursion in _get_encoder_plan(type(obj)):
             try:
                 obj = func(obj)
             except CannotEncode:
@@ -39,6 +38,29 @@ class JSONEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _get_encoder_plan(type_: Type) -> Tuple[Tuple[Callable, bool], ...]:
+    try:
+        return _encoder_plans[type_]
+    except KeyError:
+        pass
+
+    encoder_plan = []
+    for base_cls in type_.__mro__:
+        encoder = _encoder_map.get(base_cls)
+        if encoder is None:
+            continue
+        func, need_recursion = encoder
+        if func is dataclass_encoder:
+            if not dataclasses.is_dataclass(type_):
+                continue
+            func = _create_dataclass_encoder(type_)
+        encoder_plan.append((func, need_recursion))
+
+    encoder_plan = tuple(encoder_plan)
+    _encoder_plans[type_] = encoder_plan
+    return encoder_plan
+
+
 def register_encoder(func: Callable = None, *, need_recursion: bool = False):
     if func is None:
         return lambda func_: register_encoder(func_, need_recursion=need_recursion)
@@ -55,6 +77,7 @@ def register_encoder(func: Callable = None, *, need_recursion: bool = False):
         f'You can not register "{annotation.__name__}" twice. At first unregister it'
     )
     _encoder_map[annotation] = func, need_recursion
+    _encoder_plans.clear()
     return func
 
 
@@ -147,7 +170,17 @@ def enum_encoder(enum_: enum.Enum):
 def dataclass_encoder(obj: object):
     if not dataclasses.is_dataclass(obj):
         raise CannotEncode
-    return dataclasses.asdict(obj)
+    return _create_dataclass_encoder(type(obj))(obj)
+
+
+def _create_dataclass_encoder(type_: Type) -> Callable:
+    # Nested values are encoded by json itself, so there is no need to copy the whole tree as dataclasses.asdict does
+    field_names = tuple(field.name for field in dataclasses.fields(type_))
+
+    def encode_dataclass(obj):
+        return {field_name: getattr(obj, field_name) for field_name in field_names}
+
+    return encode_dataclass
 
 
 @register_encoder
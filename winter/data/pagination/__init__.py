@@ -1,3 +1,8 @@
+from .cursor import Cursor
+from .cursor import CursorDirection
+from .cursor import InvalidCursorException
+from .cursor_page import CursorPage
+from .cursor_position import CursorPosition
 from .page import Page
 from .page_position import PagePosition
 from .sort import Order
@@ -0,0 +1,59 @@
+import base64
+import binascii
+import enum
+import json
+from typing import Any
+from typing import Tuple
+
+import dataclasses
+
+from winter.core.json import JSONEncoder
+from .sort import Order
+from .sort import Sort
+from .sort import SortDirection
+
+
+class CursorDirection(enum.Enum):
+    NEXT = 'next'
+    PREVIOUS = 'previous'
+
+
+class InvalidCursorException(ValueError):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class Cursor:
+    """
+    Position between two items in a sorted sequence: values of the sort fields of the item next to which
+    the requested items start and the direction in which they are taken.
+    """
+    sort: Sort
+    values: Tuple[Any, ...]
+    direction: CursorDirection = CursorDirection.NEXT
+
+    def __post_init__(self):
+        if len(self.values) != len(self.sort.orders):
+            raise ValueError('Cursor values must match sort fields')
+
+    def encode(self) -> str:
+        data = {
+            's': str(self.sort),
+            'v': self.values,
+            'd': self.direction.value,
+        }
+        encoded_data = json.dumps(data, cls=JSONEncoder, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(encoded_data).rstrip(b'=').decode()
+
+    @staticmethod
+    def decode(encoded_cursor: str) -> 'Cursor':
+        try:
+            padding = '=' * (-len(encoded_cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(encoded_cursor + padding))
+            orders = (
+                Order(field[1:], SortDirection.DESC) if field.startswith('-') else Order(field)
+                for field in data['s'].split(',')
+            )
+            return Cursor(Sort(*orders), tuple(data['v']), CursorDirection(data['d']))
+        except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, AttributeError, ValueError):
+            raise InvalidCursorException(f'Invalid cursor: "{encoded_cursor}"')
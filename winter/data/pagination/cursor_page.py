@@ -0,0 +1,69 @@
+from collections.abc import Mapping
+from typing import Any
+from typing import Generic
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+import dataclasses
+
+from .cursor import Cursor
+from .cursor import CursorDirection
+from .cursor_position import CursorPosition
+from .sort import Sort
+
+T = TypeVar('T')
+
+
+@dataclasses.dataclass(frozen=True)
+class CursorPage(Generic[T]):
+    items: Iterable[T]
+    position: CursorPosition
+    next_cursor: Optional[Cursor] = None
+    previous_cursor: Optional[Cursor] = None
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    @classmethod
+    def from_items(cls, items: Iterable[T], position: CursorPosition) -> 'CursorPage[T]':
+        """
+        Create a page from items fetched in the cursor direction with one extra item after the limit,
+        which tells whether there are more items, e.g. by winter_sqlalchemy.paginate_by_cursor.
+        Cursors are built from the sort fields of the first and the last items, which are taken
+        by attribute or by key for mappings.
+        """
+        if position.sort is None:
+            raise ValueError('Cursor pagination requires sort')
+
+        items = list(items)
+        has_more_items = position.limit is not None and len(items) > position.limit
+        if has_more_items:
+            del items[position.limit:]
+
+        if position.cursor is not None and position.cursor.direction == CursorDirection.PREVIOUS:
+            items.reverse()
+            has_next = True
+            has_previous = has_more_items
+        else:
+            has_next = has_more_items
+            has_previous = position.cursor is not None
+
+        next_cursor = previous_cursor = None
+        if items and has_next:
+            next_cursor = Cursor(position.sort, _get_sort_values(items[-1], position.sort), CursorDirection.NEXT)
+        if items and has_previous:
+            previous_cursor = Cursor(
+                position.sort,
+                _get_sort_values(items[0], position.sort),
+                CursorDirection.PREVIOUS,
+            )
+        return cls(items=items, position=position, next_cursor=next_cursor, previous_cursor=previous_cursor)
+
+
+def _get_sort_values(item: Any, sort: Sort) -> Tuple[Any, ...]:
+    if isinstance(item, Mapping):
+        return tuple(item[order.field] for order in sort.orders)
+    return tuple(getattr(item, order.field) for order in sort.orders)
@@ -0,0 +1,17 @@
+from typing import Optional
+
+import dataclasses
+
+from .cursor import Cursor
+from .sort import Sort
+
+
+@dataclasses.dataclass(frozen=True)
+class CursorPosition:
+    limit: Optional[int] = None
+    cursor: Optional[Cursor] = None
+    sort: Optional[Sort] = None
+
+    def __post_init__(self):
+        if self.limit == 0:
+            object.__setattr__(self, 'limit', None)
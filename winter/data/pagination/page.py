@@ -1,6 +1,7 @@
 from typing import Generic
 from typing import Iterable
 from typing import Iterator
+from typing import Optional
 from typing import TypeVar
 
 import dataclasses
@@ -12,9 +13,40 @@ T = TypeVar('T')
 
 @dataclasses.dataclass(frozen=True)
 class Page(Generic[T]):
-    total_count: int
+    """
+    Total count may be unknown or estimated, then has_next tells whether there is a next page.
+    If has_next is None, it's found from the total count.
+    """
+    total_count: Optional[int]
     items: Iterable[T]
     position: PagePosition
+    has_next: Optional[bool] = dataclasses.field(default=None, kw_only=True)
+    is_total_count_estimated: bool = dataclasses.field(default=False, kw_only=True)
 
     def __iter__(self) -> Iterator[T]:
         return iter(self.items)
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable[T],
+        position: PagePosition,
+        total_count: Optional[int] = None,
+        *,
+        is_total_count_estimated: bool = False,
+    ) -> 'Page[T]':
+        """
+        Create a page from items fetched with one extra item after the limit, which tells whether there is
+        a next page, so that the total count isn't required.
+        """
+        items = list(items)
+        has_next = position.limit is not None and len(items) > position.limit
+        if has_next:
+            del items[position.limit:]
+        return cls(
+            total_count,
+            items,
+            position,
+            has_next=has_next,
+            is_total_count_estimated=is_total_count_estimated,
+        )
@@ -1,6 +1,7 @@
 from abc import abstractmethod
 from typing import Generic
 from typing import Iterable
+from typing import Iterator
 from typing import Optional
 from typing import TypeVar
 from typing import get_args
@@ -67,6 +68,13 @@ class CRUDRepository(Repository[T, K]):
     def get_by_id(self, id_: K) -> T:
         pass
 
+    def stream_all(self, batch_size: int = 1000) -> Iterator[T]:
+        """
+        Iterate over all entities fetching batch_size of them at a time instead of loading all of them at once.
+        Implementations should override it, by default all entities are loaded with find_all.
+        """
+        yield from self.find_all()
+
     @abstractmethod
     def save(self, entity: T) -> T:
         pass
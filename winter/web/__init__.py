@@ -7,6 +7,11 @@ from .exceptions import problem
 from .interceptor import Interceptor
 from .interceptor import InterceptorRegistry
 from .interceptor import interceptor_registry
+from .json_backend import JSONBackend
+from .json_backend import OrjsonJSONBackend
+from .json_backend import StandardJSONBackend
+from .json_backend import create_fastest_json_backend
+from .json_backend import set_json_backend
 from .media_type import InvalidMediaTypeException
 from .media_type import MediaType
 from .output_processor import register_output_processor_resolver
@@ -20,6 +25,7 @@ from .response_header_annotation import response_header
 from .response_header_resolver import ResponseHeaderArgumentResolver
 from .response_header_serializer import response_headers_serializer
 from .response_status_annotation import response_status
+from .server_sent_event import ServerSentEvent
 from .throttling import ThrottlingMisconfigurationException
 from .throttling import RedisThrottlingConfiguration
 from .throttling import set_redis_throttling_configuration
@@ -29,12 +35,15 @@ from .urls import register_url_regexp
 
 def setup():
     from winter.data.exceptions import NotFoundException
+    from winter.data.pagination import InvalidCursorException
     from .exceptions import RedirectException
     from .exceptions.problem_handling import autodiscover_problem_annotations
     from .exceptions.problem_handling import ProblemExceptionHandlerGenerator
     from .exceptions.problem_handling import ProblemExceptionMapper
     from .exceptions.problem_handling_info import ProblemHandlingInfo
     from .exception_handlers import RedirectExceptionHandler
+    from .pagination.cursor_page_processor import CursorPageOutputProcessorResolver
+    from .pagination.cursor_position_argument_resolver import CursorPositionArgumentResolver
     from .pagination.page_processor_resolver import PageOutputProcessorResolver
     from .pagination.page_position_argument_resolver import PagePositionArgumentResolver
     from .path_parameters_argument_resolver import PathParametersArgumentResolver
@@ -45,6 +54,7 @@ def setup():
     from .response_header_serializers import LastModifiedResponseHeaderSerializer
 
     register_output_processor_resolver(PageOutputProcessorResolver())
+    register_output_processor_resolver(CursorPageOutputProcessorResolver())
     response_headers_serializer.add_serializer(DateTimeResponseHeaderSerializer())
     response_headers_serializer.add_serializer(LastModifiedResponseHeaderSerializer())
     arguments_resolver.add_argument_resolver(QueryParameterArgumentResolver())
@@ -53,6 +63,7 @@ def setup():
     arguments_resolver.add_argument_resolver(RequestBodyArgumentResolver())
     arguments_resolver.add_argument_resolver(ResponseHeaderArgumentResolver())
     arguments_resolver.add_argument_resolver(PagePositionArgumentResolver())
+    arguments_resolver.add_argument_resolver(CursorPositionArgumentResolver())
     arguments_resolver.add_argument_resolver(RequestHeaderArgumentResolver())
 
     exception_mapper = ProblemExceptionMapper()
@@ -61,6 +72,10 @@ def setup():
     auto_handle_exceptions = {
         RedirectException: RedirectExceptionHandler,
         NotFoundException: exception_handler_generator.generate(NotFoundException, ProblemHandlingInfo(status=404)),
+        InvalidCursorException: exception_handler_generator.generate(
+            InvalidCursorException,
+            ProblemHandlingInfo(status=400),
+        ),
     }
     for exception_class, handler in auto_handle_exceptions.items():
         exception_handlers_registry.add_handler(exception_class, handler, auto_handle=True)
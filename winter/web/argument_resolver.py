@@ -1,11 +1,14 @@
 import abc
 from abc import abstractmethod
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Mapping
 from typing import MutableMapping
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 
 import django.http
 
@@ -38,6 +41,39 @@ class ArgumentResolver(abc.ABC):
         pass
 
 
+ResolveArgument = Callable[[ComponentMethodArgument, django.http.HttpRequest, MutableMapping[str, str]], Any]
+
+
+class BoundArgumentsResolver:
+    """Resolves arguments of a single method with argument resolvers looked up in advance."""
+
+    def __init__(
+        self,
+        method: ComponentMethod,
+        argument_resolvers: Sequence[Tuple[ComponentMethodArgument, ResolveArgument]],
+    ):
+        self.method = method
+        self._argument_resolvers = tuple(argument_resolvers)
+
+    def resolve_arguments(
+        self,
+        request: django.http.HttpRequest,
+        response_headers: MutableMapping[str, str],
+        context: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        resolved_arguments = {}
+        if context is None:
+            context = {}
+
+        for argument, resolve_argument in self._argument_resolvers:
+            if argument.name in context:
+                resolved_arguments[argument.name] = context[argument.name]
+            else:
+                resolved_arguments[argument.name] = resolve_argument(argument, request, response_headers)
+
+        return resolved_arguments
+
+
 class ArgumentsResolver:
 
     def __init__(self):
@@ -67,6 +103,18 @@ class ArgumentsResolver:
 
         return resolved_arguments
 
+    def bind(self, method: ComponentMethod) -> BoundArgumentsResolver:
+        argument_resolvers = []
+        for argument in method.arguments:
+            try:
+                argument_resolver = self._get_argument_resolver(argument)
+            except ArgumentNotSupported:
+                # Context arguments don't need a resolver, so fail only when the argument is actually resolved
+                argument_resolvers.append((argument, _raise_argument_not_supported))
+            else:
+                argument_resolvers.append((argument, argument_resolver.resolve_argument))
+        return BoundArgumentsResolver(method, argument_resolvers)
+
     def _resolve_argument(
         self,
         argument: ComponentMethodArgument,
@@ -86,4 +134,12 @@ class ArgumentsResolver:
         raise ArgumentNotSupported(argument)
 
 
+def _raise_argument_not_supported(
+    argument: ComponentMethodArgument,
+    request: django.http.HttpRequest,
+    response_headers: MutableMapping[str, str],
+):
+    raise ArgumentNotSupported(argument)
+
+
 arguments_resolver = ArgumentsResolver()
@@ -7,5 +7,6 @@ from .exceptions import RequestDataDecodeException
 from .handlers import ExceptionHandler
 from .handlers import MethodExceptionsManager
 from .handlers import exception_handlers_registry
+from .handlers import get_handle_method
 from .problem import problem
 from .problem_handling_info import ProblemHandlingInfo
@@ -1,6 +1,7 @@
 import abc
 from http import HTTPStatus
 from typing import Dict
+from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import Union
@@ -12,6 +13,8 @@ from .raises import get_raises
 
 NotHandled = object()
 
+_handle_methods: Dict[Type['ExceptionHandler'], ComponentMethod] = {}
+
 
 class ExceptionHandler(abc.ABC):
     @abc.abstractmethod
@@ -31,6 +34,7 @@ class ExceptionHandlersRegistry:
         self._handlers: ExceptionHandlersRegistry.HandlersMap = {}
         self._auto_handle_exceptions = set()
         self._default_handler = DefaultExceptionHandler()
+        self._cache: Dict[Tuple[Type[Exception], bool], ExceptionHandler] = {}
         super().__init__()
 
     def add_handler(
@@ -45,6 +49,7 @@ class ExceptionHandlersRegistry:
 
         if auto_handle:
             self._auto_handle_exceptions.add(exception_cls)
+        self._cache.clear()
 
     def get_handler(
         self,
@@ -52,20 +57,28 @@ class ExceptionHandlersRegistry:
         auto_handled_only: bool = False,
     ) -> ExceptionHandler:
         exception_type = type(exception) if isinstance(exception, Exception) else exception
+        cache_key = (exception_type, auto_handled_only)
 
-        for exception_cls, handler in self._handlers.items():
-            if issubclass(exception_type, exception_cls) and (
-                not auto_handled_only or exception_cls in self._auto_handle_exceptions
-            ):
-                return handler
-
-        return self._default_handler
+        handler = self._cache.get(cache_key)
+        if handler is None:
+            handler = self._cache[cache_key] = self._find_handler(exception_type, auto_handled_only)
+        return handler
 
     def get_default_handler(self) -> ExceptionHandler:
         return self._default_handler
 
     def set_default_handler(self, handler_cls: Type[ExceptionHandler]):
         self._default_handler = handler_cls()
+        self._cache.clear()
+
+    def _find_handler(self, exception_type: Type[Exception], auto_handled_only: bool) -> ExceptionHandler:
+        # The handler of the closest base class wins
+        for exception_cls in exception_type.__mro__:
+            handler = self._handlers.get(exception_cls)
+            if handler is not None and (not auto_handled_only or exception_cls in self._auto_handle_exceptions):
+                return handler
+
+        return self._default_handler
 
 
 class MethodExceptionsManager:
@@ -73,6 +86,8 @@ class MethodExceptionsManager:
         super().__init__()
         self._method = method
         self._handlers_by_exception = get_raises(self._method)
+        # Handler declared for the exception type or None and whether to look only for auto handled exceptions
+        self._cache: Dict[Type[Exception], Tuple[Optional[ExceptionHandler], bool]] = {}
 
     @property
     def declared_exception_classes(self) -> Tuple[Type[Exception], ...]:
@@ -81,13 +96,30 @@ class MethodExceptionsManager:
     def get_handler(self, exception: Union[Type[Exception], Exception]) -> ExceptionHandler:
         exception_type = type(exception) if isinstance(exception, Exception) else exception
 
-        for exception_cls, handler in self._handlers_by_exception.items():
-            if issubclass(exception_type, exception_cls):
-                if handler is not None:
-                    return handler
-                return exception_handlers_registry.get_handler(exception)
-
-        return exception_handlers_registry.get_handler(exception, auto_handled_only=True)
+        resolution = self._cache.get(exception_type)
+        if resolution is None:
+            resolution = self._cache[exception_type] = self._resolve_handler(exception_type)
+
+        handler, auto_handled_only = resolution
+        if handler is not None:
+            return handler
+        # Handlers of the registry may be added later, so the registry is asked every time, it has its own cache
+        return exception_handlers_registry.get_handler(exception_type, auto_handled_only=auto_handled_only)
+
+    def _resolve_handler(self, exception_type: Type[Exception]) -> Tuple[Optional[ExceptionHandler], bool]:
+        for exception_cls in exception_type.__mro__:
+            if exception_cls in self._handlers_by_exception:
+                return self._handlers_by_exception[exception_cls], False
+        return None, True
+
+
+def get_handle_method(handler: ExceptionHandler) -> ComponentMethod:
+    """Return the handle method of the handler, it's created once per handler class."""
+    handler_cls = handler.__class__
+    handle_method = _handle_methods.get(handler_cls)
+    if handle_method is None:
+        handle_method = _handle_methods[handler_cls] = ComponentMethod.get_or_create(handler_cls.handle)
+    return handle_method
 
 
 exception_handlers_registry = ExceptionHandlersRegistry()
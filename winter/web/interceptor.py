@@ -1,22 +1,142 @@
+import re
 from abc import ABC
-from abc import abstractmethod
+from typing import Any
+from typing import List
+from typing import Mapping
+from typing import MutableMapping
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+
+import dataclasses
+import django.http
+
+from winter.core import ComponentMethod
+from .argument_resolver import BoundArgumentsResolver
+from .argument_resolver import arguments_resolver
+from .routing import Route
 
 
 class Interceptor(ABC):
-    @abstractmethod
-    def pre_handle(self, **kwargs):
+    """
+    Hooks are called with arguments resolved the same way as for API methods.
+    Besides, pre_handle may accept "method", post_handle - "method", "result" and "elapsed_time",
+    after_completion - "method", "response", "exception" and "elapsed_time". Elapsed time is in seconds.
+    Hooks that aren't overridden are not called at all.
+    """
+
+    def pre_handle(self, **kwargs):  # pragma: no cover
+        """Called before the API method."""
         pass
 
+    def post_handle(self, **kwargs):  # pragma: no cover
+        """Called after the API method returned the result, in the reverse order."""
+        pass
+
+    def after_completion(self, **kwargs):  # pragma: no cover
+        """
+        Called when the response is ready, even if an exception was raised, in the reverse order.
+        Streaming responses are ready before their content is sent.
+        The response is None if it couldn't be created, then the exception is the one that prevented it.
+        """
+        pass
+
+
+@dataclasses.dataclass(frozen=True)
+class InterceptorHook:
+    interceptor: Interceptor
+    arguments_resolver: BoundArgumentsResolver
+
+    @property
+    def is_async(self) -> bool:
+        return self.arguments_resolver.method.is_async
+
+    def __call__(
+        self,
+        request: django.http.HttpRequest,
+        response_headers: MutableMapping[str, str],
+        context: Mapping[str, Any],
+    ):
+        arguments = self.arguments_resolver.resolve_arguments(request, response_headers, context)
+        return self.arguments_resolver.method(self.interceptor, **arguments)
+
+
+@dataclasses.dataclass(frozen=True)
+class RouteInterceptors:
+    """Hooks of interceptors applicable to a route, hooks which are not overridden are skipped."""
+    pre_handle: Tuple[InterceptorHook, ...]
+    post_handle: Tuple[InterceptorHook, ...]
+    after_completion: Tuple[InterceptorHook, ...]
+
+
+@dataclasses.dataclass(frozen=True)
+class _InterceptorRegistration:
+    interceptor: Interceptor
+    url_patterns: Tuple[re.Pattern, ...]
+    annotations: Tuple[Type, ...]
+
+    def is_applicable(self, route: Route) -> bool:
+        if self.url_patterns and not any(url_pattern.match(route.url_path) for url_pattern in self.url_patterns):
+            return False
+        if self.annotations and not any(_has_annotation(route, annotation) for annotation in self.annotations):
+            return False
+        return True
+
 
 class InterceptorRegistry:
     def __init__(self):
-        self._interceptors = []
+        self._registrations: List[_InterceptorRegistration] = []
 
-    def add_interceptor(self, interceptor: Interceptor):
-        self._interceptors.append(interceptor)
+    def add_interceptor(
+        self,
+        interceptor: Interceptor,
+        *,
+        url_patterns: Sequence[str] = (),
+        annotations: Sequence[Type] = (),
+    ):
+        """
+        The interceptor is applied only to routes which url path matches one of the regular expressions
+        and which method or component is annotated with one of the annotation types, if they are given.
+        """
+        registration = _InterceptorRegistration(
+            interceptor=interceptor,
+            url_patterns=tuple(re.compile(url_pattern) for url_pattern in url_patterns),
+            annotations=tuple(annotations),
+        )
+        self._registrations.append(registration)
 
     def __iter__(self):
-        return iter(self._interceptors)
+        return iter(registration.interceptor for registration in self._registrations)
+
+    def compile(self, route: Route) -> RouteInterceptors:
+        interceptors = [
+            registration.interceptor
+            for registration in self._registrations
+            if registration.is_applicable(route)
+        ]
+        return RouteInterceptors(
+            pre_handle=_create_hooks(interceptors, Interceptor.pre_handle),
+            post_handle=_create_hooks(reversed(interceptors), Interceptor.post_handle),
+            after_completion=_create_hooks(reversed(interceptors), Interceptor.after_completion),
+        )
+
+
+def _create_hooks(interceptors, base_hook) -> Tuple[InterceptorHook, ...]:
+    hooks = []
+    for interceptor in interceptors:
+        hook = getattr(interceptor.__class__, base_hook.__name__)
+        if hook is base_hook:
+            continue
+        method = ComponentMethod.get_or_create(hook)
+        hooks.append(InterceptorHook(interceptor, arguments_resolver.bind(method)))
+    return tuple(hooks)
+
+
+def _has_annotation(route: Route, annotation_type: Type) -> bool:
+    if route.method.annotations.get(annotation_type):
+        return True
+    component = route.method.component
+    return component is not None and bool(component.annotations.get(annotation_type))
 
 
 interceptor_registry = InterceptorRegistry()
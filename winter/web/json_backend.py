@@ -0,0 +1,70 @@
+import abc
+import json
+from typing import Any
+from typing import Union
+
+from winter.core.json import JSONEncoder
+
+
+class JSONBackend(abc.ABC):
+    """Serializes request and response bodies, Winter encoders are applied to the types the backend can't encode."""
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> bytes:  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:  # pragma: no cover
+        pass
+
+
+class StandardJSONBackend(JSONBackend):
+
+    def __init__(self):
+        self._encoder = JSONEncoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj).encode()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonJSONBackend(JSONBackend):
+    """
+    Uses orjson, which must be installed separately.
+    Datetimes and dataclasses are passed to Winter encoders, so the output is the same as of the standard backend
+    except for insignificant whitespace.
+    """
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        self._default = JSONEncoder().default
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, default=self._default, option=self._options)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+def create_fastest_json_backend() -> JSONBackend:
+    try:
+        return OrjsonJSONBackend()
+    except ImportError:
+        return StandardJSONBackend()
+
+
+_json_backend: JSONBackend = StandardJSONBackend()
+
+
+def set_json_backend(backend: JSONBackend):
+    global _json_backend
+    _json_backend = backend
+
+
+def get_json_backend() -> JSONBackend:
+    return _json_backend
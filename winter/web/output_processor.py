@@ -2,8 +2,11 @@ import abc
 import dataclasses
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Type
 
 import django.http
 
@@ -28,19 +31,33 @@ class OutputProcessorAnnotation:
 class IOutputProcessorResolver(abc.ABC):
     """
     Resolves IOutputProcessor for a given body type.
-    Due to python dynamic typing it's called after every API request.
+    Resolvers declaring body_types are asked once per body type, their processor must depend on the body type only.
+    Otherwise, due to python dynamic typing it's called after every API request.
     """
+    body_types: Optional[Tuple[Type, ...]] = None
 
-    @abc.abstractmethod
-    def is_supported(self, body: Any) -> bool:  # pragma: no cover
-        return False
+    def is_supported(self, body: Any) -> bool:
+        return self.body_types is not None and isinstance(body, self.body_types)
 
     @abc.abstractmethod
     def get_processor(self, body: Any) -> IOutputProcessor:  # pragma: no cover
         pass
 
 
+@dataclasses.dataclass(frozen=True)
+class _OutputProcessorPlan:
+    runtime_resolvers: Tuple[IOutputProcessorResolver, ...]
+    output_processor: Optional[IOutputProcessor]
+
+    def get_output_processor(self, body: Any) -> Optional[IOutputProcessor]:
+        for resolver in self.runtime_resolvers:
+            if resolver.is_supported(body):
+                return resolver.get_processor(body)
+        return self.output_processor
+
+
 _registered_resolvers: List[IOutputProcessorResolver] = []
+_output_processor_plans: Dict[Tuple[ComponentMethod, Type], _OutputProcessorPlan] = {}
 
 
 def register_output_processor(method: Callable, output_processor: IOutputProcessor):
@@ -49,13 +66,38 @@ def register_output_processor(method: Callable, output_processor: IOutputProcess
 
 def register_output_processor_resolver(output_processor_resolver: IOutputProcessorResolver):
     _registered_resolvers.append(output_processor_resolver)
+    _output_processor_plans.clear()
 
 
 def get_output_processor(method: ComponentMethod, body: Any) -> Optional[IOutputProcessor]:
+    return _get_output_processor_plan(method, body).get_output_processor(body)
+
+
+def get_method_output_processor(method: ComponentMethod) -> Optional[IOutputProcessor]:
     output_processor_annotation = method.annotations.get_one_or_none(OutputProcessorAnnotation)
     if output_processor_annotation is not None:
         return output_processor_annotation.output_processor
-    for resolver in _registered_resolvers:
-        if resolver.is_supported(body):
-            return resolver.get_processor(body)
     return None
+
+
+def _get_output_processor_plan(method: ComponentMethod, body: Any) -> _OutputProcessorPlan:
+    cache_key = (method, type(body))
+    output_processor_plan = _output_processor_plans.get(cache_key)
+    if output_processor_plan is None:
+        output_processor_plan = _output_processor_plans[cache_key] = _compile_output_processor_plan(method, body)
+    return output_processor_plan
+
+
+def _compile_output_processor_plan(method: ComponentMethod, body: Any) -> _OutputProcessorPlan:
+    output_processor = get_method_output_processor(method)
+    if output_processor is not None:
+        return _OutputProcessorPlan(runtime_resolvers=(), output_processor=output_processor)
+
+    # Resolvers not declaring body types are kept to be asked on every call in the order of registration
+    runtime_resolvers = []
+    for resolver in _registered_resolvers:
+        if resolver.body_types is None:
+            runtime_resolvers.append(resolver)
+        elif isinstance(body, resolver.body_types):
+            return _OutputProcessorPlan(tuple(runtime_resolvers), resolver.get_processor(body))
+    return _OutputProcessorPlan(tuple(runtime_resolvers), None)
@@ -1,3 +1,4 @@
+from .cursor_position_argument_resolver import CursorPositionArgumentResolver
 from .limits import limits
 from .order_by import order_by
 from .page_position_argument_resolver import PagePositionArgumentResolver
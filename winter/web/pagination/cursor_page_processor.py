@@ -0,0 +1,46 @@
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+import django.http
+
+from winter.data.pagination import Cursor
+from winter.data.pagination import CursorPage
+from winter.web.output_processor import IOutputProcessor
+from winter.web.output_processor import IOutputProcessorResolver
+from .utils import UrlTemplate
+
+
+class CursorPageProcessor(IOutputProcessor):
+
+    def __init__(self, cursor_name: str = 'cursor'):
+        self._cursor_name = cursor_name
+
+    def process_output(self, output: CursorPage, request: django.http.HttpRequest) -> Dict:
+        next_cursor = _encode_cursor(output.next_cursor)
+        previous_cursor = _encode_cursor(output.previous_cursor)
+        url_template = UrlTemplate(request, (self._cursor_name,))
+        return {
+            'meta': {
+                'limit': output.position.limit,
+                'next_cursor': next_cursor,
+                'previous_cursor': previous_cursor,
+                'next': next_cursor and url_template.build({self._cursor_name: next_cursor}),
+                'previous': previous_cursor and url_template.build({self._cursor_name: previous_cursor}),
+            },
+            'objects': output.items,
+        }
+
+
+class CursorPageOutputProcessorResolver(IOutputProcessorResolver):
+    body_types = (CursorPage,)
+
+    def __init__(self):
+        self._cursor_page_processor = CursorPageProcessor()
+
+    def get_processor(self, body: Any) -> CursorPageProcessor:
+        return self._cursor_page_processor
+
+
+def _encode_cursor(cursor: Optional[Cursor]) -> Optional[str]:
+    return cursor and cursor.encode()
@@ -0,0 +1,94 @@
+from typing import MutableMapping
+from typing import Optional
+
+import django.http
+
+from winter.core import ComponentMethod
+from winter.core import ComponentMethodArgument
+from winter.core.json import JSONDecodeException
+from winter.core.json import json_decode
+from winter.core.utils import PositiveInteger
+from winter.data.pagination import Cursor
+from winter.data.pagination import CursorPosition
+from winter.data.pagination import InvalidCursorException
+from winter.data.pagination import Sort
+from winter.web.argument_resolver import ArgumentResolver
+from winter.web.exceptions import RequestDataDecodeException
+from winter.web.pagination.check_sort import check_sort
+from winter.web.pagination.limits import Limits
+from winter.web.pagination.limits import LimitsAnnotation
+from winter.web.pagination.limits import MaximumLimitValueExceeded
+from winter.web.pagination.order_by import OrderByAnnotation
+from winter.web.pagination.parse_sort import parse_sort
+
+
+class CursorPositionArgumentResolver(ArgumentResolver):
+    """
+    Resolves cursor positions from the query string. A cursor is valid only for the sort it was created with,
+    limits are applied the same way as for page positions except for redirecting to the default limit.
+    """
+
+    def __init__(
+        self,
+        limit_name: str = 'limit',
+        cursor_name: str = 'cursor',
+        order_by_name: str = 'order_by',
+    ):
+        self.limit_name = limit_name
+        self.cursor_name = cursor_name
+        self.order_by_name = order_by_name
+        self.limits = Limits(default=None, maximum=None, redirect_to_default=False)
+
+    def is_supported(self, argument: ComponentMethodArgument) -> bool:
+        return argument.type_ is CursorPosition
+
+    def resolve_argument(
+        self,
+        argument: ComponentMethodArgument,
+        request: django.http.HttpRequest,
+        response_headers: MutableMapping[str, str],
+    ) -> CursorPosition:
+        raw_limit = request.GET.get(self.limit_name) or None
+        raw_cursor = request.GET.get(self.cursor_name) or None
+        raw_order_by = request.GET.get(self.order_by_name, '')
+        try:
+            limit = json_decode(raw_limit, Optional[PositiveInteger])
+        except JSONDecodeException as e:
+            raise RequestDataDecodeException(e.errors)
+        sort = self._parse_sort(raw_order_by, argument)
+        cursor = self._parse_cursor(raw_cursor, sort)
+
+        limits = self._get_limits(argument.method)
+        if limit is None:
+            limit = limits.default
+        if limit is not None and limits.maximum is not None and limit > limits.maximum:
+            raise MaximumLimitValueExceeded(limits.maximum)
+
+        return CursorPosition(limit=limit, cursor=cursor, sort=sort)
+
+    def _get_limits(self, method: ComponentMethod) -> Limits:
+        limits_annotation = method.annotations.get_one_or_none(LimitsAnnotation)
+        if limits_annotation is not None:
+            return limits_annotation.limits
+        return self.limits
+
+    def _parse_sort(self, raw_order_by: str, argument: ComponentMethodArgument) -> Optional[Sort]:
+        sort = parse_sort(raw_order_by)
+        order_by_annotation = argument.method.annotations.get_one_or_none(OrderByAnnotation)
+
+        if sort is None or order_by_annotation is None:
+            return order_by_annotation and order_by_annotation.default_sort
+        check_sort(sort, order_by_annotation.allowed_fields)
+
+        return sort
+
+    def _parse_cursor(self, raw_cursor: Optional[str], sort: Optional[Sort]) -> Optional[Cursor]:
+        if raw_cursor is None:
+            return None
+        try:
+            cursor = Cursor.decode(raw_cursor)
+        except InvalidCursorException as e:
+            raise RequestDataDecodeException(str(e))
+        if cursor.sort != sort:
+            raise RequestDataDecodeException(f'Cursor does not match the order: "{raw_cursor}"')
+        return cursor
@@ -1,29 +1,46 @@
 import dataclasses
 from typing import Dict
+from typing import Tuple
+from typing import Type
 
 import django.http
 
 from winter.data.pagination import Page
 from winter.web.output_processor import IOutputProcessor
-from .utils import get_next_page_url
-from .utils import get_previous_page_url
+from .utils import PageUrlBuilder
 
 
 class PageProcessor(IOutputProcessor):
 
+    def __init__(self):
+        self._extra_field_names: Dict[Type[Page], Tuple[str, ...]] = {}
+
     def process_output(self, output: Page, request: django.http.HttpRequest) -> Dict:
-        extra_fields = set(dataclasses.fields(output)) - set(dataclasses.fields(Page))
+        page_url_builder = PageUrlBuilder(request)
         return {
             'meta': {
                 'total_count': output.total_count,
+                'is_total_count_estimated': output.is_total_count_estimated,
                 'limit': output.position.limit,
                 'offset': output.position.offset,
-                'previous': get_previous_page_url(output, request),
-                'next': get_next_page_url(output, request),
+                'previous': page_url_builder.get_previous_page_url(output),
+                'next': page_url_builder.get_next_page_url(output),
                 **{
-                    extra_field.name: getattr(output, extra_field.name)
-                    for extra_field in extra_fields
+                    extra_field_name: getattr(output, extra_field_name)
+                    for extra_field_name in self._get_extra_field_names(type(output))
                 },
             },
             'objects': output.items,
         }
+
+    def _get_extra_field_names(self, page_type: Type[Page]) -> Tuple[str, ...]:
+        extra_field_names = self._extra_field_names.get(page_type)
+        if extra_field_names is None:
+            page_field_names = {field.name for field in dataclasses.fields(Page)}
+            extra_field_names = tuple(
+                field.name
+                for field in dataclasses.fields(page_type)
+                if field.name not in page_field_names
+            )
+            self._extra_field_names[page_type] = extra_field_names
+        return extra_field_names
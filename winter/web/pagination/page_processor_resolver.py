@@ -6,12 +6,10 @@ from .page_processor import PageProcessor
 
 
 class PageOutputProcessorResolver(IOutputProcessorResolver):
+    body_types = (Page,)
 
     def __init__(self):
         self._page_processor = PageProcessor()
 
-    def is_supported(self, body: Any) -> bool:
-        return isinstance(body, Page)
-
     def get_processor(self, body: Any) -> PageProcessor:
         return self._page_processor
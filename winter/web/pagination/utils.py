@@ -1,47 +1,106 @@
+from functools import cached_property
+from typing import Any
+from typing import List
+from typing import Mapping
 from typing import Optional
+from typing import Tuple
+from urllib.parse import unquote_plus
 
 import django.http
-from furl import furl
 
 from winter.data.pagination import Page
 
+_LIMIT = 'limit'
+_OFFSET = 'offset'
 
-def get_previous_page_url(page: Page, request: django.http.HttpRequest) -> Optional[str]:
-    offset = page.position.offset
-    limit = page.position.limit
 
-    if not offset or limit is None:
-        return None
+class PageUrlBuilder:
+    """
+    Builds urls of pages next to the requested one.
+    The query string is parsed once and only limit and offset are replaced, other parameters are kept as is.
+    """
 
-    url = furl(request.get_full_path())
-    url.query.set([('limit', limit)])
+    def __init__(self, request: django.http.HttpRequest):
+        self._request = request
 
-    previous_offset = offset - limit
+    def get_previous_page_url(self, page: Page) -> Optional[str]:
+        offset = page.position.offset
+        limit = page.position.limit
 
-    if previous_offset <= 0:
-        url.query.remove('offset')
-    else:
-        url.query.set([('offset', previous_offset)])
+        if not offset or limit is None:
+            return None
 
-    return url.tostr()
+        previous_offset = offset - limit
+        return self._build_url(limit, previous_offset if previous_offset > 0 else None)
 
+    def get_next_page_url(self, page: Page) -> Optional[str]:
+        offset = page.position.offset or 0
+        limit = page.position.limit
 
-def get_next_page_url(page: Page, request: django.http.HttpRequest) -> Optional[str]:
-    offset = page.position.offset or 0
-    limit = page.position.limit
-    total = page.total_count
+        if limit is None:
+            return None
+
+        next_offset = offset + limit
+
+        if page.has_next is not None:
+            has_next = page.has_next
+        else:
+            has_next = page.total_count is not None and next_offset < page.total_count
+
+        if not has_next:
+            return None
+
+        return self._build_url(limit, next_offset)
+
+    def _build_url(self, limit: int, offset: Optional[int]) -> str:
+        return self._url_template.build({_LIMIT: limit, _OFFSET: offset})
+
+    @cached_property
+    def _url_template(self) -> 'UrlTemplate':
+        return UrlTemplate(self._request, (_LIMIT, _OFFSET))
 
-    if limit is None:
-        return None
 
-    next_offset = offset + limit
+class UrlTemplate:
+    """
+    The request url where the given query parameters are replaced, the query string is parsed only once.
+    Other parameters are kept as is.
+    """
 
-    if next_offset >= total:
-        return None
+    def __init__(self, request: django.http.HttpRequest, parameter_names: Tuple[str, ...]):
+        self._path, self._query_template = self._parse(request.get_full_path(), parameter_names)
 
-    url = furl(request.get_full_path())
-    url.query.set([
-        ('limit', limit),
-        ('offset', next_offset),
-    ])
-    return url.tostr()
+    def build(self, values: Mapping[str, Optional[Any]]) -> str:
+        """Parameters with None values are omitted."""
+        query = '&'.join(
+            part if part not in values else f'{part}={values[part]}'
+            for part in self._query_template
+            if part not in values or values[part] is not None
+        )
+        return f'{self._path}?{query}' if query else self._path
+
+    @staticmethod
+    def _parse(full_path: str, parameter_names: Tuple[str, ...]) -> Tuple[str, List[str]]:
+        """Path and query parts, where the parameters are replaced with their names."""
+        path, _, query_string = full_path.partition('?')
+        query_template: List[str] = []
+        for part in query_string.split('&'):
+            if not part:
+                continue
+            name = unquote_plus(part.split('=', 1)[0])
+            if name not in parameter_names:
+                query_template.append(part)
+            elif name not in query_template:
+                query_template.append(name)
+
+        for name in parameter_names:
+            if name not in query_template:
+                query_template.append(name)
+        return path, query_template
+
+
+def get_previous_page_url(page: Page, request: django.http.HttpRequest) -> Optional[str]:
+    return PageUrlBuilder(request).get_previous_page_url(page)
+
+
+def get_next_page_url(page: Page, request: django.http.HttpRequest) -> Optional[str]:
+    return PageUrlBuilder(request).get_next_page_url(page)
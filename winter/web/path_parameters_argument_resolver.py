@@ -1,11 +1,15 @@
+from typing import Mapping
 from typing import MutableMapping
 
 import django.http
 from django.urls import get_resolver
 
 from winter.core import ComponentMethodArgument
+from winter.core.json import JSONDecodeException
+from winter.core.json import json_decode
 from .argument_resolver import ArgumentNotSupported
 from .argument_resolver import ArgumentResolver
+from .exceptions import RequestDataDecodeException
 from .routing import get_route
 
 
@@ -34,10 +38,19 @@ class PathParametersArgumentResolver(ArgumentResolver):
         request: django.http.HttpRequest,
         response_headers: MutableMapping[str, str],
     ):
-        resolver_match = self._url_resolver.resolve(request.path_info)
-        callback, callback_args, callback_kwargs = resolver_match
+        path_variables = self._get_path_variables(request)
 
-        if argument.name not in callback_kwargs:
+        if argument.name not in path_variables:
             raise ArgumentNotSupported(argument)
 
-        return argument.type_(callback_kwargs[argument.name])
+        try:
+            return json_decode(path_variables[argument.name], argument.type_)
+        except JSONDecodeException as e:
+            raise RequestDataDecodeException(e.errors)
+
+    def _get_path_variables(self, request: django.http.HttpRequest) -> Mapping[str, str]:
+        # Django has already matched the URL before calling the view, so reuse the match when it's available
+        resolver_match = getattr(request, 'resolver_match', None)
+        if resolver_match is None:
+            resolver_match = self._url_resolver.resolve(request.path_info)
+        return resolver_match.kwargs
@@ -1,4 +1,3 @@
-import json
 from json import JSONDecodeError
 from typing import MutableMapping
 
@@ -7,6 +6,7 @@ import django.http
 from .argument_resolver import ArgumentResolver
 from .exceptions import UnsupportedMediaTypeException
 from .exceptions import RequestDataDecodeException
+from .json_backend import get_json_backend
 from .request_body_annotation import RequestBodyAnnotation
 from ..core import ComponentMethodArgument
 from ..core.json import JSONDecodeException
@@ -30,7 +30,7 @@ class RequestBodyArgumentResolver(ArgumentResolver):
         if 'CONTENT_TYPE' in request.META and request.META['CONTENT_TYPE'] != 'application/json':
             raise UnsupportedMediaTypeException()
         try:
-            return json_decode(json.loads(request.body), argument.type_)
+            return json_decode(get_json_backend().loads(request.body), argument.type_)
         except JSONDecodeException as e:
             raise RequestDataDecodeException(e.errors)
         except JSONDecodeError as e:
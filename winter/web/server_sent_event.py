@@ -0,0 +1,17 @@
+from typing import Any
+from typing import Optional
+
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True)
+class ServerSentEvent:
+    """
+    Event of a route producing MediaType.TEXT_EVENT_STREAM.
+    Strings are sent as data as is, other data is encoded to JSON. Retry is the reconnection time in milliseconds.
+    """
+    data: Any = None
+    event: Optional[str] = None
+    id: Optional[str] = None
+    retry: Optional[int] = None
+    comment: Optional[str] = None
@@ -1,7 +1,10 @@
+import inspect
+from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Iterable
 from typing import List
+from typing import Tuple
 from typing import Type
 
 from winter.core import Component
@@ -35,6 +38,15 @@ class DomainEventDispatcher:
                 self.add_handler(component_method)
 
     def dispatch(self, events: Iterable[DomainEvent]):
+        for handler_method, handler_instance, handler_argument in self._get_handler_calls(events):
+            self._execute_handler(handler_method, handler_instance, handler_argument)
+
+    async def dispatch_async(self, events: Iterable[DomainEvent]):
+        """Handlers may be coroutine functions, they are awaited one by one in the order of subscription."""
+        for handler_method, handler_instance, handler_argument in self._get_handler_calls(events):
+            await self._execute_handler_async(handler_method, handler_instance, handler_argument)
+
+    def _get_handler_calls(self, events: Iterable[DomainEvent]) -> List[Tuple[Callable, Any, Any]]:
         events_grouped_by_subscription: Dict[DomainEventSubscription, List[DomainEvent]] = {}
 
         for event in events:
@@ -44,17 +56,24 @@ class DomainEventDispatcher:
                 events_grouped_by_subscription.setdefault(domain_event_subscription, []).append(event)
 
         injector = get_injector()
+        handler_calls = []
 
         for domain_event_subscription, events in events_grouped_by_subscription.items():
             handler_instance = injector.get(domain_event_subscription.handler_class)
             if domain_event_subscription.collection:
-                self._execute_handler(domain_event_subscription.handler_method, handler_instance, events)
+                handler_calls.append((domain_event_subscription.handler_method, handler_instance, events))
             else:
                 for event in events:
-                    self._execute_handler(domain_event_subscription.handler_method, handler_instance, event)
+                    handler_calls.append((domain_event_subscription.handler_method, handler_instance, event))
+        return handler_calls
 
     def _execute_handler(self, func: Callable, *args, **kwargs):
         """
         The method is intentionally extracted to make it possible to override it externally for logging purposes.
         """
         func(*args, **kwargs)
+
+    async def _execute_handler_async(self, func: Callable, *args, **kwargs):
+        result = func(*args, **kwargs)
+        if inspect.isawaitable(result):
+            await result
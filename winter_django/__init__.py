@@ -1,6 +1,8 @@
 from winter.web import arguments_resolver
 from .http_request_argument_resolver import HttpRequestArgumentResolver
 from .output_template import output_template
+from .streaming import set_heartbeat_interval
+from .sync_executor import set_sync_executor
 from .view import create_django_urls_from_routes
 
 
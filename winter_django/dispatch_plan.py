@@ -0,0 +1,54 @@
+from typing import Optional
+from typing import Type
+
+import dataclasses
+
+from winter.core import ComponentMethod
+from winter.web import MediaType
+from winter.web.argument_resolver import BoundArgumentsResolver
+from winter.web.argument_resolver import arguments_resolver
+from winter.web.default_response_status import get_response_status
+from winter.web.exceptions import MethodExceptionsManager
+from winter.web.interceptor import RouteInterceptors
+from winter.web.interceptor import interceptor_registry
+from winter.web.output_processor import IOutputProcessor
+from winter.web.output_processor import get_method_output_processor
+from winter.web.routing import Route
+from winter.web.routing import RouteAnnotation
+from winter.web.throttling import create_throttle_class
+from winter.web.throttling.throttling import BaseRateThrottle
+from .streaming import get_stream_media_type
+
+
+@dataclasses.dataclass(frozen=True)
+class DispatchPlan:
+    """Everything the dispatcher needs to know about a route, computed only once per route."""
+    route: Route
+    component_cls: Type
+    throttle: Optional[BaseRateThrottle]
+    interceptors: RouteInterceptors
+    arguments_resolver: BoundArgumentsResolver
+    method_exceptions_manager: MethodExceptionsManager
+    response_status: int
+    output_processor: Optional[IOutputProcessor]
+    stream_media_type: MediaType
+
+    @property
+    def method(self) -> ComponentMethod:
+        return self.route.method
+
+
+def compile_dispatch_plan(route: Route) -> DispatchPlan:
+    method = route.method
+    route_annotation = method.annotations.get_one(RouteAnnotation)
+    return DispatchPlan(
+        route=route,
+        component_cls=method.component.component_cls,
+        throttle=create_throttle_class(route),
+        interceptors=interceptor_registry.compile(route),
+        arguments_resolver=arguments_resolver.bind(method),
+        method_exceptions_manager=MethodExceptionsManager(method),
+        response_status=get_response_status(route.http_method, method),
+        output_processor=get_method_output_processor(method),
+        stream_media_type=get_stream_media_type(route_annotation.produces),
+    )
@@ -0,0 +1,300 @@
+import abc
+import asyncio
+import itertools
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from winter.web import MediaType
+from winter.web import ServerSentEvent
+from winter.web.json_backend import get_json_backend
+from .sync_executor import run_sync
+
+CHUNK_SIZE = 64 * 1024
+
+_exhausted = object()
+_heartbeat_interval: Optional[float] = 15.0
+
+
+def set_heartbeat_interval(seconds: Optional[float]):
+    """
+    Set how often a heartbeat is sent while a stream (e.g. Server-Sent Events) waits for the next item,
+    so that proxies don't close idle connections. Heartbeats are sent by async views only, None disables them.
+    Django 4.2 doesn't notice that an ASGI client has disconnected while a response is streamed,
+    so a stream of such a client goes on (with heartbeats as well) until its items are exhausted.
+    Event sources served under ASGI should end by themselves, e.g. after a timeout.
+    """
+    global _heartbeat_interval
+    _heartbeat_interval = seconds
+
+
+class StreamChunker(abc.ABC):
+    """Encodes streamed items one by one and groups the encoded items into chunks to be sent."""
+    response_headers: Dict[str, str] = {}
+
+    @abc.abstractmethod
+    def add(self, item: Any) -> Optional[bytes]:  # pragma: no cover
+        """Return a chunk when it's ready to be sent."""
+        pass
+
+    @abc.abstractmethod
+    def close(self) -> bytes:  # pragma: no cover
+        """Return the rest of the stream."""
+        pass
+
+    def heartbeat(self) -> Optional[bytes]:
+        """Return a chunk to keep the connection alive if the media type allows it."""
+        return None
+
+
+class JSONArrayChunker(StreamChunker):
+    """Encodes items to a JSON array the same way as json.dumps does when the standard JSON backend is used."""
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE):
+        self._chunk_size = chunk_size
+        self._json_backend = get_json_backend()
+        self._parts: List[bytes] = [b'[']
+        self._size = 1
+        self._is_first_item = True
+
+    def add(self, item: Any) -> Optional[bytes]:
+        if self._is_first_item:
+            self._is_first_item = False
+        else:
+            self._append(b', ')
+        self._append(self._json_backend.dumps(item))
+
+        if self._size < self._chunk_size:
+            return None
+        return self._flush()
+
+    def close(self) -> bytes:
+        self._append(b']')
+        return self._flush()
+
+    def _append(self, part: bytes):
+        self._parts.append(part)
+        self._size += len(part)
+
+    def _flush(self) -> bytes:
+        chunk = b''.join(self._parts)
+        self._parts = []
+        self._size = 0
+        return chunk
+
+
+class NDJSONChunker(StreamChunker):
+    """Encodes items to newline delimited JSON, every item is sent as soon as it's encoded."""
+
+    def __init__(self):
+        self._json_backend = get_json_backend()
+
+    def add(self, item: Any) -> Optional[bytes]:
+        return self._json_backend.dumps(item) + b'\n'
+
+    def close(self) -> bytes:
+        return b''
+
+
+class ServerSentEventChunker(StreamChunker):
+    """Encodes items to the text/event-stream format, items other than ServerSentEvent are sent as data."""
+    response_headers = {
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    }
+
+    def __init__(self):
+        self._json_backend = get_json_backend()
+
+    def add(self, item: Any) -> Optional[bytes]:
+        if not isinstance(item, ServerSentEvent):
+            item = ServerSentEvent(data=item)
+
+        lines = []
+        if item.comment is not None:
+            lines.extend(f': {line}' for line in item.comment.splitlines())
+        if item.id is not None:
+            lines.append(f'id: {item.id}')
+        if item.event is not None:
+            lines.append(f'event: {item.event}')
+        if item.retry is not None:
+            lines.append(f'retry: {item.retry}')
+        if item.data is not None:
+            data = item.data if isinstance(item.data, str) else self._json_backend.dumps(item.data).decode()
+            lines.extend(f'data: {line}' for line in data.split('\n'))
+        return ('\n'.join(lines) + '\n\n').encode()
+
+    def close(self) -> bytes:
+        return b''
+
+    def heartbeat(self) -> Optional[bytes]:
+        return b': heartbeat\n\n'
+
+
+_stream_chunkers: Dict[MediaType, Type[StreamChunker]] = {
+    MediaType.APPLICATION_JSON: JSONArrayChunker,
+    MediaType.APPLICATION_STREAM_JSON: NDJSONChunker,
+    MediaType.TEXT_EVENT_STREAM: ServerSentEventChunker,
+}
+
+
+def get_stream_media_type(produces: Optional[Tuple[MediaType, ...]]) -> MediaType:
+    """Streaming uses the first media type produced by a route that supports streaming."""
+    for media_type in produces or ():
+        if media_type in _stream_chunkers:
+            return media_type
+    return MediaType.APPLICATION_JSON
+
+
+def create_stream_chunker(media_type: MediaType) -> StreamChunker:
+    return _stream_chunkers[media_type]()
+
+
+def is_streaming_body(body: Any) -> bool:
+    return isinstance(body, (Iterator, AsyncIterator))
+
+
+def to_streaming_body(body: Any, media_type: MediaType) -> Any:
+    """Collections are streamed as well when a route produces a streaming media type other than JSON."""
+    if media_type != MediaType.APPLICATION_JSON and isinstance(body, (list, tuple, set, frozenset)):
+        return iter(body)
+    return body
+
+
+def prefetch(iterator: Iterator) -> Iterator:
+    """
+    Fetch the first item beforehand, so that exceptions raised by a generator before it yields anything
+    are raised inside the API method call and are handled as usual.
+    """
+    first_item = next(iterator, _exhausted)
+    if first_item is _exhausted:
+        return iter(())
+    return itertools.chain((first_item,), iterator)
+
+
+async def prefetch_async(
+    iterator: Union[Iterator, AsyncIterator],
+    is_asgi: bool = True,
+) -> Union[Iterator, AsyncIterator]:
+    if isinstance(iterator, Iterator):
+        return await run_sync(prefetch)(iterator)
+
+    if not is_asgi:
+        # Under WSGI the event loop is closed after the view returns, which finalizes async generators started in it.
+        # Django consumes async streaming content at once under WSGI anyway, so the items are collected right away.
+        return iter([item async for item in iterator])
+
+    first_item = await anext(iterator, _exhausted)
+    if first_item is _exhausted:
+        return _empty_async_iterator()
+    return _chain_async(first_item, iterator)
+
+
+def encode_stream(items: Iterator, chunker: StreamChunker) -> Iterator[bytes]:
+    try:
+        for item in items:
+            chunk = chunker.add(item)
+            if chunk:
+                yield chunk
+        chunk = chunker.close()
+        if chunk:
+            yield chunk
+    finally:
+        # The stream is closed early when the response is closed, so the items source is released right away
+        _close(items)
+
+
+async def encode_stream_async(items: Union[Iterator, AsyncIterator], chunker: StreamChunker) -> AsyncIterator[bytes]:
+    if isinstance(items, Iterator):
+        # Encoding is pulled chunk by chunk in a thread as the items may be fetched with blocking calls
+        chunks = _iterate_in_thread(encode_stream(items, chunker))
+    else:
+        chunks = _encode_async_items(items, chunker)
+
+    heartbeat = chunker.heartbeat()
+    if heartbeat is not None and _heartbeat_interval is not None:
+        chunks = _with_heartbeats(chunks, heartbeat, _heartbeat_interval)
+
+    try:
+        async for chunk in chunks:
+            yield chunk
+    finally:
+        await chunks.aclose()
+
+
+async def _encode_async_items(items: AsyncIterator, chunker: StreamChunker) -> AsyncIterator[bytes]:
+    try:
+        async for item in items:
+            chunk = chunker.add(item)
+            if chunk:
+                yield chunk
+        chunk = chunker.close()
+        if chunk:
+            yield chunk
+    finally:
+        await _close_async(items)
+
+
+async def _with_heartbeats(chunks: AsyncIterator[bytes], heartbeat: bytes, interval: float) -> AsyncIterator[bytes]:
+    next_chunk = None
+    try:
+        while True:
+            if next_chunk is None:
+                next_chunk = asyncio.ensure_future(anext(chunks, _exhausted))
+            done, _ = await asyncio.wait((next_chunk,), timeout=interval)
+            if not done:
+                yield heartbeat
+                continue
+            chunk = next_chunk.result()
+            next_chunk = None
+            if chunk is _exhausted:
+                return
+            yield chunk
+    finally:
+        if next_chunk is not None:
+            next_chunk.cancel()
+            await asyncio.gather(next_chunk, return_exceptions=True)
+        await _close_async(chunks)
+
+
+async def _iterate_in_thread(iterator: Iterator) -> AsyncIterator:
+    try:
+        while True:
+            item = await run_sync(next)(iterator, _exhausted)
+            if item is _exhausted:
+                return
+            yield item
+    finally:
+        await run_sync(_close)(iterator)
+
+
+def _close(iterator: Iterator):
+    close = getattr(iterator, 'close', None)
+    if close is not None:
+        close()
+
+
+async def _close_async(iterator: AsyncIterator):
+    aclose = getattr(iterator, 'aclose', None)
+    if aclose is not None:
+        await aclose()
+
+
+async def _chain_async(first_item: Any, iterator: AsyncIterator) -> AsyncIterator:
+    try:
+        yield first_item
+        async for item in iterator:
+            yield item
+    finally:
+        await _close_async(iterator)
+
+
+async def _empty_async_iterator() -> AsyncIterator:
+    return
+    yield  # pragma: no cover
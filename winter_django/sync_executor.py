@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable
+from typing import Callable
+from typing import Optional
+
+from asgiref.sync import sync_to_async
+
+_sync_executor: Optional[ThreadPoolExecutor] = None
+
+
+def set_sync_executor(executor: Optional[ThreadPoolExecutor]):
+    """
+    Set thread pool for running synchronous code (e.g. sync API methods) from async views.
+    By default, it runs in the thread shared with other thread sensitive code, the same way as Django does it.
+    """
+    global _sync_executor
+    _sync_executor = executor
+
+
+def run_sync(func: Callable) -> Callable[..., Awaitable]:
+    if _sync_executor is None:
+        return sync_to_async(func)
+    return sync_to_async(func, thread_sensitive=False, executor=_sync_executor)
@@ -1,31 +1,47 @@
-import json
+import inspect
+import time
 from collections import defaultdict
+from collections.abc import Iterator
 from functools import wraps
 from typing import Any
+from typing import Callable
 from typing import List
+from typing import Optional
 from typing import TYPE_CHECKING
-from typing import Type
+from typing import Tuple
 
 import django.http
+from django.core.handlers.asgi import ASGIRequest
 from django.urls import re_path
 from django.urls import URLPattern
 
-from winter.core import Component
 from winter.core import ComponentMethod
 from winter.core import get_injector
-from winter.core.json import JSONEncoder
+from winter.web import MediaType
 from winter.web import ResponseEntity
 from winter.web import exception_handlers_registry
 from winter.web import response_headers_serializer
 from winter.web.argument_resolver import arguments_resolver
 from winter.web.default_response_status import get_response_status
-from winter.web.exceptions import MethodExceptionsManager
 from winter.web.exceptions import ThrottleException
-from winter.web.interceptor import interceptor_registry
+from winter.web.exceptions import get_handle_method
+from winter.web.interceptor import InterceptorHook
+from winter.web.json_backend import get_json_backend
+from winter.web.output_processor import IOutputProcessor
 from winter.web.output_processor import get_output_processor
 from winter.web.routing import Route
-from winter.web.throttling import create_throttle_class
 from winter.web.urls import rewrite_uritemplate_with_regexps
+from .dispatch_plan import DispatchPlan
+from .dispatch_plan import compile_dispatch_plan
+from .streaming import StreamChunker
+from .streaming import create_stream_chunker
+from .streaming import encode_stream
+from .streaming import encode_stream_async
+from .streaming import is_streaming_body
+from .streaming import prefetch
+from .streaming import prefetch_async
+from .streaming import to_streaming_body
+from .sync_executor import run_sync
 
 if TYPE_CHECKING:
     from django.views.generic import View
@@ -59,8 +75,14 @@ def _create_django_view_from_routes(routes: List[Route]) -> 'View':
         def as_view(cls, **initkwargs):
             return super().as_view(**initkwargs)
 
+    # Django doesn't allow mixing sync and async handlers within a view
+    is_async = any(route.method.is_async for route in routes)
+
     for route in routes:
-        dispatch = _create_dispatch_function(route.method.component.component_cls, route)
+        if is_async:
+            dispatch = _create_async_dispatch_function(route)
+        else:
+            dispatch = _create_dispatch_function(route)
         dispatch.route = route
         dispatch_method_name = route.http_method.lower()
         setattr(WinterView, dispatch_method_name, dispatch)
@@ -68,87 +90,345 @@ def _create_django_view_from_routes(routes: List[Route]) -> 'View':
     return WinterView()
 
 
-def _create_dispatch_function(api_class: Type, route: Route):
-    component = Component.get_by_cls(api_class)
+def _create_dispatch_function(route: Route):
+    get_dispatch_plan = _create_dispatch_plan_getter(route)
 
     @wraps(route.method.func)
     def dispatch(winter_view, request: django.http.HttpRequest, **path_variables):
-        api_class_instance = get_injector().get(component.component_cls)
-        return _call_api(api_class_instance, route, request)
+        dispatch_plan = get_dispatch_plan()
+        api_class_instance = get_injector().get(dispatch_plan.component_cls)
+        return _call_api(api_class_instance, dispatch_plan, request)
+
+    return dispatch
+
+
+def _create_async_dispatch_function(route: Route):
+    get_dispatch_plan = _create_dispatch_plan_getter(route)
+
+    @wraps(route.method.func)
+    async def dispatch(winter_view, request: django.http.HttpRequest, **path_variables):
+        dispatch_plan = get_dispatch_plan()
+        api_class_instance = get_injector().get(dispatch_plan.component_cls)
+        return await _call_api_async(api_class_instance, dispatch_plan, request)
 
     return dispatch
 
 
-def _call_api(api_class_instance, route: Route, request: django.http.HttpRequest):
-    method = route.method
-    method_exceptions_manager = MethodExceptionsManager(method)
+def _create_dispatch_plan_getter(route: Route) -> Callable[[], DispatchPlan]:
+    dispatch_plan: Optional[DispatchPlan] = None
+
+    def get_dispatch_plan() -> DispatchPlan:
+        nonlocal dispatch_plan
+        if dispatch_plan is None:
+            # Argument resolvers and throttling are usually configured after urlpatterns are built,
+            # so the plan is compiled on the first request to the route
+            dispatch_plan = compile_dispatch_plan(route)
+        return dispatch_plan
+
+    return get_dispatch_plan
+
+
+def _call_api(api_class_instance, dispatch_plan: DispatchPlan, request: django.http.HttpRequest):
     response_headers = {}
+    started_at = time.perf_counter()
+    response = None
+    raised_exception = None
+    try:
+        response, raised_exception = _get_response(
+            api_class_instance,
+            dispatch_plan,
+            request,
+            response_headers,
+            started_at,
+        )
+    except Exception as exception:
+        raised_exception = exception
+        raise
+    finally:
+        # Interceptors are completed even if the response can't be created, e.g. the result can't be encoded
+        for after_completion in dispatch_plan.interceptors.after_completion:
+            after_completion(request, response_headers, {
+                'method': dispatch_plan.method,
+                'response': response,
+                'exception': raised_exception,
+                'elapsed_time': time.perf_counter() - started_at,
+            })
+    return response
+
 
-    throttle_class = create_throttle_class(route)
+def _get_response(
+    api_class_instance,
+    dispatch_plan: DispatchPlan,
+    request: django.http.HttpRequest,
+    response_headers: dict,
+    started_at: float,
+) -> Tuple[django.http.HttpResponseBase, Optional[Exception]]:
+    method = dispatch_plan.method
+    interceptors = dispatch_plan.interceptors
+    raised_exception = None
+
+    throttle = dispatch_plan.throttle
     try:
-        if throttle_class and not throttle_class.allow_request(request):
+        if throttle and not throttle.allow_request(request):
             raise ThrottleException()
 
-        for interceptor in interceptor_registry:
-            pre_handle = ComponentMethod.get_or_create(interceptor.__class__.pre_handle)
-            arguments = arguments_resolver.resolve_arguments(
-                pre_handle, request, response_headers, {
-                    'method': method,
-                },
-            )
-            pre_handle(interceptor, **arguments)
+        for pre_handle in interceptors.pre_handle:
+            pre_handle(request, response_headers, {'method': method})
 
-        arguments = arguments_resolver.resolve_arguments(method, request, response_headers)
+        arguments = dispatch_plan.arguments_resolver.resolve_arguments(request, response_headers)
         result = method(api_class_instance, **arguments)
+        if isinstance(result, Iterator):
+            result = prefetch(result)
+
+        for post_handle in interceptors.post_handle:
+            post_handle(request, response_headers, {
+                'method': method,
+                'result': result,
+                'elapsed_time': time.perf_counter() - started_at,
+            })
     except Exception as exception:
-        handler = method_exceptions_manager.get_handler(exception)
-        method = ComponentMethod.get_or_create(handler.__class__.handle)
+        raised_exception = exception
+        handler = dispatch_plan.method_exceptions_manager.get_handler(exception)
+        method = get_handle_method(handler)
         try:
-            arguments = arguments_resolver.resolve_arguments(
-                method, request, response_headers, {
-                    'exception': exception,
-                    'response_headers': response_headers,
-                },
-            )
+            arguments = _resolve_exception_handler_arguments(method, request, response_headers, exception)
             result = method(handler, **arguments)
         except Exception as inner_exception:
             handler = exception_handlers_registry.get_default_handler()
-            method = ComponentMethod.get_or_create(handler.__class__.handle)
-            arguments = arguments_resolver.resolve_arguments(
-                method, request, response_headers, {
-                    'exception': inner_exception,
-                    'response_headers': response_headers,
-                },
-            )
+            method = get_handle_method(handler)
+            arguments = _resolve_exception_handler_arguments(method, request, response_headers, inner_exception)
             result = method(handler, **arguments)
+        response = _convert_result_to_http_response(request, result, method)
+    else:
+        response = _convert_result_to_http_response(
+            request,
+            result,
+            method,
+            response_status=dispatch_plan.response_status,
+            output_processor=dispatch_plan.output_processor,
+            stream_media_type=dispatch_plan.stream_media_type,
+        )
 
-    response = _convert_result_to_http_response(request, result, method)
     _fill_response_headers(response, response_headers)
+    return response, raised_exception
+
+
+async def _call_api_async(api_class_instance, dispatch_plan: DispatchPlan, request: django.http.HttpRequest):
+    response_headers = {}
+    started_at = time.perf_counter()
+    response = None
+    raised_exception = None
+    try:
+        response, raised_exception = await _get_response_async(
+            api_class_instance,
+            dispatch_plan,
+            request,
+            response_headers,
+            started_at,
+        )
+    except Exception as exception:
+        raised_exception = exception
+        raise
+    finally:
+        for after_completion in dispatch_plan.interceptors.after_completion:
+            await _call_hook_async(after_completion, request, response_headers, {
+                'method': dispatch_plan.method,
+                'response': response,
+                'exception': raised_exception,
+                'elapsed_time': time.perf_counter() - started_at,
+            })
     return response
 
 
+async def _get_response_async(
+    api_class_instance,
+    dispatch_plan: DispatchPlan,
+    request: django.http.HttpRequest,
+    response_headers: dict,
+    started_at: float,
+) -> Tuple[django.http.HttpResponseBase, Optional[Exception]]:
+    method = dispatch_plan.method
+    interceptors = dispatch_plan.interceptors
+    raised_exception = None
+
+    throttle = dispatch_plan.throttle
+    try:
+        if throttle and not await run_sync(throttle.allow_request)(request):
+            raise ThrottleException()
+
+        for pre_handle in interceptors.pre_handle:
+            await _call_hook_async(pre_handle, request, response_headers, {'method': method})
+
+        arguments = dispatch_plan.arguments_resolver.resolve_arguments(request, response_headers)
+        if method.is_async:
+            result = await _await_if_needed(method(api_class_instance, **arguments))
+        else:
+            result = await run_sync(method)(api_class_instance, **arguments)
+        if is_streaming_body(result):
+            result = await prefetch_async(result, is_asgi=isinstance(request, ASGIRequest))
+
+        for post_handle in interceptors.post_handle:
+            await _call_hook_async(post_handle, request, response_headers, {
+                'method': method,
+                'result': result,
+                'elapsed_time': time.perf_counter() - started_at,
+            })
+    except Exception as exception:
+        raised_exception = exception
+        handler = dispatch_plan.method_exceptions_manager.get_handler(exception)
+        method = get_handle_method(handler)
+        try:
+            arguments = _resolve_exception_handler_arguments(method, request, response_headers, exception)
+            result = await _await_if_needed(method(handler, **arguments))
+        except Exception as inner_exception:
+            handler = exception_handlers_registry.get_default_handler()
+            method = get_handle_method(handler)
+            arguments = _resolve_exception_handler_arguments(method, request, response_headers, inner_exception)
+            result = await _await_if_needed(method(handler, **arguments))
+        response = await _convert_result_to_http_response_async(request, result, method)
+    else:
+        response = await _convert_result_to_http_response_async(
+            request,
+            result,
+            method,
+            response_status=dispatch_plan.response_status,
+            output_processor=dispatch_plan.output_processor,
+            stream_media_type=dispatch_plan.stream_media_type,
+        )
+
+    _fill_response_headers(response, response_headers)
+    return response, raised_exception
+
+
+def _resolve_exception_handler_arguments(
+    method: ComponentMethod,
+    request: django.http.HttpRequest,
+    response_headers: dict,
+    exception: Exception,
+):
+    return arguments_resolver.resolve_arguments(
+        method, request, response_headers, {
+            'exception': exception,
+            'response_headers': response_headers,
+        },
+    )
+
+
+async def _call_hook_async(
+    hook: InterceptorHook,
+    request: django.http.HttpRequest,
+    response_headers: dict,
+    context: dict,
+):
+    # Sync hooks may block (e.g. commit a transaction), so they don't run on the event loop
+    if hook.is_async:
+        return await hook(request, response_headers, context)
+    return await run_sync(hook)(request, response_headers, context)
+
+
+async def _await_if_needed(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
 def _fill_response_headers(response, response_headers):
     for header_name, header_value in response_headers.items():
         response[header_name] = response_headers_serializer.serialize(header_value, header_name)
     response.content_type = response_headers.get('content-type')
 
 
-def _convert_result_to_http_response(request: django.http.HttpRequest, result: Any, method: ComponentMethod):
+def _convert_result_to_http_response(
+    request: django.http.HttpRequest,
+    result: Any,
+    method: ComponentMethod,
+    response_status: Optional[int] = None,
+    output_processor: Optional[IOutputProcessor] = None,
+    stream_media_type: MediaType = MediaType.APPLICATION_JSON,
+):
     if isinstance(result, django.http.HttpResponse):
         return result
+    body, status_code, output_processor = _get_body_status_and_output_processor(
+        request,
+        result,
+        method,
+        response_status,
+        output_processor,
+    )
+    if output_processor is not None:
+        body = output_processor.process_output(body, request)
+    body = to_streaming_body(body, stream_media_type)
+    if isinstance(body, Iterator):
+        chunker = create_stream_chunker(stream_media_type)
+        streaming_content = encode_stream(body, chunker)
+        return _create_streaming_http_response(streaming_content, status_code, stream_media_type, chunker)
+    return _convert_body_to_http_response(body, status_code)
+
+
+async def _convert_result_to_http_response_async(
+    request: django.http.HttpRequest,
+    result: Any,
+    method: ComponentMethod,
+    response_status: Optional[int] = None,
+    output_processor: Optional[IOutputProcessor] = None,
+    stream_media_type: MediaType = MediaType.APPLICATION_JSON,
+):
+    if isinstance(result, django.http.HttpResponse):
+        return result
+    body, status_code, output_processor = _get_body_status_and_output_processor(
+        request,
+        result,
+        method,
+        response_status,
+        output_processor,
+    )
+    if output_processor is not None:
+        body = await _await_if_needed(output_processor.process_output(body, request))
+    body = to_streaming_body(body, stream_media_type)
+    if is_streaming_body(body):
+        chunker = create_stream_chunker(stream_media_type)
+        streaming_content = encode_stream_async(body, chunker)
+        return _create_streaming_http_response(streaming_content, status_code, stream_media_type, chunker)
+    return _convert_body_to_http_response(body, status_code)
+
+
+def _get_body_status_and_output_processor(
+    request: django.http.HttpRequest,
+    result: Any,
+    method: ComponentMethod,
+    response_status: Optional[int],
+    output_processor: Optional[IOutputProcessor],
+) -> Tuple[Any, int, Optional[IOutputProcessor]]:
     if isinstance(result, ResponseEntity):
         body = result.entity
         status_code = result.status_code
     else:
         body = result
-        status_code = get_response_status(request.method, method)
-    output_processor = get_output_processor(method, body)
-    if output_processor is not None:
-        body = output_processor.process_output(body, request)
+        status_code = response_status if response_status is not None else get_response_status(request.method, method)
+    if output_processor is None:
+        output_processor = get_output_processor(method, body)
+    return body, status_code, output_processor
+
+
+def _convert_body_to_http_response(body: Any, status_code: int):
     if isinstance(body, django.http.response.HttpResponseBase):
         return body
     if body is None:
         content = b''
     else:
-        content = json.dumps(body, cls=JSONEncoder).encode()
+        content = get_json_backend().dumps(body)
     return django.http.HttpResponse(content, status=status_code, content_type='application/json')
+
+
+def _create_streaming_http_response(
+    streaming_content,
+    status_code: int,
+    media_type: MediaType,
+    chunker: StreamChunker,
+):
+    return django.http.StreamingHttpResponse(
+        streaming_content,
+        status=status_code,
+        content_type=str(media_type),
+        headers=chunker.response_headers,
+    )
@@ -1,7 +1,9 @@
+from winter.data.pagination import CursorPage
 from winter.data.pagination import Page
 from winter.web.exceptions import RequestDataDecodeException
 from winter.web.exceptions import ThrottleException
 from winter.web.exceptions import UnsupportedMediaTypeException
+from winter.web.pagination import CursorPositionArgumentResolver
 from winter.web.pagination import PagePositionArgumentResolver
 from winter.web.pagination.limits import MaximumLimitValueExceeded
 from .annotations import global_exception
@@ -9,11 +11,13 @@ from .annotations import register_global_exception
 from .generator import generate_openapi
 from .inspection.inspection import inspect_type
 from .inspection.inspection import register_type_inspector
+from .inspectors import CursorPositionArgumentsInspector
 from .inspectors import PagePositionArgumentsInspector
 from .inspectors import PathParametersInspector
 from .inspectors import QueryParametersInspector
 from .inspectors import RouteParametersInspector
 from .inspectors import get_route_parameters_inspectors
+from .inspectors import inspect_cursor_page
 from .inspectors import inspect_page
 from .inspectors import register_route_parameters_inspector
 from .swagger_ui import get_swagger_ui_html
@@ -26,8 +30,10 @@ def setup(allow_missing_raises_annotation: bool = False):
     register_global_exception(RequestDataDecodeException)
     register_global_exception(UnsupportedMediaTypeException)
     register_type_inspector(Page, func=inspect_page)
+    register_type_inspector(CursorPage, func=inspect_cursor_page)
     register_route_parameters_inspector(PathParametersInspector())
     register_route_parameters_inspector(QueryParametersInspector())
     register_route_parameters_inspector(PagePositionArgumentsInspector(PagePositionArgumentResolver()))
+    register_route_parameters_inspector(CursorPositionArgumentsInspector(CursorPositionArgumentResolver()))
     if not allow_missing_raises_annotation:  # pragma: no cover
         validate_missing_raises_annotations()
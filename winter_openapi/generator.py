@@ -1,3 +1,4 @@
+import collections.abc
 import inspect
 import warnings
 from itertools import groupby
@@ -11,6 +12,8 @@ from typing import Set
 from typing import Tuple
 from typing import Type
 from typing import Union
+from typing import get_args
+from typing import get_origin
 
 from django.http.response import HttpResponseBase
 from openapi_pydantic import schema_validate
@@ -31,9 +34,13 @@ from openapi_pydantic.v3.v3_0 import Server
 from openapi_pydantic.v3.v3_0 import Tag
 
 from winter.core import ComponentMethod
+from winter.core.utils.typing import NoneType
+from winter.core.utils.typing import get_union_args
+from winter.core.utils.typing import is_optional
 from winter.web import MediaType
 from winter.web.default_response_status import get_response_status
 from winter.web.exceptions import MethodExceptionsManager
+from winter.web.exceptions import get_handle_method
 from winter.web.request_body_annotation import RequestBodyAnnotation
 from winter.web.routing import Route
 from winter.web.routing import RouteAnnotation
@@ -323,7 +330,7 @@ def get_responses_schemas(route: Route, schema_registry: SchemaRegistry) -> Resp
 
     for exception_cls in method_exceptions_manager.declared_exception_classes:
         handler = method_exceptions_manager.get_handler(exception_cls)
-        handle_method = ComponentMethod.get_or_create(handler.__class__.handle)
+        handle_method = get_handle_method(handler)
         response_status = str(get_response_status(http_method, handle_method))
         responses[response_status] = _build_response_exception_handler_schema(handle_method, schema_registry)
     return responses
@@ -381,6 +388,20 @@ def determine_path_prefix(url_paths: List[str]) -> str:
     return '/' + '/'.join(common)
 
 
+_ITEM_STREAM_MEDIA_TYPES = (MediaType.APPLICATION_STREAM_JSON, MediaType.TEXT_EVENT_STREAM)
+# Return types streamed item by item, others (e.g. dicts and pages) are sent as a whole document
+_ITEM_STREAM_ORIGIN_TYPES = (
+    collections.abc.Iterator,
+    collections.abc.AsyncIterator,
+    collections.abc.Iterable,
+    collections.abc.AsyncIterable,
+    collections.abc.Generator,
+    collections.abc.AsyncGenerator,
+    collections.abc.Sequence,
+    list,
+)
+
+
 def _build_response_schema(method: ComponentMethod, schema_registry: SchemaRegistry) -> Response:
     return_value_type = method.return_value_type
     if _is_abstract_or_none_return_type(return_value_type):
@@ -389,13 +410,29 @@ def _build_response_schema(method: ComponentMethod, schema_registry: SchemaRegis
     reference = schema_registry.get_schema_or_reference(return_value_type, output=True)
     route_annotation = method.annotations.get_one_or_none(RouteAnnotation)
     produces = route_annotation.produces or [MediaType.APPLICATION_JSON]
-    content = {
-        str(produce): MediaTypeModel(media_type_schema=reference)
-        for produce in produces
-    }
+    content = {}
+    for produce in produces:
+        if produce in _ITEM_STREAM_MEDIA_TYPES and _get_item_type(return_value_type) is not None:
+            # Streams of separate items (e.g. newline delimited JSON) are described by a schema of a single item
+            item_reference = schema_registry.get_schema_or_reference(_get_item_type(return_value_type), output=True)
+            content[str(produce)] = MediaTypeModel(media_type_schema=item_reference)
+        else:
+            content[str(produce)] = MediaTypeModel(media_type_schema=reference)
     return Response(description='', content=content)
 
 
+def _get_item_type(type_: Type) -> Optional[Type]:
+    if is_optional(type_):
+        args = [arg for arg in get_union_args(type_) if arg is not NoneType]
+        if len(args) != 1:
+            return None
+        type_ = args[0]
+    if get_origin(type_) not in _ITEM_STREAM_ORIGIN_TYPES:
+        return None
+    args = get_args(type_)
+    return args[0] if args else None
+
+
 def _build_response_exception_handler_schema(method: ComponentMethod, schema_registry: SchemaRegistry) -> Response:
     return_value_type = method.return_value_type
     if _is_abstract_or_none_return_type(return_value_type):
@@ -1,3 +1,5 @@
+from .cursor_page_inspector import inspect_cursor_page
+from .cursor_position_argument_inspector import CursorPositionArgumentsInspector
 from .page_inspector import inspect_page
 from .page_position_argument_inspector import PagePositionArgumentsInspector
 from .path_parameters_inspector import PathParametersInspector
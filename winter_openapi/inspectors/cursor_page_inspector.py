@@ -0,0 +1,60 @@
+import dataclasses
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Type
+
+from winter.data.pagination import CursorPage
+from winter_openapi.inspection.type_info import TypeInfo
+from winter_openapi.inspectors.standard_types_inspectors import inspect_type
+from winter_openapi.inspectors.standard_types_inspectors import register_type_inspector
+
+
+def create_dataclass(cursor_page_type: Type) -> Type:
+    args = getattr(cursor_page_type, '__args__', None)
+    child_class = args[0] if args else str
+    child_type_info = inspect_type(child_class)
+    title = child_type_info.title or child_type_info.type_.capitalize()
+
+    CursorPageMetaDataclass = dataclasses.dataclass(
+        type(
+            f'CursorPageMetaOf{title}',
+            (),
+            {
+                '__annotations__': {
+                    'limit': Optional[int],
+                    'next_cursor': Optional[str],
+                    'previous_cursor': Optional[str],
+                    'next': Optional[str],
+                    'previous': Optional[str],
+                },
+            },
+        ),
+    )
+    CursorPageMetaDataclass.__doc__ = ''
+    CursorPageDataclass = dataclasses.dataclass(
+        type(
+            f'CursorPageOf{title}',
+            (),
+            {
+                '__annotations__': {
+                    'meta': CursorPageMetaDataclass,
+                    'objects': List[child_class],
+                },
+            },
+        ),
+    )
+    CursorPageDataclass.__doc__ = ''
+    return CursorPageDataclass
+
+
+cursor_page_to_dataclass_map: Dict[Type, Type] = {}
+
+
+# noinspection PyUnusedLocal
+@register_type_inspector(CursorPage)
+def inspect_cursor_page(hint_class) -> TypeInfo:
+    if hint_class not in cursor_page_to_dataclass_map:
+        cursor_page_to_dataclass_map[hint_class] = create_dataclass(hint_class)
+    cursor_page_dataclass = cursor_page_to_dataclass_map[hint_class]
+    return inspect_type(cursor_page_dataclass)
@@ -0,0 +1,45 @@
+from typing import List
+from typing import TYPE_CHECKING
+
+from openapi_pydantic.v3.v3_0 import Parameter
+from openapi_pydantic.v3.v3_0 import Schema
+
+from winter.data.pagination import CursorPosition
+from winter.web.pagination.cursor_position_argument_resolver import CursorPositionArgumentResolver
+from winter.web.routing import Route
+from winter_openapi.inspection.data_types import DataTypes
+from .page_position_argument_inspector import create_order_by_parameter
+from .route_parameters_inspector import RouteParametersInspector
+
+if TYPE_CHECKING:
+    from winter_openapi.generator import SchemaRegistry
+
+
+class CursorPositionArgumentsInspector(RouteParametersInspector):
+    def __init__(self, cursor_position_argument_resolver: CursorPositionArgumentResolver):
+        self._cursor_position_argument_resolver = cursor_position_argument_resolver
+        self.limit_parameter = Parameter(
+            name=cursor_position_argument_resolver.limit_name,
+            description='Number of results to return per page',
+            required=False,
+            param_in="query",
+            param_schema=Schema(type=DataTypes.INTEGER),
+        )
+        self.cursor_parameter = Parameter(
+            name=cursor_position_argument_resolver.cursor_name,
+            description='Opaque cursor of the page taken from the next_cursor or previous_cursor of another page',
+            required=False,
+            param_in="query",
+            param_schema=Schema(type=DataTypes.STRING),
+        )
+
+    def inspect_parameters(self, route: 'Route', schema_registry: 'SchemaRegistry') -> List[Parameter]:
+        has_cursor_position_argument = any(argument.type_ == CursorPosition for argument in route.method.arguments)
+        if not has_cursor_position_argument:
+            return []
+
+        parameters = [self.limit_parameter, self.cursor_parameter]
+        order_by_parameter = create_order_by_parameter(route, self._cursor_position_argument_resolver.order_by_name)
+        if order_by_parameter is not None:
+            parameters.append(order_by_parameter)
+        return parameters
@@ -23,7 +23,8 @@ def create_dataclass(page_type: Type) -> Type:
             (),
             {
                 '__annotations__': {
-                    'total_count': int,
+                    'total_count': Optional[int],
+                    'is_total_count_estimated': bool,
                     'limit': Optional[int],
                     'offset': Optional[int],
                     'previous': Optional[str],
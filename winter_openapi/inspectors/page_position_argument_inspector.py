@@ -1,4 +1,5 @@
 from typing import List
+from typing import Optional
 from typing import TYPE_CHECKING
 
 from openapi_pydantic.v3.v3_0 import Parameter
@@ -42,35 +43,41 @@ class PagePositionArgumentsInspector(RouteParametersInspector):
         parameters.append(self.limit_parameter)
         parameters.append(self.offset_parameter)
 
-        order_by_annotation = route.method.annotations.get_one_or_none(OrderByAnnotation)
-        if order_by_annotation:
-            allowed_order_by_fields = ','.join(map(str, sorted(order_by_annotation.allowed_fields)))
-            default_sort = (
-                [str(order_by_annotation.default_sort)]
-                if order_by_annotation.default_sort is not None else
-                None
-            )
-            enum_values = []
-            for field in map(str, sorted(order_by_annotation.allowed_fields)):
-                enum_values.append(field)
-                enum_values.append('-' + field)
-
-            order_by_parameter = Parameter(
-                name=self._page_position_argument_resolver.order_by_name,
-                description=f'Comma separated order by fields.',
-                required=False,
-                param_in="query",
-                style="form",
-                explode=False,
-                param_schema=Schema(
-                    type=DataTypes.ARRAY,
-                    default=default_sort,
-                    items=Schema(
-                        type=DataTypes.STRING,
-                        enum=enum_values,
-                    )
-                ),
-            )
+        order_by_parameter = create_order_by_parameter(route, self._page_position_argument_resolver.order_by_name)
+        if order_by_parameter is not None:
             parameters.append(order_by_parameter)
 
         return parameters
+
+
+def create_order_by_parameter(route: 'Route', name: str) -> Optional[Parameter]:
+    order_by_annotation = route.method.annotations.get_one_or_none(OrderByAnnotation)
+    if order_by_annotation is None:
+        return None
+
+    default_sort = (
+        [str(order_by_annotation.default_sort)]
+        if order_by_annotation.default_sort is not None else
+        None
+    )
+    enum_values = []
+    for field in map(str, sorted(order_by_annotation.allowed_fields)):
+        enum_values.append(field)
+        enum_values.append('-' + field)
+
+    return Parameter(
+        name=name,
+        description='Comma separated order by fields.',
+        required=False,
+        param_in="query",
+        style="form",
+        explode=False,
+        param_schema=Schema(
+            type=DataTypes.ARRAY,
+            default=default_sort,
+            items=Schema(
+                type=DataTypes.STRING,
+                enum=enum_values,
+            ),
+        ),
+    )
@@ -5,6 +5,7 @@ import enum
 import types
 import typing
 import uuid
+from collections.abc import AsyncIterable
 from collections.abc import Iterable
 from typing import Type
 
@@ -98,7 +99,7 @@ def inspect_date(hint_class) -> TypeInfo:
 
 
 # noinspection PyUnusedLocal
-@register_type_inspector(list, tuple, set, Iterable)
+@register_type_inspector(list, tuple, set, Iterable, AsyncIterable)
 def inspect_iterable(hint_class) -> TypeInfo:
     args = typing.get_args(hint_class)
     if not args:
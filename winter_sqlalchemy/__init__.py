@@ -1,3 +1,33 @@
+from .async_repository import async_sqla_crud
+from .entity_cache import EntityCache
+from .entity_cache import EntityCacheStats
+from .entity_cache import LRUEntityCache
+from .entity_cache import RedisEntityCache
+from .identity_map import IdentityMap
+from .identity_map import IdentityMapInterceptor
+from .identity_map import IdentityMapStats
+from .identity_map import LRUIdentityMap
+from .identity_map import RequestScopedIdentityMap
+from .identity_map import WeakValueIdentityMap
+from .identity_map import end_request_scoped_identity_maps
+from .page import PostgreSQLTotalCountEstimator
+from .page import TotalCountEstimator
+from .page import TotalCountMode
+from .page import fetch_page
+from .page import set_total_count_estimator
+from .query import keyset_predicate
 from .query import paginate
+from .query import paginate_by_cursor
 from .query import sort
+from .read_replicas import LeastConnectionsReplicaPolicy
+from .read_replicas import ReadReplicas
+from .read_replicas import ReplicaPolicy
+from .read_replicas import RoundRobinReplicaPolicy
+from .read_replicas import RoutingSession
 from .repository import sqla_crud
+from .unit_of_work import UnitOfWork
+from .unit_of_work import UnitOfWorkInterceptor
+from .unit_of_work import begin_unit_of_work
+from .unit_of_work import end_unit_of_work
+from .unit_of_work import get_current_unit_of_work
+from .unit_of_work import unit_of_work_scope
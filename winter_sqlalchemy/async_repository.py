@@ -0,0 +1,195 @@
+from typing import AsyncIterator
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
+
+from injector import inject
+from sqlalchemy import exists
+from sqlalchemy import func
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import class_mapper
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.exc import UnmappedClassError
+
+from winter.core import get_injector
+from winter.data import CRUDRepository
+from winter.data.exceptions import NotFoundException
+from winter.data.pagination import Sort
+from winter_ddd import AggregateRoot
+from winter_ddd import DomainEvent
+from winter_ddd import DomainEventDispatcher
+from .columns import primary_key_in
+from .query import keyset_predicate
+from .repository import DEFAULT_BATCH_SIZE
+from .repository import DEFAULT_CHUNK_SIZE
+
+T = TypeVar('T')
+K = TypeVar('K')
+
+
+def async_sqla_crud(repository_cls, *, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Counterpart of sqla_crud for AsyncEngine bound in the injector, CRUDRepository methods are coroutines
+    and stream_all is an async iterator. Every method uses its own AsyncSession, writes are committed right away
+    and domain events are dispatched with DomainEventDispatcher.dispatch_async after the commit.
+    Found entities are detached, so their relationships must be loaded eagerly.
+    """
+    if not issubclass(repository_cls, CRUDRepository):
+        raise TypeError('Repository must be inherited from CRUDRepository before annotating with async_sqla_crud')
+
+    entity_cls = repository_cls.__entity_cls__
+
+    if not issubclass(entity_cls, AggregateRoot):
+        raise TypeError('Entity class must be inherited from winter_ddd.AggregateRoot')
+
+    try:
+        mapper = class_mapper(entity_cls)
+    except UnmappedClassError:  # pragma: no cover
+        raise TypeError('Invalid SQLAlchemy entity class given')
+
+    if len(mapper.tables) > 1:
+        raise TypeError('async_sqla_crud does not support entities mapped to multiple tables')
+
+    entity_table = mapper.tables[0]
+    primary_key_columns = tuple(entity_table.primary_key.columns)
+    primary_key_sort = Sort.by(*(column.key for column in primary_key_columns))
+    has_delete_cascades = any(relationship.cascade.delete for relationship in mapper.relationships)
+
+    class DefaultAsyncCRUDRepositoryImpl:
+        """SQLAlchemy asyncio implementation for CRUDRepository"""
+
+        async def count(self) -> int:
+            async with self.__session_factory() as session:
+                return await session.scalar(select(func.count()).select_from(entity_table))
+
+        async def delete(self, entity: T):
+            await self.delete_many([entity])
+
+        async def delete_many(self, entities: Iterable[T]):
+            """
+            Entities are deleted with one DELETE statement per chunk of primary keys,
+            unless deletion cascades to related entities, then they are deleted one by one by the session.
+            """
+            entities = list(entities)
+            async with self.__session_factory() as session, session.begin():
+                if has_delete_cascades:
+                    for entity in entities:
+                        session.add(entity)
+                        await session.delete(entity)
+                else:
+                    ids = [inspect(entity).identity for entity in entities]
+                    for index in range(0, len(ids), chunk_size):
+                        chunk_ids = ids[index:index + chunk_size]
+                        await session.execute(
+                            entity_table.delete().where(primary_key_in(primary_key_columns, chunk_ids)),
+                        )
+
+        async def delete_all(self):
+            async with self.__session_factory() as session, session.begin():
+                await session.execute(entity_table.delete())
+
+        async def delete_by_id(self, id_: K):
+            criterion = primary_key_in(primary_key_columns, [_to_tuple(id_)])
+            async with self.__session_factory() as session, session.begin():
+                await session.execute(entity_table.delete().where(criterion))
+
+        async def exists_by_id(self, id_: K) -> bool:
+            criterion = primary_key_in(primary_key_columns, [_to_tuple(id_)])
+            async with self.__session_factory() as session:
+                return await session.scalar(select(exists().where(criterion)))
+
+        async def find_all(self) -> List[T]:
+            result = []
+            statement = select(*primary_key_columns)
+            last_id = None
+            while True:
+                criterion = keyset_predicate(statement, primary_key_sort, last_id) if last_id is not None else None
+                entities = await self._load(criterion, limit=chunk_size)
+                result.extend(entities)
+                if len(entities) < chunk_size:
+                    return result
+                last_id = inspect(entities[-1]).identity
+
+        async def find_all_by_id(self, ids: Iterable[K]) -> List[T]:
+            ids = [_to_tuple(id_) for id_ in ids]
+            entities = {}
+            unique_ids = list(dict.fromkeys(ids))
+            for index in range(0, len(unique_ids), chunk_size):
+                criterion = primary_key_in(primary_key_columns, unique_ids[index:index + chunk_size])
+                for entity in await self._load(criterion):
+                    entities[inspect(entity).identity] = entity
+            return [entities[id_] for id_ in ids if id_ in entities]
+
+        async def find_by_id(self, id_: K) -> Optional[T]:
+            async with self.__session_factory() as session:
+                return await session.get(entity_cls, _to_tuple(id_))
+
+        async def get_by_id(self, id_: K) -> T:
+            entity = await self.find_by_id(id_)
+            if entity is None:
+                raise NotFoundException(id_, entity_cls)
+            return entity
+
+        async def stream_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[T]:
+            """Entities are fetched with a server-side cursor where the database supports it, batch_size at a time."""
+            statement = select(entity_cls).order_by(*primary_key_columns).execution_options(yield_per=batch_size)
+            async with self.__session_factory() as session:
+                result = await session.stream_scalars(statement)
+                async for batch in result.partitions(batch_size):
+                    session.expunge_all()
+                    for entity in batch:
+                        yield entity
+
+        async def save(self, entity: T) -> T:
+            await self.save_many([entity])
+            return entity
+
+        async def save_many(self, entities: Iterable[T]) -> List[T]:
+            """Entities are flushed and committed at once, then domain events of all of them are dispatched."""
+            entities = list(entities)
+            async with self.__session_factory() as session, session.begin():
+                session.add_all(entities)
+            await self._process_domain_events(entities)
+            return entities
+
+        async def _load(self, criterion, limit: Optional[int] = None) -> List[T]:
+            statement = select(entity_cls)
+            if criterion is not None:
+                statement = statement.where(criterion)
+            if limit is not None:
+                statement = statement.order_by(*primary_key_columns).limit(limit)
+            async with self.__session_factory() as session:
+                return list(await session.scalars(statement))
+
+        async def _process_domain_events(self, aggregates: Iterable[AggregateRoot]):
+            domain_events: List[DomainEvent] = []
+            for aggregate in aggregates:
+                domain_events.extend(aggregate.domain_events)
+                aggregate.clear_domain_events()
+            await self.__domain_event_dispatcher.dispatch_async(domain_events)
+
+        @inject
+        def __init__(self, engine: AsyncEngine, domain_event_dispatcher: DomainEventDispatcher):
+            self.__session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+            self.__domain_event_dispatcher = domain_event_dispatcher
+
+    repository_subclasses = repository_cls.__subclasses__()
+
+    class AsyncRepositoryImpl(DefaultAsyncCRUDRepositoryImpl, *repository_subclasses):
+        @inject
+        def __init__(self):
+            injector = get_injector()
+            injector.call_with_injection(DefaultAsyncCRUDRepositoryImpl.__init__, self)
+            for subclass in repository_subclasses:
+                injector.call_with_injection(subclass.__init__, self)
+
+    return AsyncRepositoryImpl
+
+
+def _to_tuple(id_) -> Tuple:
+    return id_ if isinstance(id_, tuple) else (id_,)
@@ -0,0 +1,27 @@
+from typing import Any
+from typing import Sequence
+from typing import Tuple
+
+from sqlalchemy import Column
+from sqlalchemy import tuple_
+from sqlalchemy.sql import ColumnElement
+
+from winter.core.json import json_decode
+
+
+def decode_column_value(column: ColumnElement, value: Any) -> Any:
+    """Decode a JSON decoded value, e.g. of a cursor or a cached entity, back to the column type."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if value is None or isinstance(value, python_type):
+        return value
+    return json_decode(value, python_type)
+
+
+def primary_key_in(columns: Sequence[Column], ids: Sequence[Tuple]) -> ColumnElement:
+    """Predicate of rows with one of the ids, composite primary keys are compared as tuples."""
+    if len(columns) == 1:
+        return columns[0].in_([id_[0] for id_ in ids])
+    return tuple_(*columns).in_(ids)
@@ -0,0 +1,268 @@
+import enum
+import inspect
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from typing import Type
+from typing import get_args
+
+import dataclasses
+from sqlalchemy import and_
+from sqlalchemy import bindparam
+from sqlalchemy import exists
+from sqlalchemy import func
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy.orm import Mapper
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql import Select
+
+from winter.core.utils.typing import NoneType
+from winter.core.utils.typing import get_union_args
+from winter.core.utils.typing import is_iterable_type
+from winter.core.utils.typing import is_optional
+from winter.core.utils.typing import is_origin_type_subclasses
+from winter.data.pagination import Page
+from winter.data.pagination import PagePosition
+from winter.data.pagination import Sort
+from .query import paginate
+from .query import sort
+
+
+class QueryKind(enum.Enum):
+    FIND = 'find'
+    COUNT = 'count'
+    EXISTS = 'exists'
+
+
+class ResultKind(enum.Enum):
+    ONE = 'one'
+    LIST = 'list'
+    PAGE = 'page'
+
+
+_PREFIXES = (
+    ('find_all_by_', QueryKind.FIND),
+    ('find_by_', QueryKind.FIND),
+    ('count_by_', QueryKind.COUNT),
+    ('exists_by_', QueryKind.EXISTS),
+)
+
+# Operator suffixes of column names with the number of arguments they take
+_OPERATORS: Dict[str, Tuple[int, Callable[..., ColumnElement]]] = {
+    'is_not_null': (0, lambda column: column.isnot(None)),
+    'is_null': (0, lambda column: column.is_(None)),
+    'not_in': (1, lambda column, values: column.not_in(values)),
+    'in': (1, lambda column, values: column.in_(values)),
+    'not_like': (1, lambda column, value: column.not_like(value)),
+    'like': (1, lambda column, value: column.like(value)),
+    'between': (2, lambda column, start, end: column.between(start, end)),
+    'ne': (1, lambda column, value: column != value),
+    'gte': (1, lambda column, value: column >= value),
+    'gt': (1, lambda column, value: column > value),
+    'lte': (1, lambda column, value: column <= value),
+    'lt': (1, lambda column, value: column < value),
+    'eq': (1, lambda column, value: column == value),
+}
+_EXPANDING_OPERATORS = ('in', 'not_in')
+
+# Sorts may come from requests, statements of the other sorts are built on every call
+_MAXIMUM_SORTED_STATEMENTS = 100
+
+
+@dataclasses.dataclass(frozen=True)
+class DerivedQuery:
+    """
+    Query derived from a repository method name, e.g. find_by_status_and_created_at_gt or count_by_owner_id.
+    Statements are built once with bound parameters named after the method arguments,
+    sorted statements are cached per sort for a limited number of sorts.
+    Finders returning a single result select at most one row.
+    Finders returning dataclasses other than the entity select only the columns named after the dataclass fields,
+    which are projected into the dataclass instances without loading entities.
+    """
+    kind: QueryKind
+    result_kind: ResultKind
+    signature: inspect.Signature
+    parameter_names: Tuple[str, ...]
+    page_position_argument: Optional[str]
+    sort_argument: Optional[str]
+    statement: Select
+    count_statement: Select
+    projection: Optional[Type] = None
+    _sorted_statements: Dict[Sort, Select] = dataclasses.field(default_factory=dict, compare=False, repr=False)
+
+    def bind_arguments(self, args: Sequence, kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[PagePosition]]:
+        arguments = self.signature.bind(None, *args, **kwargs).arguments
+        parameters = {name: arguments[name] for name in self.parameter_names}
+        page_position = arguments.get(self.page_position_argument) if self.page_position_argument else None
+        sort_ = arguments.get(self.sort_argument) if self.sort_argument else None
+        if sort_ is not None:
+            page_position = PagePosition(
+                limit=page_position.limit if page_position else None,
+                offset=page_position.offset if page_position else None,
+                sort=sort_,
+            )
+        return parameters, page_position
+
+    def get_statement(self, page_position: Optional[PagePosition]) -> Select:
+        if page_position is None:
+            return self.statement
+        statement = self.statement
+        if page_position.sort:
+            statement = self._sorted_statements.get(page_position.sort)
+            if statement is None:
+                statement = sort(self.statement, page_position.sort)
+                if len(self._sorted_statements) < _MAXIMUM_SORTED_STATEMENTS:
+                    self._sorted_statements[page_position.sort] = statement
+        return paginate(statement, dataclasses.replace(page_position, sort=None))
+
+
+def is_derived_query_method(name: str) -> bool:
+    return any(name.startswith(prefix) for prefix, _ in _PREFIXES)
+
+
+def derive_query(func_: Callable, mapper: Mapper) -> DerivedQuery:
+    name = func_.__name__
+    prefix, kind = next((prefix, kind) for prefix, kind in _PREFIXES if name.startswith(prefix))
+    signature = inspect.signature(func_)
+    arguments = list(signature.parameters.values())[1:]
+    page_position_argument = _find_argument(arguments, PagePosition)
+    sort_argument = _find_argument(arguments, Sort)
+    parameter_names = [
+        argument.name
+        for argument in arguments
+        if argument.name not in (page_position_argument, sort_argument)
+    ]
+
+    conjunctions = _parse_predicates(name, name[len(prefix):], mapper)
+    arity = sum(_OPERATORS[operator][0] for predicates in conjunctions for _, operator in predicates)
+    if arity != len(parameter_names):
+        raise TypeError(f'Method "{name}" must take {arity} arguments besides PagePosition and Sort')
+
+    bound_parameters = iter(parameter_names)
+    clauses: List[ColumnElement] = []
+    for predicates in conjunctions:
+        predicate_clauses = []
+        for column, operator in predicates:
+            operator_arity, create_clause = _OPERATORS[operator]
+            expanding = operator in _EXPANDING_OPERATORS
+            values = [bindparam(next(bound_parameters), expanding=expanding) for _ in range(operator_arity)]
+            predicate_clauses.append(create_clause(column, *values))
+        clauses.append(and_(*predicate_clauses))
+    criterion = or_(*clauses)
+
+    result_kind = _get_result_kind(signature.return_annotation)
+    entity_table = mapper.tables[0]
+    count_statement = select(func.count()).select_from(entity_table).where(criterion)
+    projection = _get_projection(signature.return_annotation, mapper) if kind == QueryKind.FIND else None
+    if kind == QueryKind.COUNT:
+        statement = count_statement
+    elif kind == QueryKind.EXISTS:
+        statement = select(exists().where(criterion))
+    elif projection is not None:
+        statement = select(*_get_projected_columns(name, projection, mapper)).where(criterion)
+    else:
+        statement = select(mapper.class_).where(criterion)
+    if kind == QueryKind.FIND and result_kind == ResultKind.ONE:
+        statement = statement.limit(1)
+
+    return DerivedQuery(
+        kind=kind,
+        result_kind=result_kind,
+        signature=signature,
+        parameter_names=tuple(parameter_names),
+        page_position_argument=page_position_argument,
+        sort_argument=sort_argument,
+        statement=statement,
+        count_statement=count_statement,
+        projection=projection,
+    )
+
+
+def _parse_predicates(name: str, expression: str, mapper: Mapper) -> List[List[Tuple[ColumnElement, str]]]:
+    """Columns with their operators grouped by conjunctions, which are joined by OR."""
+    columns = sorted(
+        ((column.key.split('_'), column) for column in mapper.tables[0].columns),
+        key=lambda item: len(item[0]),
+        reverse=True,
+    )
+    operators = sorted((operator.split('_') for operator in _OPERATORS), key=len, reverse=True)
+    tokens = expression.split('_')
+    conjunctions = [[]]
+    position = 0
+    while True:
+        column_tokens, column = next(
+            ((key, column) for key, column in columns if tokens[position:position + len(key)] == key),
+            (None, None),
+        )
+        if column is None:
+            rest = '_'.join(tokens[position:])
+            raise TypeError(f'Can\'t derive a query from method "{name}", unknown column: "{rest}"')
+        position += len(column_tokens)
+
+        operator = 'eq'
+        for operator_tokens in operators:
+            end = position + len(operator_tokens)
+            if tokens[position:end] == operator_tokens and (end == len(tokens) or tokens[end] in ('and', 'or')):
+                operator = '_'.join(operator_tokens)
+                position = end
+                break
+        conjunctions[-1].append((column, operator))
+
+        if position == len(tokens):
+            return conjunctions
+        if tokens[position] == 'or':
+            conjunctions.append([])
+        elif tokens[position] != 'and':
+            rest = '_'.join(tokens[position:])
+            raise TypeError(f'Can\'t derive a query from method "{name}", unexpected: "{rest}"')
+        position += 1
+        if position == len(tokens):
+            raise TypeError(f'Can\'t derive a query from method "{name}", it ends with a conjunction')
+
+
+def _find_argument(arguments: List[inspect.Parameter], type_: type) -> Optional[str]:
+    for argument in arguments:
+        annotation = argument.annotation
+        if annotation is type_ or (is_optional(annotation) and type_ in get_union_args(annotation)):
+            return argument.name
+    return None
+
+
+def _get_result_kind(return_annotation: Any) -> ResultKind:
+    if is_origin_type_subclasses(return_annotation, Page):
+        return ResultKind.PAGE
+    if return_annotation is not inspect.Signature.empty and is_iterable_type(return_annotation):
+        return ResultKind.LIST
+    return ResultKind.ONE
+
+
+def _get_projection(return_annotation: Any, mapper: Mapper) -> Optional[Type]:
+    item_type = return_annotation
+    if is_optional(item_type):
+        item_type = next(arg for arg in get_union_args(item_type) if arg is not NoneType)
+    if _get_result_kind(item_type) != ResultKind.ONE:
+        item_type = next(iter(get_args(item_type)), None)
+    if not isinstance(item_type, type) or not dataclasses.is_dataclass(item_type):
+        return None
+    if issubclass(item_type, mapper.class_):
+        return None
+    return item_type
+
+
+def _get_projected_columns(name: str, projection: Type, mapper: Mapper) -> List[ColumnElement]:
+    columns = mapper.tables[0].columns
+    projected_columns = []
+    for field in dataclasses.fields(projection):
+        if not field.init:
+            continue
+        if field.name not in columns:
+            raise TypeError(
+                f'Can\'t project {projection.__name__} in method "{name}", unknown column: "{field.name}"',
+            )
+        projected_columns.append(columns[field.name])
+    return projected_columns
@@ -0,0 +1,159 @@
+import abc
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+import dataclasses
+from redis import Redis
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from winter.core.json import JSONEncoder
+from .columns import decode_column_value
+
+EntityState = Dict[str, Any]
+
+
+@dataclasses.dataclass
+class EntityCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class EntityCache(abc.ABC):
+    """
+    Second-level cache of entity column values keyed by entity class and primary key,
+    it may be shared by repositories of different entities.
+    """
+
+    def __init__(self):
+        self.stats = EntityCacheStats()
+
+    def get(self, entity_cls: Type, id_: Tuple) -> Optional[EntityState]:
+        state = self._get(entity_cls, id_)
+        if state is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return state
+
+    @abc.abstractmethod
+    def _get(self, entity_cls: Type, id_: Tuple) -> Optional[EntityState]:  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def set(self, entity_cls: Type, id_: Tuple, state: EntityState):  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def delete(self, entity_cls: Type, id_: Tuple):  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def clear(self, entity_cls: Type):  # pragma: no cover
+        """Delete all cached entities of the class."""
+        pass
+
+
+class LRUEntityCache(EntityCache):
+    """
+    In-process cache of at most maximum_size entities, the least recently used ones are evicted.
+    Entities expire ttl seconds after they are cached if ttl is given. The cache may be shared by threads.
+    """
+
+    def __init__(self, maximum_size: int, ttl: Optional[float] = None):
+        super().__init__()
+        self._maximum_size = maximum_size
+        self._ttl = ttl
+        self._states: OrderedDict[Tuple[Type, Tuple], Tuple[Optional[float], EntityState]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, entity_cls: Type, id_: Tuple) -> Optional[EntityState]:
+        key = (entity_cls, id_)
+        with self._lock:
+            item = self._states.get(key)
+            if item is None:
+                return None
+            expires_at, state = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._states[key]
+                return None
+            self._states.move_to_end(key)
+            return dict(state)
+
+    def set(self, entity_cls: Type, id_: Tuple, state: EntityState):
+        key = (entity_cls, id_)
+        expires_at = time.monotonic() + self._ttl if self._ttl is not None else None
+        with self._lock:
+            self._states[key] = (expires_at, dict(state))
+            self._states.move_to_end(key)
+            while len(self._states) > self._maximum_size:
+                self._states.popitem(last=False)
+
+    def delete(self, entity_cls: Type, id_: Tuple):
+        with self._lock:
+            self._states.pop((entity_cls, id_), None)
+
+    def clear(self, entity_cls: Type):
+        with self._lock:
+            for key in [key for key in self._states if key[0] is entity_cls]:
+                del self._states[key]
+
+
+class RedisEntityCache(EntityCache):
+    """
+    Cache shared by processes, entity column values are stored as JSON and decoded back to the column types.
+    Entities expire ttl seconds after they are cached if ttl is given.
+    """
+
+    def __init__(self, redis: Redis, ttl: Optional[int] = None, key_prefix: str = 'winter_sqlalchemy:'):
+        super().__init__()
+        self._redis = redis
+        self._ttl = ttl
+        self._key_prefix = key_prefix
+
+    def _get(self, entity_cls: Type, id_: Tuple) -> Optional[EntityState]:
+        value = self._redis.get(self._get_key(entity_cls, id_))
+        if value is None:
+            return None
+        columns = {attribute.key: attribute.columns[0] for attribute in inspect(entity_cls).column_attrs}
+        return {key: decode_column_value(columns[key], value) for key, value in json.loads(value).items()}
+
+    def set(self, entity_cls: Type, id_: Tuple, state: EntityState):
+        self._redis.set(self._get_key(entity_cls, id_), json.dumps(state, cls=JSONEncoder), ex=self._ttl)
+
+    def delete(self, entity_cls: Type, id_: Tuple):
+        self._redis.delete(self._get_key(entity_cls, id_))
+
+    def clear(self, entity_cls: Type):
+        keys = list(self._redis.scan_iter(match=f'{self._get_class_key(entity_cls)}:*'))
+        if keys:
+            self._redis.delete(*keys)
+
+    def _get_key(self, entity_cls: Type, id_: Tuple) -> str:
+        return f'{self._get_class_key(entity_cls)}:{json.dumps(id_, default=str)}'
+
+    def _get_class_key(self, entity_cls: Type) -> str:
+        return f'{self._key_prefix}{entity_cls.__module__}.{entity_cls.__qualname__}'
+
+
+def get_entity_state(entity: Any) -> EntityState:
+    return {attribute.key: getattr(entity, attribute.key) for attribute in inspect(entity).mapper.column_attrs}
+
+
+def restore_entity(session: Session, entity_cls: Type, state: EntityState) -> Any:
+    """Create a persistent entity in the session from its cached state without querying the database."""
+    entity = inspect(entity_cls).class_manager.new_instance()
+    for key, value in state.items():
+        set_committed_value(entity, key, value)
+    make_transient_to_detached(entity)
+    session.add(entity)
+    return entity
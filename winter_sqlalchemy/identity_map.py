@@ -0,0 +1,160 @@
+import abc
+import weakref
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Optional
+
+import dataclasses
+
+from winter.web import Interceptor
+
+
+@dataclasses.dataclass
+class IdentityMapStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class IdentityMap(abc.ABC):
+    """Entities loaded by a repository by their primary keys, the policy decides how long they are kept."""
+
+    def __init__(self):
+        self.stats = IdentityMapStats()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entity = self._get(key)
+        if entity is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return entity
+
+    @abc.abstractmethod
+    def _get(self, key: Hashable) -> Optional[Any]:  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def add(self, key: Hashable, entity: Any):  # pragma: no cover
+        pass
+
+    @abc.abstractmethod
+    def remove(self, key: Hashable):  # pragma: no cover
+        """Remove the entity if it's in the map, removal isn't counted as eviction."""
+        pass
+
+    @abc.abstractmethod
+    def clear(self):  # pragma: no cover
+        pass
+
+
+class WeakValueIdentityMap(IdentityMap):
+    """Keeps entities as long as they are referenced elsewhere."""
+
+    def __init__(self):
+        super().__init__()
+        self._references: Dict[Hashable, weakref.ref] = {}
+
+    def _get(self, key: Hashable) -> Optional[Any]:
+        reference = self._references.get(key)
+        return reference() if reference is not None else None
+
+    def add(self, key: Hashable, entity: Any):
+        self._references[key] = weakref.ref(entity, self._create_eviction_callback(key))
+
+    def remove(self, key: Hashable):
+        self._references.pop(key, None)
+
+    def clear(self):
+        self._references.clear()
+
+    def _create_eviction_callback(self, key: Hashable) -> Callable[[weakref.ref], None]:
+        def evict(reference: weakref.ref):
+            # References of replaced or removed entities are released along with their callbacks
+            del self._references[key]
+            self.stats.evictions += 1
+        return evict
+
+
+class LRUIdentityMap(IdentityMap):
+    """Keeps at most maximum_size entities, the least recently used ones are evicted."""
+
+    def __init__(self, maximum_size: int):
+        super().__init__()
+        self._maximum_size = maximum_size
+        self._entities: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def _get(self, key: Hashable) -> Optional[Any]:
+        entity = self._entities.get(key)
+        if entity is not None:
+            self._entities.move_to_end(key)
+        return entity
+
+    def add(self, key: Hashable, entity: Any):
+        self._entities[key] = entity
+        self._entities.move_to_end(key)
+        while len(self._entities) > self._maximum_size:
+            self._entities.popitem(last=False)
+            self.stats.evictions += 1
+
+    def remove(self, key: Hashable):
+        self._entities.pop(key, None)
+
+    def clear(self):
+        self._entities.clear()
+
+
+class RequestScopedIdentityMap(IdentityMap):
+    """
+    Keeps entities until the end of the current request, when IdentityMapInterceptor is registered,
+    or until end_request_scoped_identity_maps is called. Every context has its own entities.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._entities: ContextVar[Optional[Dict[Hashable, Any]]] = ContextVar('identity_map', default=None)
+        _request_scoped_identity_maps.add(self)
+
+    def _get(self, key: Hashable) -> Optional[Any]:
+        entities = self._entities.get()
+        return entities.get(key) if entities is not None else None
+
+    def add(self, key: Hashable, entity: Any):
+        entities = self._entities.get()
+        if entities is None:
+            entities = {}
+            self._entities.set(entities)
+        entities[key] = entity
+
+    def remove(self, key: Hashable):
+        entities = self._entities.get()
+        if entities is not None:
+            entities.pop(key, None)
+
+    def clear(self):
+        self._entities.set(None)
+
+    def end_request(self):
+        entities = self._entities.get()
+        if entities:
+            self.stats.evictions += len(entities)
+        self.clear()
+
+
+_request_scoped_identity_maps: 'weakref.WeakSet[RequestScopedIdentityMap]' = weakref.WeakSet()
+
+
+def end_request_scoped_identity_maps():
+    for identity_map in list(_request_scoped_identity_maps):
+        identity_map.end_request()
+
+
+class IdentityMapInterceptor(Interceptor):
+    """Clears request scoped identity maps after every request."""
+
+    def after_completion(self):
+        end_request_scoped_identity_maps()
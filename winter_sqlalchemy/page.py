@@ -0,0 +1,110 @@
+import abc
+import contextlib
+import enum
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from sqlalchemy import func
+from sqlalchemy import select as select_
+from sqlalchemy.engine import Connection
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import ClauseElement
+from sqlalchemy.sql.expression import Executable
+
+from winter.data.pagination import Page
+from winter.data.pagination import PagePosition
+from .query import paginate
+
+
+class TotalCountMode(enum.Enum):
+    EXACT = 'exact'
+    ESTIMATED = 'estimated'
+    NONE = 'none'
+
+
+class TotalCountEstimator(abc.ABC):
+    @abc.abstractmethod
+    def estimate(self, connection: Connection, select: Select) -> Optional[int]:  # pragma: no cover
+        """Return None if the number of rows can't be estimated."""
+        pass
+
+
+class PostgreSQLTotalCountEstimator(TotalCountEstimator):
+    """Takes the number of rows estimated by the PostgreSQL planner from table statistics."""
+
+    def estimate(self, connection: Connection, select: Select) -> Optional[int]:
+        if connection.dialect.name != 'postgresql':
+            return None
+        plan = connection.execute(_ExplainJSON(select)).scalar()
+        return plan[0]['Plan']['Plan Rows']
+
+
+class _ExplainJSON(Executable, ClauseElement):
+    # The select is compiled as a part of the statement, so that its parameters are bound as usual
+    inherit_cache = False
+
+    def __init__(self, select: Select):
+        self.select = select
+
+
+@compiles(_ExplainJSON, 'postgresql')
+def _compile_explain_json(element: _ExplainJSON, compiler, **kwargs) -> str:
+    return f'EXPLAIN (FORMAT JSON) {compiler.process(element.select, **kwargs)}'
+
+
+_total_count_estimator: TotalCountEstimator = PostgreSQLTotalCountEstimator()
+
+
+def set_total_count_estimator(estimator: TotalCountEstimator):
+    global _total_count_estimator
+    _total_count_estimator = estimator
+
+
+def fetch_page(
+    connectable: Union[Engine, Connection],
+    select: Select,
+    page_position: PagePosition,
+    total_count_mode: TotalCountMode = TotalCountMode.EXACT,
+) -> Page:
+    """
+    Fetch a page of rows with the total count counted exactly, estimated or not computed at all.
+    Unless it's counted exactly, the page is fetched with one extra row to find out whether there is a next page.
+    """
+    with _connect(connectable) as connection:
+        if total_count_mode == TotalCountMode.EXACT:
+            rows = connection.execute(paginate(select, page_position)).fetchall()
+            return Page(_count(connection, select), rows, page_position)
+
+        limit = page_position.limit
+        extended_page_position = PagePosition(
+            limit=limit + 1 if limit is not None else None,
+            offset=page_position.offset,
+            sort=page_position.sort,
+        )
+        rows = connection.execute(paginate(select, extended_page_position)).fetchall()
+        total_count = None
+        if total_count_mode == TotalCountMode.ESTIMATED:
+            total_count = _total_count_estimator.estimate(connection, select)
+        return Page.from_items(
+            rows,
+            page_position,
+            total_count,
+            is_total_count_estimated=total_count is not None,
+        )
+
+
+def _count(connection: Connection, select: Select) -> int:
+    count_select = select_([func.count()]).select_from(select.order_by(None).subquery())
+    return connection.execute(count_select).scalar()
+
+
+@contextlib.contextmanager
+def _connect(connectable: Union[Engine, Connection]) -> Iterator[Connection]:
+    if isinstance(connectable, Connection):
+        yield connectable
+    else:
+        with connectable.connect() as connection:
+            yield connection
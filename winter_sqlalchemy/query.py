@@ -1,15 +1,31 @@
+from typing import Any
+from typing import Sequence
+
+from sqlalchemy import and_
 from sqlalchemy import asc
 from sqlalchemy import desc
+from sqlalchemy import or_
+from sqlalchemy.sql import ColumnElement
 from sqlalchemy.sql import Select
 
+from winter.core.json import JSONDecodeException
+from winter.data.pagination import CursorDirection
+from winter.data.pagination import CursorPosition
+from winter.data.pagination import InvalidCursorException
+from winter.data.pagination import Order
 from winter.data.pagination import PagePosition
 from winter.data.pagination import Sort
 from winter.data.pagination import SortDirection
+from .columns import decode_column_value
 
 _sort_direction_map = {
     SortDirection.ASC: asc,
     SortDirection.DESC: desc,
 }
+_reversed_sort_direction_map = {
+    SortDirection.ASC: SortDirection.DESC,
+    SortDirection.DESC: SortDirection.ASC,
+}
 
 
 def paginate(select: Select, page_position: PagePosition) -> Select:
@@ -18,6 +34,55 @@ def paginate(select: Select, page_position: PagePosition) -> Select:
     return select.limit(page_position.limit).offset(page_position.offset)
 
 
+def paginate_by_cursor(select: Select, cursor_position: CursorPosition) -> Select:
+    """
+    Select items after the cursor using keyset predicates instead of an offset, so that every page is found
+    by an index as fast as the first one. The items are selected in the cursor direction with one extra item,
+    which tells whether there are more items, CursorPage.from_items turns them into a page.
+    Sort fields must be selected columns, not nullable and unique together.
+    """
+    if not cursor_position.sort:
+        raise ValueError('Cursor pagination requires sort')
+
+    sort_ = cursor_position.sort
+    cursor = cursor_position.cursor
+    if cursor is not None:
+        is_previous = cursor.direction == CursorDirection.PREVIOUS
+        try:
+            predicate = keyset_predicate(select, sort_, cursor.values, reverse=is_previous)
+        except (JSONDecodeException, TypeError):
+            # Cursors come from clients, so their values may not match the column types
+            raise InvalidCursorException(f'Invalid cursor: "{cursor.encode()}"')
+        select = select.where(predicate)
+        if is_previous:
+            sort_ = Sort(*(Order(order.field, _reversed_sort_direction_map[order.direction]) for order in sort_.orders))
+
+    select = sort(select, sort_)
+    if cursor_position.limit is not None:
+        select = select.limit(cursor_position.limit + 1)
+    return select
+
+
+def keyset_predicate(select: Select, sort: Sort, values: Sequence[Any], reverse: bool = False) -> ColumnElement:
+    """Predicate of rows going after the row with the given sort field values, or before it if reversed."""
+    columns = []
+    for order in sort.orders:
+        try:
+            columns.append(select.selected_columns[order.field])
+        except KeyError:
+            raise ValueError(f'Sort field is not selected: "{order.field}"')
+    values = [decode_column_value(column, value) for column, value in zip(columns, values)]
+
+    clauses = []
+    for index, order in enumerate(sort.orders):
+        is_ascending = (order.direction == SortDirection.ASC) != reverse
+        column, value = columns[index], values[index]
+        comparison = column > value if is_ascending else column < value
+        equalities = (columns[i] == values[i] for i in range(index))
+        clauses.append(and_(*equalities, comparison))
+    return or_(*clauses)
+
+
 def sort(select: Select, sort: Sort) -> Select:
     order_by_clauses = [_sort_direction_map[order.direction](order.field) for order in sort.orders]
     return select.order_by(*order_by_clauses)
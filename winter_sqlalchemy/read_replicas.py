@@ -0,0 +1,83 @@
+import abc
+import itertools
+import threading
+from typing import Optional
+from typing import Sequence
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.dml import UpdateBase
+
+
+class ReplicaPolicy(abc.ABC):
+    """Chooses the replica a session reads from."""
+
+    @abc.abstractmethod
+    def choose(self, engines: Sequence[Engine]) -> Engine:  # pragma: no cover
+        pass
+
+
+class RoundRobinReplicaPolicy(ReplicaPolicy):
+    def __init__(self):
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def choose(self, engines: Sequence[Engine]) -> Engine:
+        with self._lock:
+            index = next(self._counter)
+        return engines[index % len(engines)]
+
+
+class LeastConnectionsReplicaPolicy(ReplicaPolicy):
+    """
+    Chooses the replica which pool has the least connections checked out.
+    Only QueuePool counts them, replicas are chosen round-robin if any of them has another pool, e.g. NullPool.
+    """
+
+    def __init__(self):
+        self._round_robin_policy = RoundRobinReplicaPolicy()
+
+    def choose(self, engines: Sequence[Engine]) -> Engine:
+        if not all(isinstance(engine.pool, QueuePool) for engine in engines):
+            return self._round_robin_policy.choose(engines)
+        return min(engines, key=lambda engine: engine.pool.checkedout())
+
+
+class ReadReplicas:
+    """
+    Replica engines sqla_crud repositories and units of work read from, there are none by default.
+    Bind an instance in the injector to route reads, e.g. binder.bind(ReadReplicas, ReadReplicas([engine_1, engine_2])).
+    """
+
+    def __init__(self, engines: Sequence[Engine] = (), policy: Optional[ReplicaPolicy] = None):
+        self.engines = tuple(engines)
+        self._policy = policy if policy is not None else RoundRobinReplicaPolicy()
+
+    def choose(self) -> Optional[Engine]:
+        if not self.engines:
+            return None
+        return self._policy.choose(self.engines)
+
+
+class RoutingSession(Session):
+    """
+    Session bound to the primary engine which reads from one of the replicas until it writes,
+    the session sticks to the primary after the first flush, DML statement or SELECT ... FOR UPDATE
+    so that it reads its own writes.
+    """
+
+    def __init__(self, *args, read_replicas: Optional[ReadReplicas] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._read_replicas = read_replicas
+        self._replica: Optional[Engine] = None
+        self.has_written = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase) or getattr(clause, '_for_update_arg', None) is not None:
+            self.has_written = True
+        if self.has_written or self._read_replicas is None:
+            return super().get_bind(mapper, clause, **kwargs)
+        if self._replica is None:
+            self._replica = self._read_replicas.choose()
+        return self._replica or super().get_bind(mapper, clause, **kwargs)
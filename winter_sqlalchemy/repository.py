@@ -1,6 +1,13 @@
+import itertools
+import weakref
+from typing import Any
+from typing import Callable
+from typing import Dict
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import TypeVar
 
 from injector import inject
@@ -10,22 +17,64 @@ from sqlalchemy import func
 from sqlalchemy import inspect
 from sqlalchemy import select
 from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm import Session
 from sqlalchemy.orm import class_mapper
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.orm.exc import UnmappedClassError
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.sql.dml import UpdateBase
 
 from winter.core import get_injector
 from winter.data import CRUDRepository
 from winter.data.exceptions import NotFoundException
+from winter.data.pagination import Page
+from winter.data.pagination import PagePosition
+from winter.data.pagination import Sort
 from winter_ddd import AggregateRoot
 from winter_ddd import DomainEvent
 from winter_ddd import DomainEventDispatcher
+from .columns import primary_key_in
+from .derived_query import DerivedQuery
+from .derived_query import QueryKind
+from .derived_query import ResultKind
+from .derived_query import derive_query
+from .derived_query import is_derived_query_method
+from .entity_cache import EntityCache
+from .entity_cache import get_entity_state
+from .entity_cache import restore_entity
+from .identity_map import IdentityMap
+from .identity_map import IdentityMapStats
+from .identity_map import WeakValueIdentityMap
+from .query import keyset_predicate
+from .read_replicas import ReadReplicas
+from .read_replicas import RoutingSession
+from .unit_of_work import get_current_unit_of_work
 
 T = TypeVar('T')
 K = TypeVar('K')
 
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_BATCH_SIZE = 1000
 
-def sqla_crud(repository_cls):
+
+def sqla_crud(
+    repository_cls,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    identity_map_factory: Callable[[], IdentityMap] = WeakValueIdentityMap,
+    entity_cache: Optional[EntityCache] = None,
+):
+    """
+    Entities are loaded by find_all and find_all_by_id in chunks of chunk_size, one query per chunk.
+    Outside of a unit of work, loaded entities are kept in an identity map created by identity_map_factory,
+    e.g. WeakValueIdentityMap, functools.partial(LRUIdentityMap, maximum_size) or RequestScopedIdentityMap.
+    Entities loaded by id are looked up in entity_cache before querying the database if it's given,
+    entities saved or deleted by the repository are invalidated once the changes are committed,
+    changes made bypassing it are seen after the TTL.
+    Abstract methods named like find_by_status_and_created_at_gt or count_by_owner_id are implemented
+    by queries derived from their names, which may take PagePosition and Sort arguments.
+    """
     if not issubclass(repository_cls, CRUDRepository):
         raise TypeError('Repository must be inherited from CRUDRepository before annotating with sqla_crud')
 
@@ -43,109 +92,330 @@ def sqla_crud(repository_cls):
         raise TypeError('sqla_crud does not support entities mapped to multiple tables')
 
     entity_table = mapper.tables[0]
+    primary_key_columns = tuple(entity_table.primary_key.columns)
+    primary_key_sort = Sort.by(*(column.key for column in primary_key_columns))
+    # Relationships (secondary rows, nullified foreign keys, cascades) and version checks need the unit of work
+    is_bulk_deletable = not mapper.relationships and mapper.version_id_col is None
 
     class DefaultCRUDRepositoryImpl:
         """
         SQLAlchemy implementation for CRUDRepository
-        This repository implementation is not thread-safe.
+        Within a unit of work the repository uses its session, so the changes are committed together.
+        Otherwise, entities loaded or saved together share their own session
+        and this repository implementation is not thread-safe.
+        Reads go to ReadReplicas bound in the injector, if any, until a session writes.
         """
         class RepositoryException(Exception):
             pass
 
+        @property
+        def identity_map_stats(self) -> IdentityMapStats:
+            return self.__identity_map.stats
+
         def count(self) -> int:
-            return self.__engine.execute(select([func.count()]).select_from(entity_table)).scalar()
+            return self._execute(select([func.count()]).select_from(entity_table)).scalar()
 
         def delete(self, entity: T):
-            try:
-                session = self.__sessions[entity]
-            except KeyError:  # pragma: no cover
-                raise self.RepositoryException('Entity must be fetched with repository before being deleted')
-            pk = inspect(entity).identity
-            del self.__identity_map[pk]
-            session.delete(entity)
-            session.commit()
-            session.close()
-            del self.__sessions[entity]
+            self.delete_many([entity])
 
         def delete_many(self, entities: Iterable[T]):
-            for entity in entities:
-                self.delete(entity)
+            """
+            Entities are deleted with one DELETE statement per chunk of primary keys, unless the entity has
+            relationships, a version id column or before_delete/after_delete listeners,
+            then they are deleted one by one by the session.
+            """
+            unit_of_work = get_current_unit_of_work()
+            if unit_of_work is not None:
+                entities = list(entities)
+                entities_by_session = {unit_of_work.session: entities} if entities else {}
+            else:
+                entities_by_session = {}
+                for entity in entities:
+                    try:
+                        session = self.__sessions[entity]
+                    except KeyError:  # pragma: no cover
+                        raise self.RepositoryException('Entity must be fetched with repository before being deleted')
+                    entities_by_session.setdefault(session, []).append(entity)
 
-        def delete_all(self):  # pragma: no cover
-            self.__engine.execute(entity_table.delete())
-            self.__identity_map = {}
-            for session in self.__sessions.values():
+            for session, session_entities in entities_by_session.items():
+                ids = [inspect(entity).identity for entity in session_entities]
+                if is_bulk_deletable and not _has_delete_listeners(mapper):
+                    session.flush()
+                    for index in range(0, len(ids), chunk_size):
+                        chunk_ids = ids[index:index + chunk_size]
+                        session.execute(entity_table.delete().where(primary_key_in(primary_key_columns, chunk_ids)))
+                    for entity in session_entities:
+                        session.expunge(entity)
+                else:
+                    for entity in session_entities:
+                        session.delete(entity)
+                    session.flush()
+
+                if unit_of_work is None:
+                    session.commit()
+                    for entity in session_entities:
+                        self.__identity_map.remove(inspect(entity).identity)
+                        del self.__sessions[entity]
+                    if not session.identity_map:
+                        session.close()
+                self._invalidate_cache(ids)
+
+        def delete_all(self):
+            self._execute(entity_table.delete())
+            if entity_cache is not None:
+                self._after_commit(lambda: entity_cache.clear(entity_cls))
+            unit_of_work = get_current_unit_of_work()
+            if unit_of_work is not None:
+                for instance in list(unit_of_work.session.identity_map.values()):
+                    if isinstance(instance, entity_cls):
+                        unit_of_work.session.expunge(instance)
+                return
+
+            self.__identity_map.clear()
+            for session in set(self.__sessions.values()):
                 session.close()
-            self.__sessions = {}
+            self.__sessions = weakref.WeakKeyDictionary()
 
-        def delete_by_id(self, id_: K):  # pragma: no cover
+        def delete_by_id(self, id_: K):
             if not isinstance(id_, tuple):
                 id_ = (id_,)
-            if id_ in self.__identity_map:  # pragma: no cover
-                entity = self.__identity_map[id_]
+            entity = self._get_loaded(id_)
+            if entity is not None:
                 self.delete(entity)
             else:
                 expressions = (column == value for column, value in zip(entity_table.primary_key.columns, id_))
-                self.__engine.execute(entity_table.delete().where(and_(*expressions)))
+                self._execute(entity_table.delete().where(and_(*expressions)))
+                self._invalidate_cache([id_])
 
-        def exists_by_id(self, id_: K) -> bool:  # pragma: no cover
+        def exists_by_id(self, id_: K) -> bool:
             if not isinstance(id_, tuple):
                 id_ = (id_,)
-            if id_ in self.__identity_map:
+            if self._get_loaded(id_) is not None:
+                return True
+            if entity_cache is not None and entity_cache.get(entity_cls, id_) is not None:
                 return True
             expressions = (column == value for column, value in zip(entity_table.primary_key.columns, id_))
-            return self.__engine.execute(select([exists().where(and_(*expressions))])).scalar()
+            return self._execute(select([exists().where(and_(*expressions))])).scalar()
 
         def find_all(self) -> Iterable[T]:
-            ids = self.__engine.execute(select(entity_table.primary_key.columns))
-            ids = next(zip(*ids), [])
-            return self.find_all_by_id(ids)
+            result = []
+            statement = select(*primary_key_columns)
+            last_id = None
+            while True:
+                criterion = keyset_predicate(statement, primary_key_sort, last_id) if last_id is not None else None
+                entities = self._load(criterion, limit=chunk_size)
+                result.extend(entities)
+                if len(entities) < chunk_size:
+                    return result
+                last_id = inspect(entities[-1]).identity
 
         def find_all_by_id(self, ids: Iterable[K]) -> Iterable[T]:
-            result = [self.find_by_id(id_) for id_ in ids]
-            result = [entity for entity in result if entity]
-            return result
+            ids = [id_ if isinstance(id_, tuple) else (id_,) for id_ in ids]
+            entities = {id_: self._get_loaded(id_) for id_ in ids}
+            missing_ids = [id_ for id_, entity in entities.items() if entity is None]
+            for index in range(0, len(missing_ids), chunk_size):
+                for entity in self._load(primary_key_in(primary_key_columns, missing_ids[index:index + chunk_size])):
+                    entities[inspect(entity).identity] = entity
+            return [entities[id_] for id_ in ids if entities[id_] is not None]
 
-        def find_by_id(self, id_: K) -> Optional[T]:  # pragma: no cover
+        def find_by_id(self, id_: K) -> Optional[T]:
             if not isinstance(id_, tuple):
                 id_ = (id_,)
-            if id_ in self.__identity_map:
-                return self.__identity_map[id_]
+            unit_of_work = get_current_unit_of_work()
+            if unit_of_work is not None:
+                entity = self._get_loaded(id_)
+                return entity if entity is not None else self._load_by_id(unit_of_work.session, id_)
+
+            entity = self.__identity_map.get(id_)
+            if entity is not None:
+                return entity
 
             session = self.__session_factory()
-            instance = session.query(entity_cls).get(id_)
+            instance = self._load_by_id(session, id_)
             if instance is None:
                 return None
 
-            self.__identity_map[id_] = instance
+            self.__identity_map.add(id_, instance)
             self.__sessions[instance] = session
             return instance
 
-        def get_by_id(self, id_: K) -> T:  # pragma: no cover
+        def get_by_id(self, id_: K) -> T:
             entity = self.find_by_id(id_)
             if entity is None:
                 raise NotFoundException(id_, entity_cls)
             return entity
 
+        def stream_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[T]:
+            """
+            Entities are fetched with a server-side cursor where the database supports it, batch_size rows at a time.
+            The cursor has its own session, so that streaming may go on after the unit of work has ended,
+            e.g. when the response is sent, and it doesn't see changes which aren't committed yet.
+            Outside of a unit of work every batch gets its own session, within a unit of work entities are detached,
+            the repository doesn't keep references to streamed entities unless its identity map does,
+            so entities are released once the caller drops them.
+            API methods may return the iterator (e.g. mapped to DTOs by a generator) to stream it to the response.
+            """
+            is_in_unit_of_work = get_current_unit_of_work() is not None
+            session = self.__session_factory()
+            query = session.query(entity_cls).order_by(*primary_key_columns).yield_per(batch_size)
+            instances = iter(query)
+            try:
+                while True:
+                    batch = list(itertools.islice(instances, batch_size))
+                    if not batch:
+                        return
+                    for instance in batch:
+                        session.expunge(instance)
+                    if not is_in_unit_of_work:
+                        batch = self._register_loaded(self.__session_factory(), batch)
+                    yield from batch
+                    del batch
+            finally:
+                instances.close()
+                session.close()
+
         def save(self, entity: T) -> T:
-            self._save(entity)
-            self._process_domain_events([entity])
+            self.save_many([entity])
             return entity
 
         def save_many(self, entities: Iterable[T]) -> Iterable[T]:
+            """
+            Entities are flushed at once by the session they belong to, so that the session batches INSERT
+            and UPDATE statements per table with executemany. Outside of a unit of work the session commits them.
+            Domain events are dispatched once for all entities.
+            """
             entities = list(entities)
-            for entity in entities:
-                self._save(entity)
+            unit_of_work = get_current_unit_of_work()
+            if unit_of_work is not None:
+                unit_of_work.session.add_all(entities)
+                unit_of_work.session.flush()
+            else:
+                new_entities_session = None
+                sessions = []
+                for entity in entities:
+                    session = self.__sessions.get(entity)
+                    if session is None:
+                        if new_entities_session is None:
+                            new_entities_session = self.__session_factory()
+                        session = new_entities_session
+                        session.add(entity)
+                        self.__sessions[entity] = session
+                    sessions.append(session)
+                for session in dict.fromkeys(sessions):
+                    # The changes are committed right away, so that sessions don't keep transactions
+                    # and connections open until their entities are released
+                    session.commit()
+                for entity in entities:
+                    self.__identity_map.add(inspect(entity).identity, entity)
+            self._invalidate_cache([inspect(entity).identity for entity in entities])
             self._process_domain_events(entities)
             return entities
 
-        def _save(self, entity: T):
-            if entity not in self.__sessions:
-                self.__sessions[entity] = self.__session_factory()
-                self.__sessions[entity].add(entity)
-            self.__sessions[entity].flush()
-            pk = inspect(entity).identity
-            self.__identity_map[pk] = entity
+        def _execute(self, statement, parameters: Optional[Dict[str, Any]] = None):
+            # Statements see the changes flushed within the current unit of work
+            parameters = parameters or {}
+            unit_of_work = get_current_unit_of_work()
+            if unit_of_work is not None:
+                return unit_of_work.session.execute(statement, parameters)
+            if not isinstance(statement, UpdateBase):
+                replica = self.__read_replicas.choose()
+                if replica is not None:
+                    return replica.execute(statement, parameters)
+            return self.__engine.execute(statement, parameters)
+
+        def _execute_derived_query(self, query: DerivedQuery, args: Tuple, kwargs: Dict[str, Any]):
+            parameters, page_position = query.bind_arguments(args, kwargs)
+            if query.kind == QueryKind.COUNT:
+                return self._execute(query.statement, parameters).scalar()
+            if query.kind == QueryKind.EXISTS:
+                return bool(self._execute(query.statement, parameters).scalar())
+
+            statement = query.get_statement(page_position)
+            if query.projection is not None:
+                # Projected rows bypass the session, so they are neither tracked nor checked for changes
+                items = [query.projection(**row._mapping) for row in self._execute(statement, parameters)]
+            else:
+                items = self._load_statement(statement, parameters)
+            if query.result_kind == ResultKind.ONE:
+                return items[0] if items else None
+            if query.result_kind == ResultKind.PAGE:
+                total_count = self._execute(query.count_statement, parameters).scalar()
+                return Page(total_count, items, page_position or PagePosition())
+            return items
+
+        def _get_loaded(self, id_: Tuple) -> Optional[T]:
+            unit_of_work = get_current_unit_of_work()
+            if unit_of_work is not None:
+                return unit_of_work.session.identity_map.get(identity_key(entity_cls, id_))
+            return self.__identity_map.get(id_)
+
+        def _load_by_id(self, session: Session, id_: Tuple) -> Optional[T]:
+            if entity_cache is None:
+                return session.get(entity_cls, id_)
+
+            state = entity_cache.get(entity_cls, id_)
+            if state is not None:
+                return restore_entity(session, entity_cls, state)
+
+            instance = session.get(entity_cls, id_)
+            # Changes flushed within a unit of work aren't committed yet, so they aren't cached
+            if instance is not None and get_current_unit_of_work() is None:
+                entity_cache.set(entity_cls, id_, get_entity_state(instance))
+            return instance
+
+        def _invalidate_cache(self, ids: Iterable[Tuple]):
+            if entity_cache is not None:
+                ids = list(ids)
+                self._after_commit(lambda: self._evict_from_cache(ids))
+
+        def _evict_from_cache(self, ids: List[Tuple]):
+            for id_ in ids:
+                entity_cache.delete(entity_cls, id_)
+
+        def _after_commit(self, callback: Callable[[], None]):
+            # Cached entities are evicted after the commit, otherwise readers could cache them again before it
+            unit_of_work = get_current_unit_of_work()
+            if unit_of_work is not None:
+                unit_of_work.on_commit(callback)
+            else:
+                callback()
+
+        def _load(self, criterion, limit: Optional[int] = None) -> List[T]:
+            statement = select(entity_cls)
+            if criterion is not None:
+                statement = statement.where(criterion)
+            if limit is not None:
+                statement = statement.order_by(*primary_key_columns).limit(limit)
+            return self._load_statement(statement)
+
+        def _load_statement(self, statement, parameters: Optional[Dict[str, Any]] = None) -> List[T]:
+            unit_of_work = get_current_unit_of_work()
+            session = unit_of_work.session if unit_of_work is not None else self.__session_factory()
+            instances = session.execute(statement, parameters or {}).scalars().all()
+            if unit_of_work is not None:
+                return instances
+            return self._register_loaded(session, instances)
+
+        def _register_loaded(self, session: Session, instances: List[T]) -> List[T]:
+            # Entities loaded together share the session, so that they are saved and deleted together as well,
+            # entities which are already in the identity map are kept instead of the loaded ones
+            entities = []
+            for instance in instances:
+                pk = inspect(instance).identity
+                entity = self.__identity_map.get(pk)
+                if entity is not None:
+                    if instance in session:
+                        session.expunge(instance)
+                    entities.append(entity)
+                else:
+                    if instance not in session:
+                        session.add(instance)
+                    self.__identity_map.add(pk, instance)
+                    self.__sessions[instance] = session
+                    entities.append(instance)
+            if not session.identity_map:
+                session.close()
+            return entities
 
         def _process_domain_events(self, aggregates: Iterable[AggregateRoot]):
             domain_events: List[DomainEvent] = []
@@ -155,15 +425,29 @@ def sqla_crud(repository_cls):
             self.__domain_event_dispatcher.dispatch(domain_events)
 
         @inject
-        def __init__(self, engine: Engine, domain_event_dispatcher: DomainEventDispatcher):
+        def __init__(
+            self,
+            engine: Engine,
+            domain_event_dispatcher: DomainEventDispatcher,
+            read_replicas: ReadReplicas,
+        ):
             self.__engine = engine
-            self.__session_factory = sessionmaker(bind=self.__engine)
-            self.__identity_map = {}
-            self.__sessions = {}
+            self.__read_replicas = read_replicas
+            self.__session_factory = sessionmaker(
+                bind=self.__engine,
+                class_=RoutingSession,
+                read_replicas=read_replicas,
+                expire_on_commit=False,
+            )
+            self.__identity_map = identity_map_factory()
+            self.__sessions = weakref.WeakKeyDictionary()
             self.__domain_event_dispatcher = domain_event_dispatcher
 
     repository_subclasses = repository_cls.__subclasses__()
 
+    for name, derived_query in _derive_queries(repository_cls, repository_subclasses, mapper).items():
+        setattr(DefaultCRUDRepositoryImpl, name, _create_derived_query_method(name, derived_query))
+
     class RepositoryImpl(DefaultCRUDRepositoryImpl, *repository_subclasses):
         @inject
         def __init__(self):
@@ -173,3 +457,31 @@ def sqla_crud(repository_cls):
                 injector.call_with_injection(subclass.__init__, self)
 
     return RepositoryImpl
+
+
+def _derive_queries(repository_cls, repository_subclasses, mapper: Mapper) -> Dict[str, DerivedQuery]:
+    """Queries of abstract methods named like find_by_..., count_by_... or exists_by_... which aren't implemented."""
+    implemented_names = {name for subclass in repository_subclasses for name in vars(subclass)}
+    derived_queries = {}
+    for cls in repository_cls.__mro__:
+        if cls in CRUDRepository.__mro__:
+            continue
+        for name, member in vars(cls).items():
+            if name in derived_queries or name in implemented_names or not is_derived_query_method(name):
+                continue
+            if getattr(member, '__isabstractmethod__', False):
+                derived_queries[name] = derive_query(member, mapper)
+    return derived_queries
+
+
+def _create_derived_query_method(name: str, derived_query: DerivedQuery) -> Callable:
+    def derived_query_method(self, *args, **kwargs):
+        return self._execute_derived_query(derived_query, args, kwargs)
+
+    derived_query_method.__name__ = name
+    return derived_query_method
+
+
+def _has_delete_listeners(mapper: Mapper) -> bool:
+    # Listeners may be added after the repository is created, including ones of all mappers
+    return bool(mapper.dispatch.before_delete or mapper.dispatch.after_delete)
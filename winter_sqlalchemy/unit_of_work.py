@@ -0,0 +1,115 @@
+import contextlib
+from contextvars import ContextVar
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from django.http import HttpRequest
+from injector import inject
+from sqlalchemy.engine import Engine
+
+from winter.core import get_injector
+from winter.web import Interceptor
+from .read_replicas import ReadReplicas
+from .read_replicas import RoutingSession
+
+
+class UnitOfWork:
+    """
+    One session shared by sqla_crud repositories within a scope, the changes are committed at once
+    as a single transaction when the scope ends successfully and are rolled back otherwise.
+    The session reads from ReadReplicas bound in the injector, if any, until it writes.
+    """
+
+    @inject
+    def __init__(self, engine: Engine, read_replicas: ReadReplicas):
+        self.session = RoutingSession(bind=engine, read_replicas=read_replicas)
+        self._depth = 0
+        self._commit_callbacks: List[Callable[[], None]] = []
+
+    def on_commit(self, callback: Callable[[], None]):
+        """Call the callback after the changes are committed, e.g. to invalidate caches, it's dropped on rollback."""
+        self._commit_callbacks.append(callback)
+
+    def commit(self):
+        self.session.commit()
+        commit_callbacks, self._commit_callbacks = self._commit_callbacks, []
+        for callback in commit_callbacks:
+            callback()
+
+    def rollback(self):
+        self._commit_callbacks = []
+        self.session.rollback()
+
+    def close(self):
+        self.session.close()
+
+
+_REQUEST_ATTRIBUTE = '_winter_unit_of_work'
+
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar('current_unit_of_work', default=None)
+
+
+def get_current_unit_of_work() -> Optional[UnitOfWork]:
+    return _current_unit_of_work.get()
+
+
+def begin_unit_of_work() -> UnitOfWork:
+    """Start a unit of work created by the injector, a nested scope joins the current unit of work."""
+    unit_of_work = _current_unit_of_work.get()
+    if unit_of_work is None:
+        unit_of_work = get_injector().get(UnitOfWork)
+        _current_unit_of_work.set(unit_of_work)
+    unit_of_work._depth += 1
+    return unit_of_work
+
+
+def end_unit_of_work(exception: Optional[BaseException] = None):
+    """End the current scope, the outermost scope commits or rolls back the unit of work and closes it."""
+    unit_of_work = _current_unit_of_work.get()
+    if unit_of_work is None:
+        raise RuntimeError('There is no unit of work in progress')
+    unit_of_work._depth -= 1
+    if unit_of_work._depth > 0:
+        return
+    _current_unit_of_work.set(None)
+    try:
+        if exception is None:
+            unit_of_work.commit()
+        else:
+            unit_of_work.rollback()
+    finally:
+        unit_of_work.close()
+
+
+@contextlib.contextmanager
+def unit_of_work_scope() -> Iterator[UnitOfWork]:
+    current_unit_of_work = begin_unit_of_work()
+    try:
+        yield current_unit_of_work
+    except BaseException as exception:
+        end_unit_of_work(exception)
+        raise
+    end_unit_of_work()
+
+
+class UnitOfWorkInterceptor(Interceptor):
+    """
+    Runs every request in a unit of work. The changes are flushed after the API method returns the result,
+    so that database errors are handled as usual, and are committed when the response is ready.
+    They are rolled back if an exception is raised. Streamed items are produced after the unit of work has ended.
+    """
+
+    def pre_handle(self, request: HttpRequest):
+        setattr(request, _REQUEST_ATTRIBUTE, begin_unit_of_work())
+
+    def post_handle(self, request: HttpRequest):
+        # The API method is called only if pre_handle has begun the unit of work
+        getattr(request, _REQUEST_ATTRIBUTE).session.flush()
+
+    def after_completion(self, request: HttpRequest, exception: Optional[Exception]):
+        # The unit of work isn't started if the request failed before pre_handle, e.g. due to throttling
+        if getattr(request, _REQUEST_ATTRIBUTE, None) is not None:
+            delattr(request, _REQUEST_ATTRIBUTE)
+            end_unit_of_work(exception)